@@ -2,78 +2,43 @@
 Dados de benchmark - 50 execuções por combinação
 Gerado automaticamente pelos programas C, Java e Go
 """
+import json
+from pathlib import Path
+
+# Os valores ficam em benchmarks.json, a mesma base usada pelo engine
+CAMINHO_BENCHMARKS = Path(__file__).parent / "benchmarks.json"
+
+with open(CAMINHO_BENCHMARKS, encoding="utf-8") as arquivo:
+    MEDIDAS = json.load(arquivo)["medidas"]
+
+
+def carregar_linguagem(linguagem):
+    """
+    Monta os dados de uma linguagem no formato {algoritmo: {tamanho: dados}}
+    a partir das medidas de benchmarks.json
+    """
+    dados = {}
+    for medida in MEDIDAS:
+        if medida["linguagem"] != linguagem:
+            continue
+        valores = {
+            "tempo": medida["tempo"],
+            "cpu": medida["cpu"],
+            "energia": medida["energia"],
+            "co2": medida["co2"],
+        }
+        dados.setdefault(medida["algoritmo"], {})[medida["tamanho"]] = valores
+    return dados
+
 
 # ==== DADOS DE BENCHMARK C ====
-BENCHMARKS_C = {
-    "merge": {
-        1000: {"tempo": 0.000181, "cpu": 60.00, "energia": 0.00002, "co2": 0.0000},
-        10000: {"tempo": 0.002448, "cpu": 87.48, "energia": 0.000039, "co2": 0.0000},
-        100000: {"tempo": 0.025123, "cpu": 98.78, "energia": 0.000448, "co2": 0.0001}
-    },
-    "quick": {
-        1000: {"tempo": 0.000099, "cpu": 53.60, "energia": 0.00001, "co2": 0.0000},
-        10000: {"tempo": 0.000974, "cpu": 83.19, "energia": 0.000015, "co2": 0.0000},
-        100000: {"tempo": 0.008952, "cpu": 96.50, "energia": 0.000156, "co2": 0.0000}
-    },
-    "bubble": {
-        1000: {"tempo": 0.001254, "cpu": 88.28, "energia": 0.000020, "co2": 0.0000},
-        10000: {"tempo": 0.175015, "cpu": 99.86, "energia": 0.003155, "co2": 0.0007},
-        100000: {"tempo": 14.567331, "cpu": 100.00, "energia": 0.263017, "co2": 0.0613}
-    },
-    "insertion": {
-        1000: {"tempo": 0.000142, "cpu": 57.00, "energia": 0.00001, "co2": 0.0000},
-        10000: {"tempo": 0.014661, "cpu": 98.65, "energia": 0.000261, "co2": 0.0001},
-        100000: {"tempo": 1.486456, "cpu": 99.98, "energia": 0.026834, "co2": 0.0063}
-    }
-}
+BENCHMARKS_C = carregar_linguagem("c")
 
 # ==== DADOS DE BENCHMARK JAVA ====
-BENCHMARKS_JAVA = {
-    "merge": {
-        1000: {"tempo": 0.000120, "cpu": 18.23, "energia": 0.0000, "co2": 0.0000},
-        10000: {"tempo": 0.000967, "cpu": 16.87, "energia": 0.00003, "co2": 0.0000},
-        100000: {"tempo": 0.012376, "cpu": 15.58, "energia": 0.000035, "co2": 0.0000}
-    },
-    "quick": {
-        1000: {"tempo": 0.000062, "cpu": 16.49, "energia": 0.0000, "co2": 0.0000},
-        10000: {"tempo": 0.000605, "cpu": 17.42, "energia": 0.00002, "co2": 0.0000},
-        100000: {"tempo": 0.007027, "cpu": 16.18, "energia": 0.000021, "co2": 0.0000}
-    },
-    "bubble": {
-        1000: {"tempo": 0.001039, "cpu": 16.85, "energia": 0.00003, "co2": 0.0000},
-        10000: {"tempo": 0.142538, "cpu": 15.89, "energia": 0.000408, "co2": 0.0001},
-        100000: {"tempo": 16.310651, "cpu": 15.50, "energia": 0.045614, "co2": 0.0106}
-    },
-    "insertion": {
-        1000: {"tempo": 0.000181, "cpu": 16.06, "energia": 0.00001, "co2": 0.0000},
-        10000: {"tempo": 0.007635, "cpu": 15.66, "energia": 0.000022, "co2": 0.0000},
-        100000: {"tempo": 0.855350, "cpu": 15.49, "energia": 0.002391, "co2": 0.0006}
-    }
-}
+BENCHMARKS_JAVA = carregar_linguagem("java")
 
 # ==== DADOS DE BENCHMARK GO ====
-BENCHMARKS_GO = {
-    "merge": {
-        1000: {"tempo": 0.000098, "cpu": 40.50, "energia": 0.00001, "co2": 0.0000},
-        10000: {"tempo": 0.001292, "cpu": 54.00, "energia": 0.000013, "co2": 0.0000},
-        100000: {"tempo": 0.016760, "cpu": 67.50, "energia": 0.000204, "co2": 0.0000}
-    },
-    "quick": {
-        1000: {"tempo": 0.000061, "cpu": 40.50, "energia": 0.0000, "co2": 0.0000},
-        10000: {"tempo": 0.000559, "cpu": 54.00, "energia": 0.00005, "co2": 0.0000},
-        100000: {"tempo": 0.007117, "cpu": 67.50, "energia": 0.000087, "co2": 0.0000}
-    },
-    "bubble": {
-        1000: {"tempo": 0.000790, "cpu": 49.50, "energia": 0.00007, "co2": 0.0000},
-        10000: {"tempo": 0.111852, "cpu": 66.00, "energia": 0.001333, "co2": 0.0003},
-        100000: {"tempo": 15.387725, "cpu": 82.50, "energia": 0.229213, "co2": 0.0534}
-    },
-    "insertion": {
-        1000: {"tempo": 0.000091, "cpu": 49.50, "energia": 0.00001, "co2": 0.0000},
-        10000: {"tempo": 0.017150, "cpu": 66.00, "energia": 0.000204, "co2": 0.0000},
-        100000: {"tempo": 1.724546, "cpu": 82.50, "energia": 0.025689, "co2": 0.0060}
-    }
-}
+BENCHMARKS_GO = carregar_linguagem("go")
 
 
 def obter_benchmark(linguagem, algoritmo, tamanho):
@@ -0,0 +1,278 @@
+"""
+Execucao em lote, sem o menu interativo
+Mede uma matriz de algoritmos x tamanhos x distribuicoes e grava cada
+resultado (JSONL ou CSV, com ou sem gzip) assim que ele fica pronto, ou
+em blocos em um formato colunar (Parquet ou npz)
+
+Uso:
+    python -m engine listar
+    python -m engine executar --tamanhos 1000 10000 --saida resultados.jsonl
+    python -m engine executar --tamanhos 1000 --banco
+    python -m engine executar --tamanhos 1000 10000 --saida matriz.csv.gz --acrescentar
+
+Codigos de saida: 0 se todas as medicoes terminaram, 1 se alguma foi
+interrompida ou falhou, 2 para argumentos invalidos e 130 se o usuario
+interromper (Ctrl+C). Rich, matplotlib e Ollama nao sao carregados
+"""
+import argparse
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent))
+
+from catalogo import BACKENDS, procurar_algoritmo
+from agendador import executar_matriz
+from exportador import EXTENSOES, FORMATOS_TEXTO, TAMANHO_BLOCO, escolher_formato
+from exportador import abrir_exportacao, escrever_resultados, fechar_exportacao
+from gerador_listas import gerar_lista, gerar_semente, DISTRIBUICOES
+from pool_medicao import criar_pool, fechar_pool
+from banco_resultados import abrir_banco, iniciar_execucao, gravar_resultados, gravar_agregado
+from agregador import agregar
+
+
+def criar_parser():
+    """
+    Cria o parser dos argumentos de linha de comando
+    """
+    parser = argparse.ArgumentParser(
+        prog="python -m engine",
+        description="Mede algoritmos de ordenacao em lote, sem o menu interativo",
+    )
+    comandos = parser.add_subparsers(dest="comando", required=True)
+    
+    comandos.add_parser("listar", help="lista os algoritmos de cada backend")
+    
+    executar = comandos.add_parser("executar", help="mede uma matriz de algoritmos, tamanhos e distribuicoes")
+    executar.add_argument("-a", "--algoritmos", nargs="+", metavar="NOME",
+                          help="algoritmos medidos, pelo nome (padrao: todos do backend)")
+    executar.add_argument("-b", "--backend", choices=["python", "numpy", "ambos"], default="python")
+    executar.add_argument("-t", "--tamanhos", nargs="+", type=int, required=True, metavar="N")
+    executar.add_argument("-d", "--distribuicoes", nargs="+", choices=DISTRIBUICOES, default=["aleatoria"],
+                          metavar="DISTRIBUICAO", help=f"uma ou mais de: {', '.join(DISTRIBUICOES)}")
+    executar.add_argument("-r", "--repeticoes", type=int, default=5)
+    executar.add_argument("--aquecimento", type=int, default=1)
+    executar.add_argument("-s", "--semente", type=int, help="semente das listas (padrao: sorteada)")
+    executar.add_argument("-o", "--saida", default="-", help="arquivo de saida (padrao: - para a saida padrao)")
+    executar.add_argument("-f", "--formato", choices=list(EXTENSOES) + ["colunar"],
+                          help="formato da saida (padrao: pela extensao do arquivo, ou jsonl); "
+                               "colunar = parquet com o pyarrow instalado, senao npz")
+    executar.add_argument("--acrescentar", action="store_true",
+                          help="grava no fim do arquivo de saida, com as colunas dele, em vez de substituir")
+    executar.add_argument("--banco", nargs="?", const="", metavar="ARQUIVO",
+                          help="grava tambem cada resultado no banco SQLite de resultados "
+                               "(padrao: o mesmo do menu, resultados.db)")
+    executar.add_argument("--limite-tempo", type=float, default=60, help="segundos por execucao (0 = sem limite)")
+    executar.add_argument("--limite-memoria-mb", type=float, default=0, help="MB por execucao (0 = sem limite)")
+    executar.add_argument("--duracao-minima-ms", type=float, default=100,
+                          help="duracao minima de cada medicao (0 = uma chamada por medicao)")
+    executar.add_argument("--intervalo-amostragem-ms", type=float, default=10,
+                          help="intervalo entre as amostras de CPU (0 = sem amostragem)")
+    executar.add_argument("--medir-memoria", action="store_true", help="mede pico de memoria e alocacoes")
+    executar.add_argument("--contar-operacoes", action="store_true", help="conta comparacoes e escritas")
+    executar.add_argument("--ensaios", type=int, default=1,
+                          help="medicoes independentes de cada algoritmo e tamanho, cada uma com as repeticoes")
+    executar.add_argument("-j", "--trabalhadores", type=int, default=1,
+                          help="processos de medicao em paralelo, cada um fixo em um nucleo")
+    executar.add_argument("--reservar-nucleos", type=int, default=1,
+                          help="nucleos deixados fora do pool, para o sistema e este processo")
+    executar.add_argument("--sem-pool", action="store_true", help="mede no proprio processo, sem o pool")
+    
+    return parser
+
+
+def listar():
+    """
+    Mostra os algoritmos de cada backend
+    """
+    for backend, algoritmos in BACKENDS.items():
+        print(f"{backend}:")
+        for nome, funcao in algoritmos:
+            print(f"  {nome}")
+    return 0
+
+
+def montar_matriz(parser, argumentos, semente):
+    """
+    Monta as celulas da matriz (distribuicoes x tamanhos x algoritmos x
+    ensaios). executar_matriz mede as mais demoradas primeiro, com ou
+    sem pool, e os resultados saem na ordem em que terminam. Cada lista
+    e gerada uma vez e usada por todas as celulas dela. O Bogosort so
+    entra ate 10 elementos
+    """
+    backends = ["python", "numpy"] if argumentos.backend == "ambos" else [argumentos.backend]
+    
+    algoritmos = []
+    for backend in backends:
+        if argumentos.algoritmos is None:
+            for nome, funcao in BACKENDS[backend]:
+                algoritmos.append((backend, nome, funcao))
+            continue
+        for nome in argumentos.algoritmos:
+            encontrado = procurar_algoritmo(nome, backend)
+            if encontrado is None:
+                parser.error(f"algoritmo desconhecido no backend {backend}: {nome} (veja python -m engine listar)")
+            algoritmos.append((backend, encontrado[0], encontrado[1]))
+    
+    for tamanho in argumentos.tamanhos:
+        if tamanho < 1:
+            parser.error(f"tamanho invalido: {tamanho}")
+    if argumentos.ensaios < 1:
+        parser.error("o numero de ensaios deve ser pelo menos 1")
+    if argumentos.trabalhadores < 1:
+        parser.error("o numero de processos deve ser pelo menos 1")
+    
+    celulas = []
+    for distribuicao in argumentos.distribuicoes:
+        for tamanho in argumentos.tamanhos:
+            lista = gerar_lista(tamanho, distribuicao, semente)
+            for backend, nome, funcao in algoritmos:
+                if nome.startswith("Bogosort") and tamanho > 10:
+                    print(f"{nome} n={tamanho} {distribuicao}: pulado (Bogosort so ate 10 elementos)", file=sys.stderr)
+                    continue
+                for ensaio in range(1, argumentos.ensaios + 1):
+                    celulas.append({
+                        "nome": nome,
+                        "funcao": funcao,
+                        "lista": lista,
+                        "backend": backend,
+                        "semente": semente,
+                        "distribuicao": distribuicao,
+                        "ensaio": ensaio,
+                    })
+    return celulas
+
+
+def opcoes_medicao(argumentos):
+    """
+    Converte os argumentos nas opcoes de medir_algoritmo
+    (0 nos limites, na duracao minima e no intervalo significa desligado)
+    """
+    opcoes = {
+        "medir_memoria": argumentos.medir_memoria,
+        "contar": argumentos.contar_operacoes,
+        "alta_resolucao": True,
+    }
+    if argumentos.limite_tempo > 0:
+        opcoes["limite_tempo"] = argumentos.limite_tempo
+    if argumentos.limite_memoria_mb > 0:
+        opcoes["limite_memoria_mb"] = argumentos.limite_memoria_mb
+    if argumentos.duracao_minima_ms > 0:
+        opcoes["duracao_minima"] = argumentos.duracao_minima_ms / 1000
+    if argumentos.intervalo_amostragem_ms > 0:
+        opcoes["intervalo_amostragem"] = argumentos.intervalo_amostragem_ms / 1000
+    return opcoes
+
+
+def executar(parser, argumentos):
+    """
+    Mede a matriz inteira, gravando cada resultado assim que termina
+    e o progresso na saida de erros
+    
+    Com --trabalhadores maior que 1 as celulas sao medidas em paralelo,
+    das mais demoradas para as mais rapidas (veja agendador.py), e os
+    resultados saem na ordem em que terminam
+    
+    Retorna:
+        Codigo de saida (0 se todas as medicoes terminaram, 1 se nao)
+    """
+    semente = argumentos.semente
+    if semente is None:
+        semente = gerar_semente()
+    
+    celulas = montar_matriz(parser, argumentos, semente)
+    opcoes = opcoes_medicao(argumentos)
+    print(f"Semente: {semente} | {len(celulas)} medicoes", file=sys.stderr)
+    
+    # Os formatos de texto gravam cada resultado assim que ele chega;
+    # os colunares, em blocos
+    formato = escolher_formato(argumentos.saida, argumentos.formato, padrao="jsonl")
+    bloco = 1 if formato in FORMATOS_TEXTO else TAMANHO_BLOCO
+    try:
+        exportacao = abrir_exportacao(argumentos.saida, formato, acrescentar=argumentos.acrescentar,
+                                      tamanho_bloco=bloco)
+    except (ValueError, OSError) as erro:
+        parser.error(str(erro))
+    if exportacao["arquivo"] != argumentos.saida:
+        print(f"pyarrow nao instalado: gravando em {exportacao['arquivo']} (npz)", file=sys.stderr)
+    
+    # O banco recebe cada resultado, como a saida, em uma execucao nova,
+    # e no fim o agregador de estatisticas dela
+    banco = None
+    run_id = None
+    agregador = {}
+    if argumentos.banco is not None:
+        banco = abrir_banco(argumentos.banco or None)
+        run_id = iniciar_execucao(banco, origem="lote")
+        print(f"Banco: execucao {run_id}", file=sys.stderr)
+    
+    pool = None
+    if not argumentos.sem_pool:
+        pool = criar_pool(argumentos.trabalhadores, reservados=argumentos.reservar_nucleos)
+    falhas = [0]
+
+    def gravar(celula, resultado, medicao, progresso):
+        descricao = f"[{progresso['concluidas']}/{progresso['total']} {progresso['decorrido']:.0f}s] " \
+                    f"{celula['nome']} n={len(celula['lista'])} {celula['distribuicao']}"
+        if argumentos.ensaios > 1:
+            descricao = f"{descricao} ensaio {celula['ensaio']}"
+        
+        if resultado is None:
+            resultado = {
+                "algoritmo": celula["nome"],
+                "backend": celula["backend"],
+                "tamanho": len(celula["lista"]),
+                "distribuicao": celula["distribuicao"],
+                "semente": celula["semente"],
+                "status": "erro",
+                "erro": medicao["erro"],
+            }
+            print(f"{descricao}: erro ({medicao['erro']})", file=sys.stderr)
+        else:
+            print(f"{descricao}: {resultado['tempo']:.6f}s {resultado['status']}", file=sys.stderr)
+        resultado["ensaio"] = celula["ensaio"]
+        
+        if resultado["status"] != "ok":
+            falhas[0] = falhas[0] + 1
+        
+        escrever_resultados(exportacao, [resultado])
+        if banco is not None:
+            gravar_resultados(banco, run_id, [resultado])
+            agregar(agregador, resultado)
+    
+    try:
+        executar_matriz(celulas, pool, gravar, argumentos.repeticoes, argumentos.aquecimento, **opcoes)
+    finally:
+        if pool is not None:
+            fechar_pool(pool)
+        fechar_exportacao(exportacao)
+        if banco is not None:
+            gravar_agregado(banco, run_id, agregador)
+            banco.close()
+    
+    if falhas[0] > 0:
+        print(f"{falhas[0]} medicoes interrompidas ou com erro", file=sys.stderr)
+        return 1
+    return 0
+
+
+def main(argv=None):
+    """
+    Ponto de entrada de python -m engine
+    
+    Retorna:
+        Codigo de saida
+    """
+    parser = criar_parser()
+    argumentos = parser.parse_args(argv)
+    
+    try:
+        if argumentos.comando == "listar":
+            return listar()
+        return executar(parser, argumentos)
+    except KeyboardInterrupt:
+        print("Interrompido pelo usuario", file=sys.stderr)
+        return 130
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,136 @@
+"""
+Modulo do agendador de medicoes
+Distribui as celulas independentes de uma matriz de medicoes
+(algoritmo x tamanho x ensaio) entre os processos do pool de medicao,
+das mais demoradas para as mais rapidas
+"""
+import math
+import queue
+import threading
+import time
+
+from catalogo import COMPLEXIDADES
+from complexidade import MODELOS
+from execucao import medir_algoritmo
+
+
+def custo_previsto(nome, tamanho):
+    """
+    Custo relativo previsto para medir um algoritmo em um tamanho,
+    pela ordem de complexidade do catalogo (n, n log n, n² ou n!)
+    
+    So serve para comparar celulas entre si: o coeficiente de cada
+    algoritmo nao e conhecido antes de medir
+    """
+    modelo = COMPLEXIDADES.get(nome, "n log n")
+    if modelo == "n!":
+        return math.factorial(min(tamanho, 20)) * tamanho
+    return MODELOS[modelo](max(tamanho, 2))
+
+
+def ordem_de_execucao(celulas):
+    """
+    Indices das celulas da mais demorada para a mais rapida (pelo
+    custo_previsto). Com os processos pegando a proxima celula assim
+    que terminam a anterior, as longas nao ficam para o fim, quando
+    os outros processos ja estariam parados
+    """
+    return sorted(range(len(celulas)),
+                  key=lambda i: custo_previsto(celulas[i]["nome"], len(celulas[i]["lista"])),
+                  reverse=True)
+
+
+def executar_matriz(celulas, pool=None, ao_concluir=None, repeticoes=5, aquecimento=1, **opcoes):
+    """
+    Mede todas as celulas de uma matriz, em paralelo nos processos do pool
+    
+    Cada processo do pool recebe uma thread que pega a proxima celula
+    da fila (na ordem de ordem_de_execucao) e espera a medicao dela. Os
+    resultados sao entregues na thread que chamou, na ordem em que
+    terminam. Sem pool as celulas sao medidas uma de cada vez, neste
+    processo
+    
+    Com mais de um processo as medicoes disputam cache, memoria e a
+    energia do pacote: a energia RAPL de uma celula inclui a das que
+    rodaram junto (veja medidor_energia.py). Use nucleos reservados
+    (criar_pool) para afastar as medicoes do programa principal
+    
+    Parametros:
+        celulas: Lista de dicionarios com nome, funcao, lista, backend,
+            semente e distribuicao (e quaisquer outras chaves, que sao
+            devolvidas junto)
+        pool: Pool criado com criar_pool (None = sem pool, em sequencia)
+        ao_concluir: Funcao chamada a cada celula concluida com
+            (celula, resultado, medicao, progresso), onde progresso e um
+            dicionario com concluidas, total e decorrido (segundos)
+        repeticoes: Numero de execucoes medidas de cada celula
+        aquecimento: Numero de execucoes descartadas antes
+        **opcoes: Opcoes de medir_algoritmo
+    
+    Retorna:
+        Lista de tuplas (celula, resultado, medicao), na ordem das celulas
+    """
+    ordem = ordem_de_execucao(celulas)
+    progresso = {"concluidas": 0, "total": len(celulas), "decorrido": 0.0}
+    inicio = time.perf_counter()
+    concluidas = {}
+
+    def concluir(indice, resultado, medicao):
+        concluidas[indice] = (celulas[indice], resultado, medicao)
+        progresso["concluidas"] = progresso["concluidas"] + 1
+        progresso["decorrido"] = time.perf_counter() - inicio
+        if ao_concluir is not None:
+            ao_concluir(celulas[indice], resultado, medicao, dict(progresso))
+    
+    if pool is None:
+        for indice in ordem:
+            concluir(indice, *medir_celula(celulas[indice], None, None, repeticoes, aquecimento, opcoes))
+    else:
+        pendentes = queue.Queue()
+        for indice in ordem:
+            pendentes.put(indice)
+        prontas = queue.Queue()
+        
+        # Threads daemon: se o usuario interromper, o programa nao espera
+        # as medicoes em andamento (o pool e fechado por quem o criou)
+        for trabalhador in range(len(pool["trabalhadores"])):
+            thread = threading.Thread(target=laco_agendador,
+                                      args=(celulas, pendentes, prontas, pool, trabalhador, repeticoes,
+                                            aquecimento, opcoes),
+                                      daemon=True)
+            thread.start()
+        
+        for _ in range(len(celulas)):
+            concluir(*prontas.get())
+    
+    return [concluidas[i] for i in range(len(celulas))]
+
+
+def laco_agendador(celulas, pendentes, prontas, pool, trabalhador, repeticoes, aquecimento, opcoes):
+    """
+    Executada em uma thread por processo do pool: mede as celulas da
+    fila no processo informado ate a fila acabar
+    """
+    while True:
+        try:
+            indice = pendentes.get_nowait()
+        except queue.Empty:
+            return
+        prontas.put((indice, *medir_celula(celulas[indice], pool, trabalhador, repeticoes, aquecimento, opcoes)))
+
+
+def medir_celula(celula, pool, trabalhador, repeticoes, aquecimento, opcoes):
+    """
+    Mede uma celula da matriz
+    
+    Retorna:
+        Tupla (resultado, medicao) de medir_algoritmo. Uma excecao (como
+        uma falha de comunicacao com o pool) vira uma medicao com status
+        "erro", para que a thread nao morra com a celula pendente
+    """
+    try:
+        return medir_algoritmo(celula["nome"], celula["funcao"], celula["lista"], celula["backend"],
+                               celula["semente"], celula["distribuicao"], pool, repeticoes, aquecimento,
+                               trabalhador=trabalhador, **opcoes)
+    except Exception as erro:
+        return None, {"status": "erro", "erro": f"{type(erro).__name__}: {erro}"}
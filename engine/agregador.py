@@ -0,0 +1,232 @@
+"""
+Modulo do agregador de estatisticas
+Resume os resultados por (algoritmo, tamanho, backend) a medida que
+chegam, sem guardar as medicoes: media e variancia de Welford, minimo,
+maximo e um esboco de quantis (como o DDSketch) para p50, p90 e p99
+Dois agregadores (de trabalhadores diferentes ou de execucoes
+anteriores) se juntam sem repassar pelas medicoes
+"""
+import math
+
+# Metricas agregadas e a chave da lista de repeticoes de cada uma
+METRICAS = {"tempo": "tempos", "energia": "energias", "co2": "co2s"}
+
+# Quantis do resumo
+QUANTIS = {"p50": 0.50, "p90": 0.90, "p99": 0.99}
+
+# Erro relativo maximo dos quantis do esboco (1%)
+PRECISAO_ESBOCO = 0.01
+
+# O esboco junta os baldes menores quando passa desse numero, o que so
+# afeta os quantis mais baixos (com 1% cobre mais de 17 ordens de grandeza)
+MAXIMO_BALDES = 2048
+
+GAMA = (1 + PRECISAO_ESBOCO) / (1 - PRECISAO_ESBOCO)
+LOG_GAMA = math.log(GAMA)
+
+
+def novo_acumulador():
+    """
+    Cria um acumulador vazio para uma metrica
+    
+    Retorna:
+        Dicionario com n, media, m2 (soma dos quadrados dos desvios),
+        minimo, maximo, zeros (valores <= 0, fora do esboco) e baldes
+        (indice do balde: quantidade)
+    """
+    return {
+        "n": 0,
+        "media": 0.0,
+        "m2": 0.0,
+        "minimo": math.inf,
+        "maximo": -math.inf,
+        "zeros": 0,
+        "baldes": {},
+    }
+
+
+def acumular(acumulador, valor):
+    """
+    Inclui um valor no acumulador em O(1)
+    
+    O balde de um valor v e o inteiro i com GAMA^(i-1) < v <= GAMA^i,
+    entao todo valor do balde esta a menos de PRECISAO_ESBOCO do
+    representante do balde
+    """
+    acumulador["n"] += 1
+    delta = valor - acumulador["media"]
+    acumulador["media"] += delta / acumulador["n"]
+    acumulador["m2"] += delta * (valor - acumulador["media"])
+    acumulador["minimo"] = min(acumulador["minimo"], valor)
+    acumulador["maximo"] = max(acumulador["maximo"], valor)
+    
+    if valor <= 0:
+        acumulador["zeros"] += 1
+        return
+    
+    indice = math.ceil(math.log(valor) / LOG_GAMA)
+    baldes = acumulador["baldes"]
+    baldes[indice] = baldes.get(indice, 0) + 1
+    if len(baldes) > MAXIMO_BALDES:
+        limitar_baldes(baldes)
+
+
+def limitar_baldes(baldes):
+    """
+    Junta os baldes de menor indice ate sobrarem MAXIMO_BALDES
+    """
+    indices = sorted(baldes)
+    excesso = len(indices) - MAXIMO_BALDES
+    destino = indices[excesso]
+    for indice in indices[:excesso]:
+        baldes[destino] += baldes.pop(indice)
+
+
+def juntar_acumuladores(primeiro, segundo):
+    """
+    Junta dois acumuladores da mesma metrica em um novo, como se todos
+    os valores tivessem passado por um so (formula de Chan para a
+    media e a variancia; os baldes do esboco sao somados)
+    
+    Retorna:
+        Acumulador novo (os dois nao mudam)
+    """
+    n = primeiro["n"] + segundo["n"]
+    if n == 0:
+        return novo_acumulador()
+    
+    delta = segundo["media"] - primeiro["media"]
+    baldes = dict(primeiro["baldes"])
+    for indice, quantidade in segundo["baldes"].items():
+        baldes[indice] = baldes.get(indice, 0) + quantidade
+    if len(baldes) > MAXIMO_BALDES:
+        limitar_baldes(baldes)
+    
+    return {
+        "n": n,
+        "media": primeiro["media"] + delta * segundo["n"] / n,
+        "m2": primeiro["m2"] + segundo["m2"] + delta * delta * primeiro["n"] * segundo["n"] / n,
+        "minimo": min(primeiro["minimo"], segundo["minimo"]),
+        "maximo": max(primeiro["maximo"], segundo["maximo"]),
+        "zeros": primeiro["zeros"] + segundo["zeros"],
+        "baldes": baldes,
+    }
+
+
+def quantil(acumulador, q):
+    """
+    Estima um quantil pelo esboco, com erro relativo de ate
+    PRECISAO_ESBOCO
+    
+    Parametros:
+        acumulador: Acumulador de novo_acumulador
+        q: Quantil, de 0 a 1 (0.5 = mediana)
+    
+    Retorna:
+        O quantil estimado, ou None se o acumulador estiver vazio
+    """
+    if acumulador["n"] == 0:
+        return None
+    
+    posicao = q * (acumulador["n"] - 1)
+    contados = acumulador["zeros"]
+    if posicao < contados:
+        return acumulador["minimo"]
+    
+    for indice in sorted(acumulador["baldes"]):
+        contados += acumulador["baldes"][indice]
+        if posicao < contados:
+            representante = 2 * GAMA ** indice / (GAMA + 1)
+            # Nenhum valor fica fora do que foi medido
+            return min(max(representante, acumulador["minimo"]), acumulador["maximo"])
+    
+    return acumulador["maximo"]
+
+
+def resumir_acumulador(acumulador):
+    """
+    Resume um acumulador
+    
+    Retorna:
+        Dicionario com n, minimo, maximo, media, desvio (amostral), p50,
+        p90 e p99, ou None se o acumulador estiver vazio
+    """
+    n = acumulador["n"]
+    if n == 0:
+        return None
+    
+    resumo = {
+        "n": n,
+        "minimo": acumulador["minimo"],
+        "maximo": acumulador["maximo"],
+        "media": acumulador["media"],
+        "desvio": math.sqrt(acumulador["m2"] / (n - 1)) if n > 1 else 0.0,
+    }
+    for nome, q in QUANTIS.items():
+        resumo[nome] = quantil(acumulador, q)
+    return resumo
+
+
+def agregar(agregador, resultado):
+    """
+    Inclui um resultado (de medir_algoritmo) no agregador
+    Cada repeticao entra na distribuicao, nao so a mediana. Resultados
+    interrompidos ou extrapolados ficam de fora
+    
+    Parametros:
+        agregador: Dicionario (algoritmo, tamanho, backend): {metrica:
+            acumulador}, comecando vazio
+        resultado: Resultado medido
+    """
+    if resultado.get("status", "ok") != "ok":
+        return
+    
+    chave = (resultado["algoritmo"], resultado.get("tamanho"), resultado.get("backend", "python"))
+    if chave not in agregador:
+        agregador[chave] = {metrica: novo_acumulador() for metrica in METRICAS}
+    
+    for metrica, repeticoes in METRICAS.items():
+        for valor in resultado.get(repeticoes) or [resultado[metrica]]:
+            acumular(agregador[chave][metrica], valor)
+
+
+def juntar_agregadores(*agregadores):
+    """
+    Junta varios agregadores em um novo (os originais nao mudam)
+    """
+    juntos = {}
+    for agregador in agregadores:
+        for chave, acumuladores in agregador.items():
+            if chave not in juntos:
+                juntos[chave] = {metrica: novo_acumulador() for metrica in METRICAS}
+            for metrica in METRICAS:
+                juntos[chave][metrica] = juntar_acumuladores(juntos[chave][metrica], acumuladores[metrica])
+    return juntos
+
+
+def agregador_para_json(agregador):
+    """
+    Converte o agregador em uma lista que o json grava (as chaves
+    viram listas e os baldes, pares [indice, quantidade])
+    """
+    itens = []
+    for chave, acumuladores in agregador.items():
+        metricas = {}
+        for metrica, acumulador in acumuladores.items():
+            metricas[metrica] = dict(acumulador, baldes=sorted(acumulador["baldes"].items()))
+        itens.append({"chave": list(chave), "metricas": metricas})
+    return itens
+
+
+def agregador_de_json(itens):
+    """
+    Reconstroi o agregador gravado por agregador_para_json
+    """
+    agregador = {}
+    for item in itens:
+        acumuladores = {}
+        for metrica, acumulador in item["metricas"].items():
+            acumuladores[metrica] = dict(acumulador, baldes={indice: quantidade
+                                                             for indice, quantidade in acumulador["baldes"]})
+        agregador[tuple(item["chave"])] = acumuladores
+    return agregador
@@ -0,0 +1,229 @@
+"""
+Modulo de amostragem de CPU
+Registra o uso de CPU do processo, de cada nucleo e a frequencia
+em intervalos regulares enquanto um algoritmo executa
+"""
+import threading
+import time
+
+import psutil
+
+# Intervalo padrao entre as amostras, em segundos
+INTERVALO_PADRAO = 0.01
+
+# Procurar os processos filhos percorre todos os processos do sistema
+# (cerca de 1 ms), entao a lista so e atualizada a cada tantas amostras.
+# Os contadores sao acumulados, entao a CPU total nao se perde
+AMOSTRAS_POR_BUSCA_FILHOS = 10
+
+
+def iniciar_amostragem(intervalo=INTERVALO_PADRAO, alta_resolucao=False):
+    """
+    Comeca a amostrar a CPU em uma thread separada
+    
+    Cada amostra guarda o uso de CPU do processo (somando os processos
+    filhos) e de cada nucleo desde a amostra anterior, e a frequencia
+    atual da CPU. A primeira amostra e tirada aqui mesmo, antes de
+    retornar, e a ultima em parar_amostragem
+    
+    No modo de alta resolucao a CPU do processo vem de time.process_time
+    (resolucao de nanossegundos, em vez dos ticks de 10 ms do sistema),
+    descontando o tempo da propria thread de amostragem (time.thread_time)
+    
+    Parametros:
+        intervalo: Segundos entre as amostras (padrao: 10 ms)
+        alta_resolucao: Se deve usar process_time/thread_time
+    
+    Retorna:
+        Dicionario com o estado da amostragem (para parar_amostragem)
+    """
+    estado = {
+        "intervalo": intervalo,
+        "alta_resolucao": alta_resolucao,
+        "processo": psutil.Process(),
+        "parar": threading.Event(),
+        "amostras": [],
+        "cpu_amostrador": 0.0,
+        "filhos": [],
+        "leituras": 0,
+        "cpu_maxima": 100.0 * (psutil.cpu_count() or 1),
+        "excesso": 0.0,
+    }
+    
+    estado["anterior"] = ler_contadores(estado)
+    estado["inicio"] = estado["anterior"]["momento"]
+    estado["amostras"].append(montar_amostra(estado, estado["anterior"], estado["anterior"]))
+    
+    estado["thread"] = threading.Thread(target=laco_amostragem, args=(estado,), daemon=True)
+    estado["thread"].start()
+    
+    return estado
+
+
+def parar_amostragem(estado):
+    """
+    Para a thread de amostragem e tira a ultima amostra
+    
+    Retorna:
+        Lista de amostras, cada uma com t (segundos desde o inicio),
+        dt (segundos desde a amostra anterior), cpu_processo (%),
+        cpu_nucleos (% de cada nucleo) e frequencia_mhz (None se o
+        sistema nao informar)
+    """
+    estado["parar"].set()
+    estado["thread"].join()
+    
+    atual = ler_contadores(estado)
+    estado["amostras"].append(montar_amostra(estado, estado["anterior"], atual))
+    
+    return estado["amostras"]
+
+
+def laco_amostragem(estado):
+    """
+    Executada na thread de amostragem: tira uma amostra a cada intervalo
+    """
+    inicio_thread = time.thread_time()
+    
+    while not estado["parar"].wait(estado["intervalo"]):
+        atual = ler_contadores(estado)
+        estado["amostras"].append(montar_amostra(estado, estado["anterior"], atual))
+        estado["anterior"] = atual
+        estado["cpu_amostrador"] = time.thread_time() - inicio_thread
+
+
+def ler_contadores(estado):
+    """
+    Le os contadores acumulados de tempo, CPU do processo e dos nucleos
+    """
+    processo = estado["processo"]
+    
+    if estado["leituras"] % AMOSTRAS_POR_BUSCA_FILHOS == 0:
+        try:
+            estado["filhos"] = processo.children(recursive=True)
+        except psutil.NoSuchProcess:
+            estado["filhos"] = []
+    estado["leituras"] = estado["leituras"] + 1
+    
+    # O relogio e lido junto com a CPU do processo para os dois baterem
+    momento = time.perf_counter()
+    if estado["alta_resolucao"]:
+        cpu_processo = time.process_time() - estado["cpu_amostrador"]
+        tempos = processo.cpu_times()
+    else:
+        tempos = processo.cpu_times()
+        cpu_processo = tempos.user + tempos.system
+    
+    cpu_processo = cpu_processo + tempos.children_user + tempos.children_system + cpu_dos_filhos(estado["filhos"])
+    
+    return {
+        "momento": momento,
+        "cpu_processo": cpu_processo,
+        "nucleos": psutil.cpu_times(percpu=True),
+        "frequencia_mhz": ler_frequencia(),
+    }
+
+
+def montar_amostra(estado, anterior, atual):
+    """
+    Calcula os percentuais de uso entre duas leituras de ler_contadores
+    
+    Os contadores do sistema andam em ticks de 10 ms, entao um intervalo
+    curto pode mostrar mais CPU do que e possivel. O que passar de 100%
+    por nucleo fica para a amostra seguinte, assim a soma da serie
+    continua igual a CPU total usada
+    """
+    dt = atual["momento"] - anterior["momento"]
+    
+    cpu_processo = 0.0
+    if dt > 0:
+        cpu_segundos = max(0.0, atual["cpu_processo"] - anterior["cpu_processo"]) + estado["excesso"]
+        usados = min(cpu_segundos, estado["cpu_maxima"] / 100 * dt)
+        estado["excesso"] = cpu_segundos - usados
+        cpu_processo = usados / dt * 100
+    
+    cpu_nucleos = []
+    for antes, depois in zip(anterior["nucleos"], atual["nucleos"]):
+        total = sum(depois) - sum(antes)
+        ocioso = (depois.idle - antes.idle) + (getattr(depois, "iowait", 0.0) - getattr(antes, "iowait", 0.0))
+        
+        uso = 0.0
+        if total > 0:
+            uso = min(100.0, max(0.0, (total - ocioso) / total * 100))
+        cpu_nucleos.append(uso)
+    
+    return {
+        "t": atual["momento"] - estado["inicio"],
+        "dt": dt,
+        "cpu_processo": cpu_processo,
+        "cpu_nucleos": cpu_nucleos,
+        "frequencia_mhz": atual["frequencia_mhz"],
+    }
+
+
+def cpu_dos_filhos(filhos):
+    """
+    CPU dos processos filhos que ainda estao rodando (os que ja
+    terminaram entram em children_user e children_system do pai)
+    """
+    total = 0.0
+    
+    for filho in filhos:
+        try:
+            tempos_filho = filho.cpu_times()
+            total = total + tempos_filho.user + tempos_filho.system
+        except psutil.NoSuchProcess:
+            pass
+    
+    return total
+
+
+def ler_frequencia():
+    """
+    Frequencia atual da CPU em MHz (None se o sistema nao informar)
+    """
+    try:
+        frequencia = psutil.cpu_freq()
+    except (OSError, NotImplementedError):
+        return None
+    
+    if frequencia is None or not frequencia.current:
+        return None
+    return frequencia.current
+
+
+def resumir_serie(amostras):
+    """
+    Resume uma serie de amostras
+    
+    Retorna:
+        Dicionario com amostras (quantidade), cpu_media (ponderada pelo
+        tempo), cpu_pico e frequencia_media_mhz (None se indisponivel)
+    """
+    duracao = 0.0
+    cpu_ponderada = 0.0
+    cpu_pico = 0.0
+    frequencias = []
+    
+    for amostra in amostras:
+        duracao = duracao + amostra["dt"]
+        cpu_ponderada = cpu_ponderada + amostra["cpu_processo"] * amostra["dt"]
+        if amostra["dt"] > 0:
+            cpu_pico = max(cpu_pico, amostra["cpu_processo"])
+        if amostra["frequencia_mhz"] is not None:
+            frequencias.append(amostra["frequencia_mhz"])
+    
+    cpu_media = 0.0
+    if duracao > 0:
+        cpu_media = cpu_ponderada / duracao
+    
+    frequencia_media = None
+    if frequencias:
+        frequencia_media = sum(frequencias) / len(frequencias)
+    
+    return {
+        "amostras": len(amostras),
+        "cpu_media": cpu_media,
+        "cpu_pico": cpu_pico,
+        "frequencia_media_mhz": frequencia_media,
+    }
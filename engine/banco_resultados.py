@@ -0,0 +1,374 @@
+"""
+Modulo da base de resultados
+Guarda cada resultado medido em um banco SQLite, que so recebe registros
+novos, para que os resultados sobrevivam ao fim do programa e possam ser
+consultados por algoritmo, tamanho e execucao
+"""
+import hashlib
+import json
+import os
+import platform
+import sqlite3
+import uuid
+from datetime import datetime
+from pathlib import Path
+
+import psutil
+
+from exportador_csv import COLUNAS_RESULTADOS
+from agregador import agregar, agregador_para_json, agregador_de_json
+
+CAMINHO_BANCO = Path(__file__).parent.parent / "resultados.db"
+
+# Muda quando o formato das tabelas mudar
+VERSAO_ESQUEMA = 2
+
+# Colunas de medidas de cada resultado (alem das de identificacao)
+COLUNAS_MEDIDAS = COLUNAS_RESULTADOS + ["co2s", "amostras_cpu"]
+
+# Colunas com uma lista por repeticao, guardadas em JSON
+COLUNAS_LISTAS = ["tempos", "energias", "co2s"]
+
+# Tipo de cada coluna no banco (as que nao aparecem aqui sao REAL)
+TIPOS = {
+    "algoritmo": "TEXT",
+    "backend": "TEXT",
+    "tamanho": "INTEGER",
+    "distribuicao": "TEXT",
+    "semente": "INTEGER",
+    "ensaio": "INTEGER",
+    "status": "TEXT",
+    "repeticoes": "INTEGER",
+    "chamadas": "INTEGER",
+    "modelo": "TEXT",
+    "fonte_energia": "TEXT",
+    "memoria_pico_bytes": "INTEGER",
+    "alocacoes": "INTEGER",
+    "rss_delta_bytes": "INTEGER",
+    "comparacoes": "INTEGER",
+    "escritas": "INTEGER",
+    "profundidade_maxima": "INTEGER",
+    "bytes_lidos": "INTEGER",
+    "bytes_escritos": "INTEGER",
+    "amostras_cpu": "INTEGER",
+    "tempos": "TEXT",
+    "energias": "TEXT",
+    "co2s": "TEXT",
+}
+
+
+def descrever_maquina():
+    """
+    Descreve a maquina que mede: sistema, processador, nucleos, memoria
+    e versoes do Python e do NumPy
+    
+    Retorna:
+        Tupla (identificador, descricao): um resumo curto da descricao,
+        igual em todas as execucoes na mesma maquina, e o dicionario
+    """
+    import numpy as np
+    
+    processador = platform.processor()
+    try:
+        with open("/proc/cpuinfo", encoding="utf-8") as arquivo:
+            for linha in arquivo:
+                if linha.startswith("model name"):
+                    processador = linha.split(":", 1)[1].strip()
+                    break
+    except OSError:
+        pass
+    
+    descricao = {
+        "nome": platform.node(),
+        "sistema": f"{platform.system()} {platform.release()}",
+        "arquitetura": platform.machine(),
+        "processador": processador,
+        "nucleos": os.cpu_count(),
+        "memoria_bytes": psutil.virtual_memory().total,
+        "python": platform.python_version(),
+        "numpy": np.__version__,
+    }
+    texto = json.dumps(descricao, sort_keys=True)
+    return hashlib.sha256(texto.encode()).hexdigest()[:16], descricao
+
+
+def abrir_banco(caminho=None):
+    """
+    Abre o banco de resultados, criando as tabelas na primeira vez
+    
+    Tabelas:
+        maquinas: identificador e descricao de cada maquina
+        execucoes: uma linha por execucao do programa (run_id), com a
+            data, a maquina e a origem ("menu" ou "lote")
+        resultados: uma linha por resultado, com a execucao, a data, a
+            lista usada (tamanho, distribuicao, semente) e as medidas.
+            Indices em (algoritmo, tamanho) e em run_id
+        agregados: o agregador de estatisticas de cada execucao (veja
+            agregador.py), gravado quando ela termina
+    
+    Parametros:
+        caminho: Arquivo do banco (padrao: CAMINHO_BANCO)
+    
+    Retorna:
+        Conexao sqlite3
+    """
+    conexao = sqlite3.connect(caminho or CAMINHO_BANCO)
+    conexao.row_factory = sqlite3.Row
+    # Leituras de outro processo (python -m engine) nao esperam as escritas
+    conexao.execute("PRAGMA journal_mode=WAL")
+    
+    colunas = []
+    for coluna in COLUNAS_MEDIDAS:
+        colunas.append(f"{coluna} {TIPOS.get(coluna, 'REAL')}")
+    
+    with conexao:
+        conexao.execute("CREATE TABLE IF NOT EXISTS maquinas (id TEXT PRIMARY KEY, descricao TEXT NOT NULL)")
+        conexao.execute("CREATE TABLE IF NOT EXISTS execucoes (run_id TEXT PRIMARY KEY, iniciada_em TEXT NOT NULL, "
+                        "maquina TEXT NOT NULL REFERENCES maquinas (id), origem TEXT NOT NULL)")
+        conexao.execute("CREATE TABLE IF NOT EXISTS resultados (id INTEGER PRIMARY KEY AUTOINCREMENT, "
+                        "run_id TEXT NOT NULL REFERENCES execucoes (run_id), registrado_em TEXT NOT NULL, "
+                        f"{', '.join(colunas)}, extras TEXT)")
+        conexao.execute("CREATE INDEX IF NOT EXISTS resultados_algoritmo_tamanho ON resultados (algoritmo, tamanho)")
+        conexao.execute("CREATE INDEX IF NOT EXISTS resultados_run_id ON resultados (run_id)")
+        conexao.execute("CREATE TABLE IF NOT EXISTS agregados (run_id TEXT PRIMARY KEY REFERENCES execucoes (run_id), "
+                        "dados TEXT NOT NULL)")
+        
+        # Resultados gravados nao mudam nem somem
+        for operacao in ["UPDATE", "DELETE"]:
+            conexao.execute(f"CREATE TRIGGER IF NOT EXISTS resultados_sem_{operacao.lower()} "
+                            f"BEFORE {operacao} ON resultados "
+                            "BEGIN SELECT RAISE(ABORT, 'a base de resultados so aceita registros novos'); END")
+        conexao.execute(f"PRAGMA user_version = {VERSAO_ESQUEMA}")
+    
+    return conexao
+
+
+def iniciar_execucao(conexao, origem="menu"):
+    """
+    Registra uma execucao nova do programa
+    
+    Parametros:
+        conexao: Conexao de abrir_banco
+        origem: "menu" (main.py) ou "lote" (python -m engine)
+    
+    Retorna:
+        O run_id da execucao
+    """
+    maquina, descricao = descrever_maquina()
+    run_id = uuid.uuid4().hex
+    
+    with conexao:
+        conexao.execute("INSERT OR IGNORE INTO maquinas (id, descricao) VALUES (?, ?)",
+                        (maquina, json.dumps(descricao, sort_keys=True)))
+        conexao.execute("INSERT INTO execucoes (run_id, iniciada_em, maquina, origem) VALUES (?, ?, ?, ?)",
+                        (run_id, agora(), maquina, origem))
+    
+    return run_id
+
+
+def agora():
+    """Data e hora atuais, com o fuso horario (ISO 8601)"""
+    return datetime.now().astimezone().isoformat(timespec="seconds")
+
+
+def valor_banco(valor):
+    """
+    Converte um valor do resultado para o banco: listas viram JSON e
+    numeros do NumPy viram numeros do Python
+    """
+    if isinstance(valor, list):
+        return json.dumps([valor_banco(item) for item in valor])
+    if hasattr(valor, "item"):
+        return valor.item()
+    return valor
+
+
+def gravar_resultados(conexao, run_id, resultados):
+    """
+    Grava resultados (de medir_algoritmo, da varredura ou da ordenacao
+    externa) na execucao, com a data de agora
+    Chaves que nao sao colunas vao juntas em JSON, na coluna extras
+    """
+    registrado_em = agora()
+    linhas = []
+    for resultado in resultados:
+        linha = [run_id, registrado_em]
+        for coluna in COLUNAS_MEDIDAS:
+            linha.append(valor_banco(resultado.get(coluna)))
+        
+        extras = {}
+        for chave, valor in resultado.items():
+            if chave not in COLUNAS_MEDIDAS:
+                extras[chave] = valor
+        linha.append(json.dumps(extras, default=str) if extras else None)
+        linhas.append(linha)
+    
+    marcadores = ", ".join("?" * (len(COLUNAS_MEDIDAS) + 3))
+    with conexao:
+        conexao.executemany(f"INSERT INTO resultados (run_id, registrado_em, {', '.join(COLUNAS_MEDIDAS)}, extras) "
+                            f"VALUES ({marcadores})", linhas)
+
+
+def gravar_agregado(conexao, run_id, agregador):
+    """
+    Grava o agregador de estatisticas de uma execucao, uma vez, quando
+    ela termina (execucoes sem agregador sao reagregadas pelos
+    resultados em ler_agregado)
+    """
+    if not agregador:
+        return
+    with conexao:
+        conexao.execute("INSERT OR IGNORE INTO agregados (run_id, dados) VALUES (?, ?)",
+                        (run_id, json.dumps(agregador_para_json(agregador))))
+
+
+def ler_agregado(conexao, run_id):
+    """
+    Le o agregador de estatisticas de uma execucao. Se ela nao gravou
+    (foi interrompida, ou e de antes dos agregadores), agrega os
+    resultados gravados dela
+    
+    Retorna:
+        Agregador (veja agregador.py)
+    """
+    linha = conexao.execute("SELECT dados FROM agregados WHERE run_id = ?", (run_id,)).fetchone()
+    if linha:
+        return agregador_de_json(json.loads(linha["dados"]))
+    
+    agregador = {}
+    for resultado in consultar_resultados(conexao, [run_id], status="ok"):
+        agregar(agregador, resultado)
+    return agregador
+
+
+def consultar_resultados(conexao, execucoes=None, algoritmo=None, tamanho=None, **filtros):
+    """
+    Consulta resultados gravados, na ordem em que foram gravados
+    
+    Parametros:
+        conexao: Conexao de abrir_banco
+        execucoes: Lista de run_id (None = todas as execucoes)
+        algoritmo: Nome do algoritmo (None = todos)
+        tamanho: Tamanho da lista (None = todos)
+        **filtros: Outras colunas e o valor procurado, como backend="numpy"
+            ou status="ok" (None nao filtra)
+    
+    Retorna:
+        Lista de resultados, no formato de medir_algoritmo, com run_id,
+        registrado_em e maquina. Colunas vazias ficam de fora
+    """
+    return list(iterar_resultados(conexao, execucoes, algoritmo, tamanho, **filtros))
+
+
+def iterar_resultados(conexao, execucoes=None, algoritmo=None, tamanho=None, **filtros):
+    """
+    Como consultar_resultados, mas le um resultado de cada vez do banco,
+    sem montar a lista (para exportar muitos resultados)
+    """
+    condicoes, parametros = filtrar(execucoes, algoritmo, tamanho, filtros)
+    
+    consulta = "SELECT r.*, e.maquina FROM resultados r JOIN execucoes e ON e.run_id = r.run_id"
+    if condicoes:
+        consulta = consulta + " WHERE " + " AND ".join(condicoes)
+    
+    for linha in conexao.execute(consulta + " ORDER BY r.id", parametros):
+        resultado = {}
+        for coluna in linha.keys():
+            valor = linha[coluna]
+            if valor is None or coluna in ["id", "extras"]:
+                continue
+            if coluna in COLUNAS_LISTAS:
+                valor = json.loads(valor)
+            resultado[coluna] = valor
+        if linha["extras"]:
+            resultado.update(json.loads(linha["extras"]))
+        yield resultado
+
+
+def filtrar(execucoes, algoritmo, tamanho, filtros):
+    """
+    Monta as condicoes (sobre a tabela resultados, com o apelido r) e os
+    parametros de uma consulta
+    
+    Retorna:
+        Tupla (condicoes, parametros)
+    """
+    condicoes = []
+    parametros = []
+    if execucoes is not None:
+        condicoes.append(f"r.run_id IN ({', '.join('?' * len(execucoes))})")
+        parametros.extend(execucoes)
+    if algoritmo is not None:
+        filtros["algoritmo"] = algoritmo
+    if tamanho is not None:
+        filtros["tamanho"] = tamanho
+    for coluna, valor in filtros.items():
+        if coluna not in COLUNAS_MEDIDAS:
+            raise ValueError(f"Coluna desconhecida: {coluna}")
+        if valor is None:
+            continue
+        condicoes.append(f"r.{coluna} = ?")
+        parametros.append(valor)
+    return condicoes, parametros
+
+
+def colunas_gravadas(conexao, execucoes=None):
+    """
+    Colunas que os resultados gravados nas execucoes (None = todas)
+    realmente tem, sem ler os resultados: as medidas com algum valor,
+    a identificacao (run_id, registrado_em e maquina) e as chaves
+    extras, na ordem em que apareceram
+    
+    Retorna:
+        Lista de nomes de colunas, na ordem dos resultados de
+        consultar_resultados
+    """
+    condicoes, parametros = filtrar(execucoes, None, None, {})
+    onde = " WHERE " + " AND ".join(condicoes) if condicoes else ""
+    
+    contagens = ", ".join(f"COUNT({coluna})" for coluna in COLUNAS_MEDIDAS)
+    linha = conexao.execute(f"SELECT {contagens} FROM resultados r{onde}", parametros).fetchone()
+    colunas = [coluna for coluna, quantidade in zip(COLUNAS_MEDIDAS, linha) if quantidade]
+    colunas.extend(["run_id", "registrado_em", "maquina"])
+    
+    extras = ("SELECT j.key FROM resultados r, json_each(r.extras) j"
+              + (onde + " AND" if onde else " WHERE") + " r.extras IS NOT NULL GROUP BY j.key ORDER BY MIN(r.id)")
+    for linha in conexao.execute(extras, parametros):
+        if linha[0] not in colunas:
+            colunas.append(linha[0])
+    return colunas
+
+
+def contar_resultados(conexao, execucoes=None):
+    """
+    Conta os resultados gravados nas execucoes (None = todas)
+    """
+    if execucoes is None:
+        return conexao.execute("SELECT COUNT(*) FROM resultados").fetchone()[0]
+    consulta = f"SELECT COUNT(*) FROM resultados WHERE run_id IN ({', '.join('?' * len(execucoes))})"
+    return conexao.execute(consulta, execucoes).fetchone()[0]
+
+
+def listar_execucoes(conexao):
+    """
+    Lista as execucoes gravadas, da mais antiga para a mais nova
+    
+    Retorna:
+        Lista de dicionarios com run_id, iniciada_em, maquina, origem,
+        processador e resultados (quantidade)
+    """
+    execucoes = []
+    consulta = ("SELECT e.run_id, e.iniciada_em, e.maquina, e.origem, m.descricao, COUNT(r.id) AS resultados "
+                "FROM execucoes e JOIN maquinas m ON m.id = e.maquina "
+                "LEFT JOIN resultados r ON r.run_id = e.run_id "
+                "GROUP BY e.run_id ORDER BY e.iniciada_em")
+    for linha in conexao.execute(consulta):
+        execucoes.append({
+            "run_id": linha["run_id"],
+            "iniciada_em": linha["iniciada_em"],
+            "maquina": linha["maquina"],
+            "origem": linha["origem"],
+            "processador": json.loads(linha["descricao"])["processador"],
+            "resultados": linha["resultados"],
+        })
+    return execucoes
@@ -0,0 +1,152 @@
+"""
+Modulo da base de benchmarks de outras linguagens
+Carrega uma vez os benchmarks de benchmark/benchmarks.json, indexados por
+(linguagem, algoritmo, tamanho), e interpola os tamanhos que nao foram medidos
+"""
+import json
+import math
+from pathlib import Path
+
+CAMINHO_BENCHMARKS = Path(__file__).parent.parent / "benchmark" / "benchmarks.json"
+
+# Metricas de cada medida
+METRICAS = ["tempo", "cpu", "energia", "co2"]
+
+# Quantas vezes alem do menor ou do maior tamanho medido ainda se extrapola
+# (mais longe que isso a tendencia das duas pontas ja nao e confiavel)
+LIMITE_EXTRAPOLACAO = 10
+
+# Base carregada: {(linguagem, algoritmo): {tamanho: {metrica: valor}}}
+BASE = {}
+
+
+def carregar_benchmarks(caminho=None):
+    """
+    Carrega a base de benchmarks (so na primeira chamada)
+    
+    Parametros:
+        caminho: Arquivo JSON com a lista "medidas" (padrao: CAMINHO_BENCHMARKS)
+    
+    Retorna:
+        Dicionario {(linguagem, algoritmo): {tamanho: medida}}
+    """
+    if BASE:
+        return BASE
+    
+    with open(caminho or CAMINHO_BENCHMARKS, encoding="utf-8") as arquivo:
+        dados = json.load(arquivo)
+    
+    for medida in dados["medidas"]:
+        chave = (medida["linguagem"], medida["algoritmo"])
+        valores = {}
+        for metrica in METRICAS:
+            valores[metrica] = medida[metrica]
+        BASE.setdefault(chave, {})[medida["tamanho"]] = valores
+    
+    return BASE
+
+
+def obter_benchmark(linguagem, algoritmo, tamanho):
+    """
+    Busca o benchmark de uma linguagem para um algoritmo e um tamanho
+    
+    Tamanhos medidos voltam como estao. Entre dois tamanhos medidos, tempo,
+    energia e CO2 sao interpolados em escala log-log (uma reta entre os dois
+    pontos, como uma potencia c * n^k) e a CPU em escala log. Fora da faixa
+    medida a reta das duas pontas e estendida ate LIMITE_EXTRAPOLACAO vezes
+    o menor ou o maior tamanho, com a CPU da ponta
+    
+    Parametros:
+        linguagem: "c", "java" ou "go"
+        algoritmo: "merge", "quick", "bubble" ou "insertion"
+        tamanho: Tamanho da lista
+    
+    Retorna:
+        Dicionario com tempo, cpu, energia, co2, tamanho e origem
+        ("medido", "interpolado" ou "extrapolado"), ou None se nao houver
+        dados ou o tamanho estiver longe demais dos medidos
+    """
+    medidas = carregar_benchmarks().get((linguagem, algoritmo))
+    if not medidas or tamanho <= 0:
+        return None
+    
+    if tamanho in medidas:
+        return {**medidas[tamanho], "tamanho": tamanho, "origem": "medido"}
+    
+    tamanhos = sorted(medidas)
+    if len(tamanhos) < 2:
+        return None
+    if tamanho < tamanhos[0] / LIMITE_EXTRAPOLACAO or tamanho > tamanhos[-1] * LIMITE_EXTRAPOLACAO:
+        return None
+    
+    # Os dois tamanhos medidos em volta (ou os dois da ponta mais proxima)
+    if tamanho < tamanhos[0]:
+        menor, maior = tamanhos[0], tamanhos[1]
+        origem = "extrapolado"
+    elif tamanho > tamanhos[-1]:
+        menor, maior = tamanhos[-2], tamanhos[-1]
+        origem = "extrapolado"
+    else:
+        i = 1
+        while tamanhos[i] < tamanho:
+            i = i + 1
+        menor, maior = tamanhos[i - 1], tamanhos[i]
+        origem = "interpolado"
+    
+    # Posicao do tamanho na reta entre os dois, em escala log
+    fracao = math.log(tamanho / menor) / math.log(maior / menor)
+    
+    resultado = {"tamanho": tamanho, "origem": origem}
+    for metrica in METRICAS:
+        a = medidas[menor][metrica]
+        b = medidas[maior][metrica]
+        if metrica == "cpu" and origem == "extrapolado":
+            resultado[metrica] = a if tamanho < menor else b
+        elif metrica != "cpu" and a > 0 and b > 0:
+            resultado[metrica] = a * (b / a) ** fracao
+        else:
+            # CPU (porcentagem) e valores arredondados para zero: reta em log n
+            resultado[metrica] = max(0.0, a + (b - a) * fracao)
+    
+    return resultado
+
+
+def obter_todos_benchmarks(algoritmo, tamanho):
+    """
+    Obtem benchmarks de todas as linguagens para um algoritmo
+    (veja obter_benchmark)
+    """
+    resultados = {}
+    
+    for linguagem in listar_todas_linguagens():
+        dados = obter_benchmark(linguagem, algoritmo, tamanho)
+        if dados:
+            resultados[linguagem] = dados
+    
+    return resultados
+
+
+def listar_todas_linguagens():
+    """Retorna lista de linguagens disponiveis"""
+    linguagens = []
+    for linguagem, algoritmo in carregar_benchmarks():
+        if linguagem not in linguagens:
+            linguagens.append(linguagem)
+    return linguagens
+
+
+def listar_todos_algoritmos():
+    """Retorna lista de algoritmos disponiveis"""
+    algoritmos = []
+    for linguagem, algoritmo in carregar_benchmarks():
+        if algoritmo not in algoritmos:
+            algoritmos.append(algoritmo)
+    return algoritmos
+
+
+def listar_todos_tamanhos():
+    """Retorna lista de tamanhos medidos"""
+    tamanhos = set()
+    for medidas in carregar_benchmarks().values():
+        tamanhos.update(medidas)
+    return sorted(tamanhos)
@@ -0,0 +1,187 @@
+"""
+Modulo do catalogo de algoritmos
+Lista os algoritmos de ordenacao de cada backend e as variantes
+otimizadas, para o menu e para a execucao em lote (python -m engine)
+"""
+from metodos_ordenacao import merge_sort, quick_sort, bubble_sort, insertion_sort, bogosort
+from metodos_ordenacao import merge_sort_buffer, merge_sort_iterativo, quick_sort_introsort, insertion_sort_binaria
+from metodos_ordenacao import radix_counting_sort
+from ordenacao_paralela import merge_sort_paralelo
+from ordenacao_numpy import merge_sort_numpy, quick_sort_numpy, bubble_sort_numpy, insertion_sort_numpy, bogosort_numpy
+from ordenacao_numpy import radix_counting_sort_numpy
+from ordenacao_referencia import ordenar_list_sort, ordenar_sorted
+from ordenacao_referencia import numpy_sort_quicksort, numpy_sort_mergesort
+from ordenacao_nativa import merge_sort_c, quick_sort_c, bubble_sort_c, insertion_sort_c
+
+ALGORITMOS = [
+    ("Merge Sort", merge_sort),
+    ("Quick Sort", quick_sort),
+    ("Bubble Sort", bubble_sort),
+    ("Insertion Sort", insertion_sort),
+    ("Bogosort", bogosort),
+    ("Merge Sort (buffer)", merge_sort_buffer),
+    ("Merge Sort (iterativo)", merge_sort_iterativo),
+    ("Quick Sort (introsort)", quick_sort_introsort),
+    ("Insertion Sort (binaria)", insertion_sort_binaria),
+    ("Merge Sort (paralelo)", merge_sort_paralelo),
+    ("Radix/Counting Sort", radix_counting_sort),
+    ("list.sort", ordenar_list_sort),
+    ("sorted", ordenar_sorted),
+]
+
+ALGORITMOS_NUMPY = [
+    ("Merge Sort (numpy)", merge_sort_numpy),
+    ("Quick Sort (numpy)", quick_sort_numpy),
+    ("Bubble Sort (numpy)", bubble_sort_numpy),
+    ("Insertion Sort (numpy)", insertion_sort_numpy),
+    ("Bogosort (numpy)", bogosort_numpy),
+    ("Radix/Counting Sort (numpy)", radix_counting_sort_numpy),
+    ("numpy.sort (quicksort)", numpy_sort_quicksort),
+    ("numpy.sort (mergesort)", numpy_sort_mergesort),
+]
+
+# Linha de base em C, compilada nesta maquina (veja ordenacao_nativa.py)
+# Fica fora de BACKENDS: nao aparece no menu de algoritmos, so na
+# comparacao entre linguagens
+ALGORITMOS_C = [
+    ("Merge Sort (C)", merge_sort_c),
+    ("Quick Sort (C)", quick_sort_c),
+    ("Bubble Sort (C)", bubble_sort_c),
+    ("Insertion Sort (C)", insertion_sort_c),
+]
+
+BACKENDS = {
+    "python": ALGORITMOS,
+    "numpy": ALGORITMOS_NUMPY,
+}
+
+# Variantes otimizadas e o algoritmo original com o qual sao comparadas
+VARIANTES = {
+    "Merge Sort (buffer)": "Merge Sort",
+    "Merge Sort (iterativo)": "Merge Sort",
+    "Quick Sort (introsort)": "Quick Sort",
+    "Insertion Sort (binaria)": "Insertion Sort",
+    "Merge Sort (paralelo)": "Merge Sort (buffer)",
+    "Merge Sort (numpy)": "Merge Sort",
+    "Quick Sort (numpy)": "Quick Sort",
+    "Bubble Sort (numpy)": "Bubble Sort",
+    "Insertion Sort (numpy)": "Insertion Sort",
+    "Radix/Counting Sort (numpy)": "Radix/Counting Sort",
+}
+
+# Ordenacao pronta de cada backend, com a qual a energia dos outros
+# algoritmos e comparada (coluna "vs. built-in")
+REFERENCIAS = {
+    "python": "list.sort",
+    "numpy": "numpy.sort (quicksort)",
+}
+
+# Algoritmos que criam varios processos (medidos sem fixar o nucleo)
+PARALELOS = ["Merge Sort (paralelo)"]
+
+# Ordem de complexidade esperada de cada algoritmo (caso medio), usada
+# para prever quais medicoes demoram mais (veja agendador.py)
+COMPLEXIDADES = {
+    "Merge Sort": "n log n",
+    "Quick Sort": "n log n",
+    "Bubble Sort": "n²",
+    "Insertion Sort": "n²",
+    "Bogosort": "n!",
+    "Merge Sort (buffer)": "n log n",
+    "Merge Sort (iterativo)": "n log n",
+    "Quick Sort (introsort)": "n log n",
+    "Insertion Sort (binaria)": "n²",
+    "Merge Sort (paralelo)": "n log n",
+    "Radix/Counting Sort": "n",
+    "Merge Sort (numpy)": "n log n",
+    "Quick Sort (numpy)": "n log n",
+    "Bubble Sort (numpy)": "n²",
+    "Insertion Sort (numpy)": "n²",
+    "Bogosort (numpy)": "n!",
+    "Radix/Counting Sort (numpy)": "n",
+    "list.sort": "n log n",
+    "sorted": "n log n",
+    "numpy.sort (quicksort)": "n log n",
+    "numpy.sort (mergesort)": "n log n",
+    "Merge Sort (C)": "n log n",
+    "Quick Sort (C)": "n log n",
+    "Bubble Sort (C)": "n²",
+    "Insertion Sort (C)": "n²",
+}
+
+
+def procurar_algoritmo(nome, backend="python"):
+    """
+    Procura um algoritmo do backend pelo nome (sem diferenciar
+    maiusculas de minusculas). No backend numpy o sufixo " (numpy)"
+    pode ser omitido
+    
+    Parametros:
+        nome: Nome do algoritmo, como aparece no catalogo
+        backend: "python" ou "numpy"
+    
+    Retorna:
+        Tupla (nome, funcao), ou None se nao existir
+    """
+    procurados = [nome.strip().lower(), f"{nome.strip()} ({backend})".lower()]
+    for candidato, funcao in BACKENDS[backend]:
+        if candidato.lower() in procurados:
+            return candidato, funcao
+    return None
+
+
+def procurar_referencia(resultado, resultados):
+    """
+    Procura, entre os resultados, a ordenacao de referencia (REFERENCIAS)
+    do backend de um resultado, medida na mesma lista (mesmo tamanho,
+    distribuicao e semente) e sem interrupcao. Resultados extrapolados
+    (varredura) tambem podem ser comparados com a referencia extrapolada
+    
+    Retorna:
+        O resultado da referencia, ou None se ela nao foi medida
+    """
+    nome = REFERENCIAS.get(resultado.get("backend", "python"))
+    aceitos = ["ok"]
+    if resultado.get("status") == "extrapolado":
+        aceitos = ["ok", "extrapolado"]
+    for r in resultados:
+        if (r["algoritmo"] == nome and r.get("status", "ok") in aceitos
+                and r.get("backend", "python") == resultado.get("backend", "python")
+                and r.get("tamanho") == resultado.get("tamanho")
+                and r.get("distribuicao") == resultado.get("distribuicao")
+                and r.get("semente") == resultado.get("semente")):
+            return r
+    return None
+
+
+def razao_referencia(resultado, resultados):
+    """
+    Energia de um resultado dividida pela da ordenacao de referencia
+    do backend na mesma lista (veja procurar_referencia)
+    
+    Retorna:
+        A razao (2.0 = gasta o dobro da referencia), ou None se a
+        referencia nao foi medida ou alguma das energias nao foi
+        ajustada (varredura)
+    """
+    referencia = procurar_referencia(resultado, resultados)
+    if referencia is None or resultado["energia"] is None or referencia["energia"] is None:
+        return None
+    if referencia["energia"] <= 0:
+        return None
+    return resultado["energia"] / referencia["energia"]
+
+
+def versao_nativa(nome):
+    """
+    Procura a versao em C (ALGORITMOS_C) do algoritmo base de um nome,
+    como "Merge Sort (C)" para "Merge Sort" ou "Merge Sort (numpy)"
+    
+    Retorna:
+        Tupla (nome, funcao), ou None se nao houver versao em C
+    """
+    base = nome.split("(")[0].strip().lower()
+    for candidato, funcao in ALGORITMOS_C:
+        if candidato.split("(")[0].strip().lower() == base:
+            return candidato, funcao
+    return None
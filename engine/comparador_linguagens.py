@@ -1,185 +1,127 @@
 """
 Comparador de performance entre linguagens
-Dados de benchmark em C, Java e Go
+Dados de benchmark em C, Java e Go, e a linha de base em C medida
+nesta maquina (veja ordenacao_nativa.py)
 """
 
 from rich.console import Console
 from rich.table import Table
 from rich import box
 
-console = Console()
-
-BENCHMARKS_C = {
-    "merge": {
-        1000: {"tempo": 0.000181, "cpu": 60.00, "energia": 0.00002, "co2": 0.0000},
-        10000: {"tempo": 0.002448, "cpu": 87.48, "energia": 0.000039, "co2": 0.0000},
-        100000: {"tempo": 0.025123, "cpu": 98.78, "energia": 0.000448, "co2": 0.0001}
-    },
-    "quick": {
-        1000: {"tempo": 0.000099, "cpu": 53.60, "energia": 0.00001, "co2": 0.0000},
-        10000: {"tempo": 0.000974, "cpu": 83.19, "energia": 0.000015, "co2": 0.0000},
-        100000: {"tempo": 0.008952, "cpu": 96.50, "energia": 0.000156, "co2": 0.0000}
-    },
-    "bubble": {
-        1000: {"tempo": 0.001254, "cpu": 88.28, "energia": 0.000020, "co2": 0.0000},
-        10000: {"tempo": 0.175015, "cpu": 99.86, "energia": 0.003155, "co2": 0.0007},
-        100000: {"tempo": 14.567331, "cpu": 100.00, "energia": 0.263017, "co2": 0.0613}
-    },
-    "insertion": {
-        1000: {"tempo": 0.000142, "cpu": 57.00, "energia": 0.00001, "co2": 0.0000},
-        10000: {"tempo": 0.014661, "cpu": 98.65, "energia": 0.000261, "co2": 0.0001},
-        100000: {"tempo": 1.486456, "cpu": 99.98, "energia": 0.026834, "co2": 0.0063}
-    }
-}
-
-BENCHMARKS_JAVA = {
-    "merge": {
-        1000: {"tempo": 0.000120, "cpu": 18.23, "energia": 0.0000, "co2": 0.0000},
-        10000: {"tempo": 0.000967, "cpu": 16.87, "energia": 0.00003, "co2": 0.0000},
-        100000: {"tempo": 0.012376, "cpu": 15.58, "energia": 0.000035, "co2": 0.0000}
-    },
-    "quick": {
-        1000: {"tempo": 0.000062, "cpu": 16.49, "energia": 0.0000, "co2": 0.0000},
-        10000: {"tempo": 0.000605, "cpu": 17.42, "energia": 0.00002, "co2": 0.0000},
-        100000: {"tempo": 0.007027, "cpu": 16.18, "energia": 0.000021, "co2": 0.0000}
-    },
-    "bubble": {
-        1000: {"tempo": 0.001039, "cpu": 16.85, "energia": 0.00003, "co2": 0.0000},
-        10000: {"tempo": 0.142538, "cpu": 15.89, "energia": 0.000408, "co2": 0.0001},
-        100000: {"tempo": 16.310651, "cpu": 15.50, "energia": 0.045614, "co2": 0.0106}
-    },
-    "insertion": {
-        1000: {"tempo": 0.000181, "cpu": 16.06, "energia": 0.00001, "co2": 0.0000},
-        10000: {"tempo": 0.007635, "cpu": 15.66, "energia": 0.000022, "co2": 0.0000},
-        100000: {"tempo": 0.855350, "cpu": 15.49, "energia": 0.002391, "co2": 0.0006}
-    }
-}
+# Os benchmarks ficam em benchmark/benchmarks.json (veja base_benchmarks.py)
+from base_benchmarks import obter_todos_benchmarks, listar_todos_tamanhos
 
-BENCHMARKS_GO = {
-    "merge": {
-        1000: {"tempo": 0.000098, "cpu": 40.50, "energia": 0.00001, "co2": 0.0000},
-        10000: {"tempo": 0.001292, "cpu": 54.00, "energia": 0.000013, "co2": 0.0000},
-        100000: {"tempo": 0.016760, "cpu": 67.50, "energia": 0.000204, "co2": 0.0000}
-    },
-    "quick": {
-        1000: {"tempo": 0.000061, "cpu": 40.50, "energia": 0.0000, "co2": 0.0000},
-        10000: {"tempo": 0.000559, "cpu": 54.00, "energia": 0.00005, "co2": 0.0000},
-        100000: {"tempo": 0.007117, "cpu": 67.50, "energia": 0.000087, "co2": 0.0000}
-    },
-    "bubble": {
-        1000: {"tempo": 0.000790, "cpu": 49.50, "energia": 0.00007, "co2": 0.0000},
-        10000: {"tempo": 0.111852, "cpu": 66.00, "energia": 0.001333, "co2": 0.0003},
-        100000: {"tempo": 15.387725, "cpu": 82.50, "energia": 0.229213, "co2": 0.0534}
-    },
-    "insertion": {
-        1000: {"tempo": 0.000091, "cpu": 49.50, "energia": 0.00001, "co2": 0.0000},
-        10000: {"tempo": 0.017150, "cpu": 66.00, "energia": 0.000204, "co2": 0.0000},
-        100000: {"tempo": 1.724546, "cpu": 82.50, "energia": 0.025689, "co2": 0.0060}
-    }
-}
+console = Console()
 
 
-def encontrar_tamanho_proximo(tamanho):
+def normalizar_algoritmo(nome):
     """
-    Encontra o tamanho de benchmark mais proximo do tamanho real
+    Converte o nome de um algoritmo para a chave usada nos benchmarks
+    Variantes como "Insertion Sort (binaria)" viram o algoritmo base
     """
-    tamanhos = [1000, 10000, 100000]
-    
-    tamanho_escolhido = tamanhos[0]
-    diferenca_minima = abs(tamanho - tamanhos[0])
+    if "(" in nome:
+        nome = nome[:nome.index("(")]
     
-    for t in tamanhos:
-        diferenca = abs(tamanho - t)
-        if diferenca < diferenca_minima:
-            diferenca_minima = diferenca
-            tamanho_escolhido = t
-    
-    return tamanho_escolhido
+    return nome.lower().replace(" sort", "").replace("sort", "").strip()
 
 
-def obter_benchmark(linguagem, algoritmo, tamanho):
+def nome_variante(nome):
     """
-    Busca dados de benchmark para uma linguagem especifica
+    Retorna o texto entre parenteses do nome de uma variante, ou None
     """
-    benchmarks = {
-        "c": BENCHMARKS_C,
-        "java": BENCHMARKS_JAVA,
-        "go": BENCHMARKS_GO
-    }
-    
-    if linguagem not in benchmarks:
-        return None
-    
-    dados = benchmarks[linguagem]
-    
-    if algoritmo not in dados:
+    if "(" not in nome or ")" not in nome:
         return None
     
-    tamanho_real = encontrar_tamanho_proximo(tamanho)
-    
-    if tamanho_real not in dados[algoritmo]:
-        return None
-    
-    return dados[algoritmo][tamanho_real]
+    return nome[nome.index("(") + 1:nome.index(")")]
 
 
-def obter_todos_benchmarks(algoritmo, tamanho):
-    """
-    Obtem benchmarks de todas as linguagens para um algoritmo
+def combinar_nativo(outras_linguagens, nativo):
     """
-    resultados = {}
+    Troca o benchmark de C da tabela pela medicao da versao em C nesta
+    maquina, com origem "local"
     
-    for linguagem in ["c", "java", "go"]:
-        dados = obter_benchmark(linguagem, algoritmo, tamanho)
-        if dados:
-            resultados[linguagem] = dados
+    Parametros:
+        outras_linguagens: Dicionario de obter_todos_benchmarks
+        nativo: Resultado da versao em C (backend "c"), ou None
     
-    return resultados
-
-
-def listar_todas_linguagens():
-    """Retorna lista de linguagens disponiveis"""
-    return ["c", "java", "go"]
-
-
-def listar_todos_algoritmos():
-    """Retorna lista de algoritmos disponiveis"""
-    return ["merge", "quick", "bubble", "insertion"]
-
-
-def listar_todos_tamanhos():
-    """Retorna lista de tamanhos disponiveis"""
-    return [1000, 10000, 100000]
-
-
-def mostrar_comparacao(resultado_python, algoritmo, tamanho):
+    Retorna:
+        Novo dicionario {linguagem: dados} (o mesmo conteudo sem nativo)
+    """
+    combinadas = dict(outras_linguagens)
+    if nativo is not None:
+        combinadas["c"] = {
+            "tempo": nativo["tempo"],
+            "cpu": nativo["cpu"],
+            "energia": nativo["energia"],
+            "co2": nativo["co2"],
+            "tamanho": nativo["tamanho"],
+            "origem": "local",
+        }
+    return combinadas
+
+
+def mostrar_comparacao(resultado_python, algoritmo, tamanho, variantes_python=None, nativo=None, referencia=None):
     """
     Mostra comparacao entre Python e outras linguagens em uma tabela
+    
+    Parametros:
+        resultado_python: Resultado do algoritmo original em Python
+        algoritmo: Nome do algoritmo
+        tamanho: Tamanho da lista usada
+        variantes_python: Resultados de variantes do mesmo algoritmo em
+            Python (opcional), mostrados como linhas extras
+        nativo: Resultado da versao em C medida nesta maquina na mesma
+            lista (opcional). Substitui o benchmark de C da tabela
+        referencia: Resultado da ordenacao pronta do Python (list.sort)
+            na mesma lista (opcional). Acrescenta a coluna vs. built-in,
+            com a energia de cada linha dividida pela dela
     """
     if not resultado_python:
         console.print("[red]Execute o algoritmo em Python primeiro.[/red]")
         return
     
-    alg_normalizado = algoritmo.lower().replace(" sort", "").replace("sort", "").strip()
-    tamanho_aproximado = encontrar_tamanho_proximo(tamanho)
-    outras_linguagens = obter_todos_benchmarks(alg_normalizado, tamanho_aproximado)
+    if variantes_python is None:
+        variantes_python = []
+    
+    # So entram variantes medidas com o mesmo tamanho e distribuicao
+    variantes_python = [
+        variante for variante in variantes_python
+        if variante.get("tamanho") == resultado_python.get("tamanho")
+        and variante.get("distribuicao") == resultado_python.get("distribuicao")
+        and variante.get("status", "ok") == "ok"
+    ]
+    
+    alg_normalizado = normalizar_algoritmo(algoritmo)
+    outras_linguagens = combinar_nativo(obter_todos_benchmarks(alg_normalizado, tamanho), nativo)
     
     if not outras_linguagens:
-        console.print(f"[yellow]Sem dados de benchmark para {algoritmo}.[/yellow]")
+        console.print(f"[yellow]Sem dados de benchmark para {algoritmo} com {tamanho:,} elementos.[/yellow]")
         return
     
-    if tamanho != tamanho_aproximado:
-        console.print(f"[yellow]Lista de {tamanho} elementos aproximada para {tamanho_aproximado:,}[/yellow]\n")
-    
-    tabela = Table(title=f"Comparacao: {algoritmo.upper()} (~{tamanho_aproximado:,} elementos)", box=box.ROUNDED)
+    tabela = Table(title=f"Comparacao: {algoritmo.upper()} ({tamanho:,} elementos)", box=box.ROUNDED)
     tabela.add_column("Linguagem", style="bold", justify="center")
     tabela.add_column("Tempo (s)", justify="right")
     tabela.add_column("CPU (%)", justify="right")
     tabela.add_column("Energia (Wh)", justify="right")
     tabela.add_column("CO2 (g)", justify="right")
     tabela.add_column("Speedup", justify="center")
+    tabela.add_column("Dados", justify="center", no_wrap=True)
+    if referencia is not None:
+        tabela.add_column("vs. built-in", justify="right")
+
+    def razao(dados):
+        if referencia is None:
+            return []
+        if referencia["energia"] <= 0 or dados["energia"] is None:
+            return [""]
+        return [f"{dados['energia'] / referencia['energia']:.2f}x"]
     
     tempo_python = resultado_python["tempo"]
+
+    def speedup(tempo):
+        if not tempo or tempo <= 0 or tempo_python is None:
+            return None
+        return tempo_python / tempo
     
     tabela.add_row(
         "[cyan]Python[/cyan]",
@@ -187,9 +129,26 @@ def mostrar_comparacao(resultado_python, algoritmo, tamanho):
         f"{resultado_python.get('cpu', 0):.2f}",
         f"{resultado_python['energia']:.6f}",
         f"{resultado_python['co2']:.4f}",
-        "[cyan]1.00x[/cyan]"
+        "[cyan]1.00x[/cyan]",
+        "medido",
+        *razao(resultado_python)
     )
     
+    for variante in variantes_python:
+        rotulo = nome_variante(variante["algoritmo"]) or variante["algoritmo"]
+        ganho = speedup(variante["tempo"])
+        
+        tabela.add_row(
+            f"[cyan]Python ({rotulo})[/cyan]",
+            f"{variante['tempo']:.6f}",
+            f"{variante.get('cpu', 0):.2f}",
+            f"{variante['energia']:.6f}",
+            f"{variante['co2']:.4f}",
+            f"[cyan]{ganho:.2f}x[/cyan]" if ganho is not None else "",
+            "medido",
+            *razao(variante)
+        )
+    
     linguagens_ordenadas = []
     for lang, dados in outras_linguagens.items():
         linguagens_ordenadas.append((lang, dados))
@@ -197,8 +156,15 @@ def mostrar_comparacao(resultado_python, algoritmo, tamanho):
     linguagens_ordenadas.sort(key=lambda x: x[1]["tempo"])
     
     for lang, dados in linguagens_ordenadas:
-        speedup = tempo_python / dados['tempo']
-        cor = "green" if speedup > 1 else "yellow"
+        ganho = speedup(dados["tempo"])
+        cor = "green" if ganho is not None and ganho > 1 else "yellow"
+        
+        # Tamanhos que nao foram medidos aparecem em italico
+        origem = dados["origem"]
+        if origem == "local":
+            origem = "[green]nesta maquina[/green]"
+        elif origem != "medido":
+            origem = f"[italic yellow]{origem}[/italic yellow]"
         
         tabela.add_row(
             f"[{cor}]{lang.upper()}[/{cor}]",
@@ -206,8 +172,32 @@ def mostrar_comparacao(resultado_python, algoritmo, tamanho):
             f"{dados['cpu']:.2f}",
             f"{dados['energia']:.6f}",
             f"{dados['co2']:.4f}",
-            f"[{cor}]{speedup:.2f}x[/{cor}]"
+            f"[{cor}]{ganho:.2f}x[/{cor}]" if ganho is not None else "",
+            origem,
+            *razao(dados)
         )
     
     console.print(tabela)
     console.print("\n[dim]Speedup > 1.00x significa que a linguagem e mais rapida que Python[/dim]")
+    if referencia is not None:
+        console.print(f"[dim]vs. built-in: energia dividida pela de {referencia['algoritmo']} "
+                      f"({referencia['energia']:.6f} Wh), medido na mesma lista[/dim]")
+    if nativo is not None:
+        console.print("[dim]C compilado com o compilador desta maquina e medido agora, na mesma lista e "
+                      "com o mesmo medidor do Python[/dim]")
+    if any(dados["origem"] in ["interpolado", "extrapolado"] for dados in outras_linguagens.values()):
+        medidos = ", ".join(f"{t:,}" for t in listar_todos_tamanhos())
+        console.print(f"[dim]Benchmarks medidos com {medidos} elementos; os outros tamanhos sao interpolados "
+                      f"em escala log-log entre os medidos (extrapolados se estiverem fora)[/dim]")
+    
+    for variante in variantes_python:
+        if alg_normalizado != "insertion" or not tempo_python or tempo_python <= 0 or variante["tempo"] is None:
+            continue
+        
+        # O Insertion Sort binario move os mesmos dados (em C), mas com
+        # O(n log n) comparacoes: a diferenca estima o custo do interpretador
+        fracao = (tempo_python - variante["tempo"]) / tempo_python * 100
+        console.print(
+            f"[dim]{variante['algoritmo']}: {fracao:.1f}% do tempo de {algoritmo} "
+            f"vem do interpretador, e nao da movimentacao de dados[/dim]"
+        )
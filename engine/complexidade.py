@@ -0,0 +1,143 @@
+"""
+Modulo de complexidade empirica
+Ajusta modelos de crescimento (n, n log n, n²) as medidas de um
+algoritmo em varios tamanhos e extrapola para tamanhos maiores
+"""
+import math
+
+# Modelos ajustados: custo = c * f(n)
+MODELOS = {
+    "n": lambda n: n,
+    "n log n": lambda n: n * math.log2(n),
+    "n²": lambda n: n ** 2,
+}
+
+
+def ajustar_potencia(tamanhos, valores):
+    """
+    Ajusta valor = c * n^k por minimos quadrados em escala log-log
+    (uma reta cuja inclinacao e o expoente k)
+    
+    Parametros:
+        tamanhos: Lista de tamanhos (n)
+        valores: Lista de medidas (tempo, energia...) de cada tamanho
+    
+    Retorna:
+        Tupla (expoente, coeficiente, r2), com o r2 da reta em log-log,
+        ou None se houver menos de dois tamanhos diferentes
+    """
+    xs = [math.log(n) for n in tamanhos]
+    ys = [math.log(v) for v in valores]
+    
+    if len(set(xs)) < 2:
+        return None
+    
+    media_x = sum(xs) / len(xs)
+    media_y = sum(ys) / len(ys)
+    
+    numerador = 0.0
+    denominador = 0.0
+    for x, y in zip(xs, ys):
+        numerador = numerador + (x - media_x) * (y - media_y)
+        denominador = denominador + (x - media_x) ** 2
+    
+    expoente = numerador / denominador
+    coeficiente = math.exp(media_y - expoente * media_x)
+    
+    previstos = [math.log(coeficiente) + expoente * x for x in xs]
+    
+    return expoente, coeficiente, coeficiente_r2(ys, previstos)
+
+
+def ajustar_modelo(tamanhos, valores, modelo):
+    """
+    Ajusta valor = c * f(n) para um dos MODELOS
+    
+    O coeficiente minimiza o erro relativo (soma de ((c * f(n) - v) / v)²),
+    para que os tamanhos pequenos pesem tanto quanto os grandes. O r2
+    e calculado em escala log, como em ajustar_potencia
+    
+    Retorna:
+        Tupla (coeficiente, r2)
+    """
+    funcao = MODELOS[modelo]
+    
+    numerador = 0.0
+    denominador = 0.0
+    for n, v in zip(tamanhos, valores):
+        razao = funcao(n) / v
+        numerador = numerador + razao
+        denominador = denominador + razao ** 2
+    
+    coeficiente = numerador / denominador
+    
+    ys = [math.log(v) for v in valores]
+    previstos = [math.log(coeficiente * funcao(n)) for n in tamanhos]
+    
+    return coeficiente, coeficiente_r2(ys, previstos)
+
+
+def ajustar_complexidade(tamanhos, valores):
+    """
+    Ajusta o expoente livre e os MODELOS as medidas de um algoritmo
+    
+    Medidas com valor zero (ou negativo) sao ignoradas, ja que os
+    ajustes sao em escala log. Tamanhos menores que 2 tambem, porque
+    n log n seria zero
+    
+    Parametros:
+        tamanhos: Lista de tamanhos (n)
+        valores: Lista de medidas de cada tamanho
+    
+    Retorna:
+        Dicionario com expoente, coeficiente e r2 do ajuste c * n^k,
+        modelos ({nome: {coeficiente, r2}}) e modelo (o de maior r2),
+        ou None se houver menos de dois tamanhos validos
+    """
+    pontos = [(n, v) for n, v in zip(tamanhos, valores) if n >= 2 and v > 0]
+    tamanhos = [n for n, v in pontos]
+    valores = [v for n, v in pontos]
+    
+    potencia = ajustar_potencia(tamanhos, valores)
+    if potencia is None:
+        return None
+    
+    modelos = {}
+    for nome in MODELOS:
+        coeficiente, r2 = ajustar_modelo(tamanhos, valores, nome)
+        modelos[nome] = {"coeficiente": coeficiente, "r2": r2}
+    
+    melhor = max(modelos, key=lambda nome: modelos[nome]["r2"])
+    
+    return {
+        "expoente": potencia[0],
+        "coeficiente": potencia[1],
+        "r2": potencia[2],
+        "modelos": modelos,
+        "modelo": melhor,
+    }
+
+
+def extrapolar(ajuste, tamanho):
+    """
+    Valor previsto pelo melhor modelo de ajustar_complexidade
+    """
+    modelo = ajuste["modelo"]
+    return ajuste["modelos"][modelo]["coeficiente"] * MODELOS[modelo](tamanho)
+
+
+def coeficiente_r2(ys, previstos):
+    """
+    Coeficiente de determinacao (1 = ajuste perfeito)
+    """
+    media = sum(ys) / len(ys)
+    
+    residuos = 0.0
+    total = 0.0
+    for y, previsto in zip(ys, previstos):
+        residuos = residuos + (y - previsto) ** 2
+        total = total + (y - media) ** 2
+    
+    if total == 0:
+        return 1.0
+    return 1 - residuos / total
@@ -0,0 +1,288 @@
+"""
+Modulo para contar as operacoes de um algoritmo
+Conta comparacoes entre elementos (com elementos que contam as proprias
+comparacoes), escritas de elementos e a profundidade de chamadas com o
+sys.monitoring do Python (PEP 669)
+"""
+import dis
+import os
+import sys
+
+NOME_FERRAMENTA = "contador_operacoes"
+
+# Identificadores do sys.monitoring tentados, em ordem (0, 1 e 5 ficam
+# para depuradores, cobertura e otimizadores)
+FERRAMENTAS = [sys.monitoring.PROFILER_ID, 3, 4]
+
+# Instrucoes contadas e o contador de cada uma
+INSTRUCOES = {
+    "STORE_SUBSCR": "escritas",
+}
+
+# Comparacoes feitas pelos elementos da contagem em andamento
+COMPARACOES = {"total": 0}
+
+# Metodos de lista que gravam elementos (cada elemento novo e uma escrita)
+METODOS_ESCRITA = [list.append, list.insert, list.extend]
+
+# Se uma contagem anterior desligou eventos com sys.monitoring.DISABLE
+DESLIGAMENTOS = {"pendentes": False}
+
+
+class ElementoContado(int):
+    """
+    Inteiro que conta cada comparacao feita com ele, no codigo Python
+    ou em C (bisect, list.sort, min...). Contas com ele dao inteiros
+    comuns, entao indices e contadores derivados dos valores nao contam
+    """
+    __slots__ = ()
+    __hash__ = int.__hash__
+
+    def __lt__(self, outro):
+        COMPARACOES["total"] += 1
+        return int.__lt__(self, outro)
+
+    def __le__(self, outro):
+        COMPARACOES["total"] += 1
+        return int.__le__(self, outro)
+
+    def __gt__(self, outro):
+        COMPARACOES["total"] += 1
+        return int.__gt__(self, outro)
+
+    def __ge__(self, outro):
+        COMPARACOES["total"] += 1
+        return int.__ge__(self, outro)
+
+    def __eq__(self, outro):
+        COMPARACOES["total"] += 1
+        return int.__eq__(self, outro)
+
+    def __ne__(self, outro):
+        COMPARACOES["total"] += 1
+        return int.__ne__(self, outro)
+
+
+def contar_operacoes(funcao, lista, *args):
+    """
+    Executa a funcao contando as operacoes feitas pelo codigo Python
+    do modulo onde ela foi definida (a funcao e as auxiliares dela)
+    
+    - comparacoes: comparacoes entre elementos da lista (<, >, ==...),
+      onde quer que sejam feitas, inclusive em C (bisect, list.sort).
+      Os elementos sao trocados por ElementoContado, entao comparacoes
+      de indices, como em "while i < n", nao entram
+    - escritas: elementos gravados em listas (lista[i] = x e cada
+      elemento acrescentado por append, insert e extend). Uma troca
+      a, b = b, a sao duas escritas. Deslocamentos feitos dentro do
+      list.insert, em C, nao entram
+    - profundidade_maxima: maior numero de chamadas aninhadas das
+      funcoes do modulo (1 para uma funcao sem recursao). Chamadas que
+      saem por excecao e geradores pausados (yield) tambem saem da
+      profundidade
+    
+    Os eventos so sao ligados para as funcoes do modulo e so durante
+    esta chamada, entao o resto do programa nao fica mais lento. Cada
+    instrucao que nao e contada desliga o proprio evento na primeira
+    vez (sys.monitoring.DISABLE)
+    
+    Quando a contagem nao enxerga o algoritmo, comparacoes e escritas
+    ficam None: entradas que nao sao listas (vetores do NumPy, da
+    versao em C) e algoritmos que ordenam fora dos elementos recebidos
+    (como o Merge Sort paralelo, nos processos filhos), o que aparece
+    como nenhuma comparacao em uma lista de 2 ou mais elementos
+    
+    Parametros:
+        funcao: A funcao que sera executada
+        lista: Lista a ordenar (primeiro argumento da funcao)
+        *args: Outros argumentos da funcao
+    
+    Retorna:
+        Dicionario com comparacoes, escritas e profundidade_maxima
+    """
+    monitoramento = sys.monitoring
+    eventos = monitoramento.events
+    
+    # As posicoes sao procuradas pelo id do codigo: o hash de um objeto
+    # de codigo percorre o bytecode inteiro e custaria caro a cada evento
+    codigos = codigos_do_modulo(funcao)
+    instrucoes = {}
+    for codigo in codigos:
+        instrucoes[id(codigo)] = instrucoes_contadas(codigo)
+    
+    contagens = {
+        "comparacoes": None,
+        "escritas": 0,
+        "profundidade_maxima": 0,
+    }
+    profundidade = [0]
+    
+    # Lista e tamanho dela antes de cada metodo de escrita em andamento
+    pendentes = []
+
+    def ao_executar(codigo, posicao):
+        contador = instrucoes[id(codigo)].get(posicao)
+        if contador is None:
+            return monitoramento.DISABLE
+        contagens[contador] += 1
+
+    def ao_chamar(codigo, posicao, chamada, argumento):
+        lista = lista_escrita(chamada, argumento)
+        if lista is None:
+            return monitoramento.DISABLE
+        pendentes.append((lista, len(lista)))
+
+    def ao_retornar_c(codigo, posicao, chamada, argumento):
+        if pendentes and pendentes[-1][0] is lista_escrita(chamada, argumento):
+            lista, tamanho = pendentes.pop()
+            contagens["escritas"] += max(0, len(lista) - tamanho)
+
+    def ao_entrar(codigo, posicao):
+        profundidade[0] += 1
+        if profundidade[0] > contagens["profundidade_maxima"]:
+            contagens["profundidade_maxima"] = profundidade[0]
+
+    def ao_sair(codigo, posicao, valor):
+        profundidade[0] -= 1
+    
+    # PY_THROW e PY_UNWIND nao sao eventos locais: chegam de qualquer
+    # codigo e so contam os do modulo
+    def ao_lancar(codigo, posicao, excecao):
+        if id(codigo) in instrucoes:
+            ao_entrar(codigo, posicao)
+
+    def ao_desempilhar(codigo, posicao, excecao):
+        if id(codigo) in instrucoes:
+            ao_sair(codigo, posicao, excecao)
+    
+    ferramenta = reservar_ferramenta()
+    try:
+        monitoramento.register_callback(ferramenta, eventos.INSTRUCTION, ao_executar)
+        monitoramento.register_callback(ferramenta, eventos.CALL, ao_chamar)
+        monitoramento.register_callback(ferramenta, eventos.C_RETURN, ao_retornar_c)
+        monitoramento.register_callback(ferramenta, eventos.C_RAISE, ao_retornar_c)
+        monitoramento.register_callback(ferramenta, eventos.PY_START, ao_entrar)
+        monitoramento.register_callback(ferramenta, eventos.PY_RESUME, ao_entrar)
+        monitoramento.register_callback(ferramenta, eventos.PY_THROW, ao_lancar)
+        monitoramento.register_callback(ferramenta, eventos.PY_RETURN, ao_sair)
+        monitoramento.register_callback(ferramenta, eventos.PY_YIELD, ao_sair)
+        monitoramento.register_callback(ferramenta, eventos.PY_UNWIND, ao_desempilhar)
+        
+        # Os eventos desligados com DISABLE continuam desligados na proxima
+        # contagem (liberar o identificador nao os religa) e o sys.monitoring
+        # so tem como religa-los para todas as ferramentas de uma vez. Sem
+        # isso, um CALL desligado por chamar outra funcao em uma contagem
+        # nao veria um append na seguinte. Para as outras ferramentas o
+        # custo e um evento a mais por instrucao desligada, que elas
+        # desligam de novo; por isso so e feito depois de uma contagem
+        if DESLIGAMENTOS["pendentes"]:
+            monitoramento.restart_events()
+        DESLIGAMENTOS["pendentes"] = True
+        monitoramento.set_events(ferramenta, eventos.PY_THROW | eventos.PY_UNWIND)
+        for codigo in codigos:
+            monitoramento.set_local_events(ferramenta, codigo, eventos.INSTRUCTION | eventos.CALL
+                                           | eventos.PY_START | eventos.PY_RESUME
+                                           | eventos.PY_RETURN | eventos.PY_YIELD)
+        
+        visivel = isinstance(lista, list)
+        if visivel:
+            lista = [ElementoContado(valor) for valor in lista]
+        COMPARACOES["total"] = 0
+        funcao(lista, *args)
+    finally:
+        monitoramento.set_events(ferramenta, eventos.NO_EVENTS)
+        for codigo in codigos:
+            monitoramento.set_local_events(ferramenta, codigo, eventos.NO_EVENTS)
+        monitoramento.free_tool_id(ferramenta)
+    
+    contagens["comparacoes"] = COMPARACOES["total"]
+    if not visivel or (len(lista) > 1 and contagens["comparacoes"] == 0):
+        contagens["comparacoes"] = None
+        contagens["escritas"] = None
+    
+    return contagens
+
+
+def lista_escrita(chamada, argumento):
+    """
+    Se a chamada for um metodo de escrita de lista, retorna a lista
+    (o metodo pode vir ligado, lista.append, ou solto, com a lista
+    como primeiro argumento, como o interpretador passa em lista.append(x))
+    """
+    if chamada in METODOS_ESCRITA:
+        if isinstance(argumento, list):
+            return argumento
+        return None
+    
+    dono = getattr(chamada, "__self__", None)
+    if isinstance(dono, list) and getattr(list, getattr(chamada, "__name__", ""), None) in METODOS_ESCRITA:
+        return dono
+    return None
+
+
+def reservar_ferramenta():
+    """
+    Reserva um identificador livre do sys.monitoring
+    """
+    for ferramenta in FERRAMENTAS:
+        if sys.monitoring.get_tool(ferramenta) is None:
+            sys.monitoring.use_tool_id(ferramenta, NOME_FERRAMENTA)
+            return ferramenta
+    
+    raise RuntimeError("Nenhum identificador do sys.monitoring esta livre para contar operacoes")
+
+
+def codigos_do_modulo(funcao):
+    """
+    Lista os objetos de codigo das funcoes do modulo onde a funcao foi
+    definida (e das funcoes internas a elas), e dos modulos da mesma
+    pasta de onde ele importa funcoes, como o merge_sort_buffer que o
+    Merge Sort paralelo usa em listas pequenas
+    """
+    funcoes = [funcao]
+    modulo = sys.modules.get(funcao.__module__)
+    pasta = os.path.dirname(getattr(modulo, "__file__", None) or "")
+    
+    nomes = [funcao.__module__]
+    visitados = []
+    while nomes:
+        nome = nomes.pop()
+        modulo = sys.modules.get(nome)
+        if nome in visitados or modulo is None:
+            continue
+        visitados.append(nome)
+        for valor in vars(modulo).values():
+            if not hasattr(valor, "__code__"):
+                continue
+            origem = sys.modules.get(getattr(valor, "__module__", None))
+            if origem is None or os.path.dirname(getattr(origem, "__file__", None) or "") != pasta:
+                continue
+            funcoes.append(valor)
+            nomes.append(origem.__name__)
+    
+    codigos = []
+    pendentes = [f.__code__ for f in funcoes]
+    while pendentes:
+        codigo = pendentes.pop()
+        if codigo in codigos:
+            continue
+        codigos.append(codigo)
+        for constante in codigo.co_consts:
+            if hasattr(constante, "co_code"):
+                pendentes.append(constante)
+    
+    return codigos
+
+
+def instrucoes_contadas(codigo):
+    """
+    Mapeia a posicao de cada instrucao contada no codigo para o nome
+    do contador dela
+    """
+    posicoes = {}
+    
+    for instrucao in dis.get_instructions(codigo):
+        if instrucao.opname in INSTRUCOES:
+            posicoes[instrucao.offset] = INSTRUCOES[instrucao.opname]
+    
+    return posicoes
@@ -0,0 +1,82 @@
+"""
+Modulo de estatisticas das medicoes
+Resume as repeticoes de um algoritmo com medidas robustas
+"""
+import random
+import statistics
+
+# Quantas reamostragens o bootstrap faz para o intervalo de confianca
+REAMOSTRAGENS = 1000
+
+
+def resumir(valores, confianca=0.95, reamostragens=REAMOSTRAGENS, semente=0):
+    """
+    Resume uma lista de medicoes
+    
+    O intervalo de confianca e da mediana, calculado por bootstrap:
+    a lista e reamostrada com reposicao varias vezes e o intervalo
+    vai dos percentis (1 - confianca) / 2 ate (1 + confianca) / 2
+    das medianas obtidas
+    
+    Parametros:
+        valores: Lista de medicoes (tempos, energias...)
+        confianca: Nivel do intervalo de confianca (padrao: 95%)
+        reamostragens: Numero de reamostragens do bootstrap
+        semente: Semente das reamostragens (mesma lista, mesmo intervalo)
+    
+    Retorna:
+        Dicionario com n, minimo, mediana, media, desvio, iqr,
+        ic_inferior e ic_superior
+    """
+    n = len(valores)
+    
+    if n == 0:
+        return None
+    
+    mediana = statistics.median(valores)
+    
+    desvio = 0.0
+    iqr = 0.0
+    ic_inferior = mediana
+    ic_superior = mediana
+    
+    if n > 1:
+        desvio = statistics.stdev(valores)
+        quartis = statistics.quantiles(valores, n=4, method="inclusive")
+        iqr = quartis[2] - quartis[0]
+        ic_inferior, ic_superior = intervalo_bootstrap(valores, confianca, reamostragens, semente)
+    
+    return {
+        "n": n,
+        "minimo": min(valores),
+        "mediana": mediana,
+        "media": statistics.fmean(valores),
+        "desvio": desvio,
+        "iqr": iqr,
+        "ic_inferior": ic_inferior,
+        "ic_superior": ic_superior,
+    }
+
+
+def intervalo_bootstrap(valores, confianca=0.95, reamostragens=REAMOSTRAGENS, semente=0):
+    """
+    Intervalo de confianca da mediana por bootstrap de percentis
+    
+    Retorna:
+        Tupla (inferior, superior)
+    """
+    gerador = random.Random(semente)
+    n = len(valores)
+    
+    medianas = []
+    for _ in range(reamostragens):
+        amostra = gerador.choices(valores, k=n)
+        medianas.append(statistics.median(amostra))
+    
+    medianas.sort()
+    
+    alfa = (1 - confianca) / 2
+    inferior = medianas[int(alfa * (reamostragens - 1))]
+    superior = medianas[int((1 - alfa) * (reamostragens - 1))]
+    
+    return inferior, superior
@@ -0,0 +1,147 @@
+"""
+Modulo de execucao dos algoritmos
+Mede um algoritmo (no pool de medicao ou direto) e monta o resultado
+com tempo, CPU, energia e CO2, usado pelo menu e por python -m engine
+"""
+import numpy as np
+
+from medidor_desempenho import medir_repeticoes
+from pool_medicao import medir_no_pool
+from estatisticas import resumir
+from amostrador_cpu import resumir_serie
+from impacto_ambiental import calcular_impacto
+from catalogo import PARALELOS
+
+
+def preparar_entrada(lista, backend):
+    """
+    Cria a copia da lista no formato usado pelo backend
+    (lista Python, ou vetor NumPy int64 para os backends numpy e c)
+    As listas geradas ficam em vetores int64 e so viram listas Python aqui
+    """
+    if backend != "python":
+        return np.array(lista, dtype=np.int64)
+    if isinstance(lista, np.ndarray):
+        return lista.tolist()
+    return lista[:]
+
+
+def medir_algoritmo(nome, funcao, lista, backend="python", semente=None, distribuicao="manual", pool=None,
+                    repeticoes=5, aquecimento=1, trabalhador=None, **opcoes):
+    """
+    Mede um algoritmo e monta o resultado
+    
+    O algoritmo roda as vezes de aquecimento e de repeticoes, cada vez
+    com uma copia nova da lista. Tempo, CPU, energia e CO2 do resultado
+    sao as medianas das repeticoes (por chamada, quando a lista e pequena
+    e as chamadas sao medidas em lotes), e as listas "tempos", "energias"
+    e "co2s" guardam todas as medicoes. Se o algoritmo passar dos limites
+    ele e interrompido, e o resultado fica marcado com o status e so com
+    a execucao interrompida
+    
+    Com um pool as medicoes rodam no processo dele, que so recebe uma
+    vez as listas geradas pela semente
+    
+    Parametros:
+        nome: Nome do algoritmo
+        funcao: Funcao de ordenacao
+        lista: Lista de entrada (lista Python ou vetor NumPy)
+        backend: "python", "numpy" ou "c" (linha de base nativa)
+        semente: Semente que gerou a lista (None = lista digitada)
+        distribuicao: Distribuicao que gerou a lista
+        pool: Pool criado com criar_pool (None = medir sem pool)
+        repeticoes: Numero de execucoes medidas
+        aquecimento: Numero de execucoes descartadas antes
+        trabalhador: Indice do processo do pool que mede (padrao: rodizio)
+        **opcoes: Opcoes de medir_repeticoes (limite_tempo,
+            limite_memoria_mb, medir_memoria, contar, duracao_minima,
+            intervalo_amostragem, alta_resolucao)
+    
+    Retorna:
+        Tupla (resultado, medicao): o resultado montado (None se o
+        algoritmo falhou) e a medicao de medir_repeticoes, com status
+        "erro" e a mensagem em "erro" se falhou
+    """
+    # As listas geradas sao identificadas pela semente, e o processo de
+    # medicao so as recebe uma vez. Listas digitadas vao sempre
+    chave = None
+    if semente is not None and isinstance(lista, np.ndarray):
+        chave = (distribuicao, semente, len(lista))
+    
+    formato = "lista" if backend == "python" else "vetor"
+    
+    try:
+        if pool is not None:
+            medicao = medir_no_pool(pool, funcao, lista, formato, chave, repeticoes, aquecimento,
+                                    fixar_nucleo=nome not in PARALELOS, trabalhador=trabalhador, **opcoes)
+        else:
+            medicao = medir_repeticoes(funcao, lambda: preparar_entrada(lista, backend), repeticoes,
+                                       aquecimento, **opcoes)
+    except RecursionError:
+        return None, {"status": "erro", "erro": "excedeu o limite de recursao do Python para esta lista"}
+    
+    if medicao["status"] == "erro":
+        return None, medicao
+    
+    medicoes = medicao["medicoes"]
+    if medicao["status"] != "ok":
+        # Vale a execucao interrompida, sozinha
+        medicoes = [medicao]
+    
+    tempos = []
+    cpus = []
+    energias = []
+    co2s = []
+    fonte_energia = "medida"
+    for repeticao in medicoes:
+        impacto = calcular_impacto(repeticao["tempo_execucao"], repeticao["uso_cpu_percent"],
+                                   energia_medida_Wh=repeticao["energia_medida_Wh"],
+                                   serie_cpu=repeticao["serie_cpu"])
+        # Basta uma repeticao sem medida para a serie ser do modelo
+        if impacto["fonte_energia"] == "modelo":
+            fonte_energia = "modelo"
+        tempos.append(repeticao["tempo_execucao"])
+        cpus.append(repeticao["uso_cpu_percent"])
+        energias.append(impacto["energia_Wh"])
+        co2s.append(impacto["emissao_CO2_g"])
+    
+    resumo_tempo = resumir(tempos)
+    
+    # A serie de CPU da repeticao mais proxima da mediana
+    serie = None
+    if medicao["serie_cpu"] is not None:
+        mais_proxima = min(medicoes, key=lambda m: abs(m["tempo_execucao"] - resumo_tempo["mediana"]))
+        serie = resumir_serie(mais_proxima["serie_cpu"])
+    operacoes = medicao.get("operacoes")
+    
+    resultado = {
+        "algoritmo": nome,
+        "tempo": resumo_tempo["mediana"],
+        "cpu": resumir(cpus)["mediana"],
+        "energia": resumir(energias)["mediana"],
+        "co2": resumir(co2s)["mediana"],
+        "repeticoes": len(tempos),
+        "chamadas": medicao["chamadas"],
+        "comparacoes": operacoes["comparacoes"] if operacoes else None,
+        "escritas": operacoes["escritas"] if operacoes else None,
+        "profundidade_maxima": operacoes["profundidade_maxima"] if operacoes else None,
+        "tempo_iqr": resumo_tempo["iqr"],
+        "tempos": tempos,
+        "energias": energias,
+        "co2s": co2s,
+        "fonte_energia": fonte_energia,
+        "memoria_pico_bytes": medicao["memoria_pico_bytes"],
+        "alocacoes": medicao["alocacoes"],
+        "rss_delta_bytes": medicao["rss_delta_bytes"],
+        "cpu_pico": serie["cpu_pico"] if serie else None,
+        "frequencia_media_mhz": serie["frequencia_media_mhz"] if serie else None,
+        "amostras_cpu": serie["amostras"] if serie else None,
+        "backend": backend,
+        "tamanho": len(lista),
+        "distribuicao": distribuicao,
+        "semente": semente,
+        "status": medicao["status"],
+        "tempo_estimado": resumo_tempo["mediana"] if medicao["status"] == "ok" else medicao["tempo_estimado"],
+    }
+    
+    return resultado, medicao
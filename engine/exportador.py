@@ -0,0 +1,398 @@
+"""
+Modulo de exportacao em varios formatos
+Grava resultados em blocos, sem juntar todos na memoria: CSV e JSON
+Lines (com ou sem gzip) e um formato colunar (Parquet, se o pyarrow
+estiver instalado, ou um .npz do NumPy com as colunas de cada bloco)
+As colunas e os tipos vem dos proprios resultados
+"""
+import csv
+import gzip
+import json
+import os
+import sys
+import zipfile
+
+import numpy as np
+
+from exportador_csv import colunas_resultados, linha_resultado
+from banco_resultados import COLUNAS_MEDIDAS, COLUNAS_LISTAS, TIPOS
+
+# Resultados gravados de cada vez (e por parte do .npz)
+TAMANHO_BLOCO = 10_000
+
+# Extensao de cada formato
+EXTENSOES = {
+    "csv": ".csv",
+    "csv.gz": ".csv.gz",
+    "jsonl": ".jsonl",
+    "jsonl.gz": ".jsonl.gz",
+    "parquet": ".parquet",
+    "npz": ".npz",
+}
+
+# Formatos gravados linha a linha (os outros sao colunares)
+FORMATOS_TEXTO = ["csv", "csv.gz", "jsonl", "jsonl.gz"]
+
+
+def parquet_disponivel():
+    """
+    Verifica se o pyarrow (Parquet) esta instalado
+    """
+    try:
+        import pyarrow.parquet
+    except ImportError:
+        return False
+    return True
+
+
+def escolher_formato(arquivo, formato=None, padrao="csv"):
+    """
+    Formato de uma exportacao
+    
+    Parametros:
+        arquivo: Nome do arquivo
+        formato: Formato pedido, "colunar" ou None (pela extensao do
+            arquivo). Parquet, pedido ou pela extensao, vira npz se o
+            pyarrow nao estiver instalado
+        padrao: Formato de arquivos sem extensao conhecida
+    """
+    if formato is None:
+        formato = padrao
+        for nome, extensao in EXTENSOES.items():
+            if str(arquivo).endswith(extensao):
+                formato = nome
+                break
+    elif formato != "colunar" and formato not in EXTENSOES:
+        raise ValueError(f"Formato desconhecido: {formato}")
+    
+    if formato in ["colunar", "parquet"]:
+        return "parquet" if parquet_disponivel() else "npz"
+    return formato
+
+
+def tipo_coluna(coluna, valores):
+    """
+    Tipo de uma coluna nos formatos colunares: "numero", "texto" ou
+    "lista" (de numeros). As colunas do banco tem o tipo de la; as
+    outras, o dos valores (valores de tipos diferentes viram texto)
+    """
+    if coluna in COLUNAS_LISTAS:
+        return "lista"
+    if coluna in COLUNAS_MEDIDAS:
+        return "texto" if TIPOS.get(coluna) == "TEXT" else "numero"
+    
+    tipo = None
+    for valor in valores:
+        if valor is None:
+            continue
+        if isinstance(valor, (list, tuple)):
+            atual = "lista"
+        elif isinstance(valor, (int, float, np.number)) and not isinstance(valor, bool):
+            atual = "numero"
+        else:
+            atual = "texto"
+        if tipo is not None and tipo != atual:
+            return "texto"
+        tipo = atual
+    return tipo or "texto"
+
+
+def abrir_exportacao(arquivo, formato=None, colunas=None, acrescentar=False, tamanho_bloco=TAMANHO_BLOCO):
+    """
+    Abre uma exportacao, que recebe resultados em escrever_resultados
+    e termina em fechar_exportacao
+    
+    Sem colunas, elas vem do primeiro bloco: as COLUNAS_RESULTADOS e
+    as outras chaves dos resultados dele. No CSV e nos formatos
+    colunares, chaves que so aparecem depois ficam de fora; o JSON Lines
+    grava cada resultado inteiro
+    
+    Parametros:
+        arquivo: Nome do arquivo ("-" para a saida padrao, so em csv e jsonl)
+        formato: Veja escolher_formato (None = pela extensao)
+        colunas: Colunas exportadas (None = do primeiro bloco)
+        acrescentar: Grava no fim de um arquivo existente, com as colunas
+            dele (Parquet nao permite; o npz ganha partes novas, ou e
+            gravado de novo se nao tiver colunas)
+        tamanho_bloco: Resultados guardados antes de gravar
+    
+    Retorna:
+        Dicionario com o estado da exportacao. Sem o pyarrow, um arquivo
+        .parquet vira .npz e o nome gravado fica em "arquivo" (se esse
+        .npz ja existir, so acrescentando; senao, ValueError)
+    """
+    formato = escolher_formato(arquivo, formato)
+    if formato == "npz" and str(arquivo).endswith(EXTENSOES["parquet"]):
+        arquivo = str(arquivo)[:-len(EXTENSOES["parquet"])] + EXTENSOES["npz"]
+        if not acrescentar and os.path.exists(arquivo):
+            raise ValueError(f"pyarrow nao instalado e {arquivo} ja existe: "
+                             f"use outro nome ou acrescente ao arquivo")
+    if arquivo == "-" and formato not in ["csv", "jsonl"]:
+        raise ValueError(f"O formato {formato} precisa de um arquivo")
+    
+    existente = acrescentar and arquivo != "-" and os.path.exists(arquivo) and os.path.getsize(arquivo) > 0
+    if existente and formato == "parquet":
+        raise ValueError("Parquet nao permite acrescentar a um arquivo existente (use npz, csv ou jsonl)")
+    
+    exportacao = {
+        "arquivo": arquivo,
+        "formato": formato,
+        "colunas": colunas,
+        "tipos": None,
+        "existente": existente,
+        "tamanho_bloco": tamanho_bloco,
+        "bloco": [],
+        "linhas": 0,
+        "saida": None,
+        "escritor": None,
+        "zip": None,
+        "partes": 0,
+        "parquet": None,
+    }
+    
+    if formato == "npz":
+        modo = "a" if existente else "w"
+        exportacao["zip"] = zipfile.ZipFile(arquivo, modo, compression=zipfile.ZIP_DEFLATED, allowZip64=True)
+        if existente:
+            esquema = json.loads(exportacao["zip"].read("esquema.json"))
+            if esquema["colunas"]:
+                # As colunas e os tipos ficam os do arquivo
+                exportacao["colunas"] = esquema["colunas"]
+                exportacao["tipos"] = esquema["tipos"]
+                exportacao["partes"] = contar_partes(exportacao["zip"])
+            else:
+                # Exportacao vazia (so o esquema): o arquivo e gravado de novo,
+                # com as colunas do primeiro bloco
+                exportacao["zip"].close()
+                exportacao["zip"] = zipfile.ZipFile(arquivo, "w", compression=zipfile.ZIP_DEFLATED, allowZip64=True)
+                exportacao["existente"] = False
+    
+    if formato in FORMATOS_TEXTO:
+        if existente and formato.startswith("csv"):
+            abrir = gzip.open if formato.endswith(".gz") else open
+            with abrir(arquivo, "rt", newline="", encoding="utf-8") as anterior:
+                exportacao["colunas"] = next(csv.reader(anterior))
+        
+        if arquivo == "-":
+            exportacao["saida"] = sys.stdout
+        elif formato.endswith(".gz"):
+            # Acrescentar em gzip cria um membro novo, que os leitores de gzip juntam
+            exportacao["saida"] = gzip.open(arquivo, "at" if acrescentar else "wt", newline="", encoding="utf-8")
+        else:
+            exportacao["saida"] = open(arquivo, "a" if acrescentar else "w", newline="", encoding="utf-8")
+    
+    return exportacao
+
+
+def contar_partes(arquivo_zip):
+    """
+    Numero de partes ja gravadas em um .npz de exportacao
+    """
+    partes = set()
+    for nome in arquivo_zip.namelist():
+        if "/" in nome:
+            partes.add(nome.rsplit("/", 1)[1])
+    return len(partes)
+
+
+def escrever_resultados(exportacao, resultados):
+    """
+    Inclui resultados na exportacao, gravando um bloco sempre que
+    juntar tamanho_bloco resultados
+    
+    Parametros:
+        exportacao: Estado de abrir_exportacao
+        resultados: Qualquer sequencia de resultados, inclusive um gerador
+            (como iterar_resultados do banco)
+    """
+    for resultado in resultados:
+        exportacao["bloco"].append(resultado)
+        if len(exportacao["bloco"]) >= exportacao["tamanho_bloco"]:
+            gravar_bloco(exportacao)
+
+
+def gravar_bloco(exportacao):
+    """
+    Grava os resultados guardados na exportacao
+    """
+    bloco = exportacao["bloco"]
+    if not bloco:
+        return
+    
+    if exportacao["colunas"] is None:
+        exportacao["colunas"] = colunas_resultados(bloco)
+    colunas = exportacao["colunas"]
+    formato = exportacao["formato"]
+    
+    if formato in FORMATOS_TEXTO:
+        saida = exportacao["saida"]
+        if formato.startswith("jsonl"):
+            for resultado in bloco:
+                saida.write(json.dumps(resultado, default=str) + "\n")
+        else:
+            if exportacao["escritor"] is None:
+                exportacao["escritor"] = csv.DictWriter(saida, fieldnames=colunas)
+                if not exportacao["existente"]:
+                    exportacao["escritor"].writeheader()
+            for resultado in bloco:
+                exportacao["escritor"].writerow(linha_resultado(resultado, colunas))
+        saida.flush()
+    else:
+        if exportacao["tipos"] is None:
+            exportacao["tipos"] = {coluna: tipo_coluna(coluna, [r.get(coluna) for r in bloco]) for coluna in colunas}
+        valores = {}
+        for coluna in colunas:
+            valores[coluna] = valores_coluna(bloco, coluna, exportacao["tipos"][coluna])
+        if formato == "npz":
+            gravar_parte_npz(exportacao, valores)
+        else:
+            gravar_bloco_parquet(exportacao, valores)
+    
+    exportacao["linhas"] += len(bloco)
+    exportacao["bloco"] = []
+
+
+def valores_coluna(bloco, coluna, tipo):
+    """
+    Valores de uma coluna do bloco, convertidos para o tipo (None onde
+    o resultado nao tem a coluna)
+    """
+    valores = []
+    for resultado in bloco:
+        valor = resultado.get(coluna)
+        if valor is None:
+            valores.append(None)
+        elif tipo == "numero":
+            valores.append(float(valor))
+        elif tipo == "lista":
+            valores.append([float(item) for item in valor])
+        elif isinstance(valor, str):
+            valores.append(valor)
+        else:
+            valores.append(json.dumps(valor, default=str))
+    return valores
+
+
+def gravar_parte_npz(exportacao, valores):
+    """
+    Grava uma parte do .npz: um arquivo .npy por coluna, em
+    "<coluna>/<parte>". Numeros vazios viram NaN e textos vazios, "".
+    Cada lista e gravada emendada, com o tamanho de cada uma em
+    "<coluna>.tamanhos/<parte>"
+    """
+    arquivo_zip = exportacao["zip"]
+    if exportacao["partes"] == 0 and not exportacao["existente"]:
+        gravar_esquema_npz(exportacao)
+    
+    parte = f"{exportacao['partes']:06d}"
+    matrizes = {}
+    for coluna, lista in valores.items():
+        tipo = exportacao["tipos"][coluna]
+        if tipo == "numero":
+            matrizes[coluna] = np.array([np.nan if valor is None else valor for valor in lista], dtype=np.float64)
+        elif tipo == "texto":
+            matrizes[coluna] = np.array(["" if valor is None else valor for valor in lista], dtype=str)
+        else:
+            emendada = []
+            tamanhos = []
+            for valor in lista:
+                emendada.extend(valor or [])
+                tamanhos.append(len(valor or []))
+            matrizes[coluna] = np.array(emendada, dtype=np.float64)
+            matrizes[f"{coluna}.tamanhos"] = np.array(tamanhos, dtype=np.int64)
+    
+    for nome, matriz in matrizes.items():
+        with arquivo_zip.open(f"{nome}/{parte}", "w", force_zip64=True) as destino:
+            np.lib.format.write_array(destino, matriz, allow_pickle=False)
+    exportacao["partes"] += 1
+
+
+def gravar_esquema_npz(exportacao):
+    """
+    Grava as colunas e os tipos no .npz (em "esquema.json"), para ler
+    as partes e acrescentar outras com as mesmas colunas
+    """
+    esquema = {"colunas": exportacao["colunas"] or [], "tipos": exportacao["tipos"] or {}}
+    exportacao["zip"].writestr("esquema.json", json.dumps(esquema))
+
+
+def gravar_bloco_parquet(exportacao, valores):
+    """
+    Grava um bloco (row group) no arquivo Parquet
+    """
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+    
+    if exportacao["parquet"] is None:
+        tipos = {"numero": pa.float64(), "texto": pa.string(), "lista": pa.list_(pa.float64())}
+        esquema = pa.schema([(coluna, tipos[exportacao["tipos"][coluna]]) for coluna in exportacao["colunas"]])
+        exportacao["parquet"] = pq.ParquetWriter(exportacao["arquivo"], esquema, compression="zstd")
+    
+    escritor = exportacao["parquet"]
+    escritor.write_table(pa.Table.from_pydict(valores, schema=escritor.schema))
+
+
+def fechar_exportacao(exportacao):
+    """
+    Grava o que falta e fecha o arquivo da exportacao
+    
+    Retorna:
+        Numero de resultados gravados
+    """
+    try:
+        gravar_bloco(exportacao)
+    finally:
+        if exportacao["saida"] is not None and exportacao["saida"] is not sys.stdout:
+            exportacao["saida"].close()
+        if exportacao["zip"] is not None:
+            # Sem resultados, o .npz fica so com o esquema
+            if exportacao["partes"] == 0 and not exportacao["existente"]:
+                gravar_esquema_npz(exportacao)
+            exportacao["zip"].close()
+        if exportacao["parquet"] is not None:
+            exportacao["parquet"].close()
+    return exportacao["linhas"]
+
+
+def exportar(resultados, arquivo, formato=None, colunas=None, acrescentar=False):
+    """
+    Exporta resultados de uma vez (veja abrir_exportacao)
+    
+    Retorna:
+        Tupla (resultados gravados, arquivo gravado)
+    """
+    exportacao = abrir_exportacao(arquivo, formato, colunas, acrescentar)
+    try:
+        escrever_resultados(exportacao, resultados)
+    finally:
+        linhas = fechar_exportacao(exportacao)
+    return linhas, exportacao["arquivo"]
+
+
+def ler_npz(arquivo):
+    """
+    Le um .npz gravado pela exportacao, juntando as partes
+    
+    Retorna:
+        Dicionario coluna: matriz do NumPy (nas colunas de listas, uma
+        lista de matrizes, uma por resultado)
+    """
+    with zipfile.ZipFile(arquivo) as arquivo_zip:
+        esquema = json.loads(arquivo_zip.read("esquema.json"))
+        partes = {}
+        for nome in sorted(arquivo_zip.namelist()):
+            if "/" not in nome:
+                continue
+            with arquivo_zip.open(nome) as origem:
+                partes.setdefault(nome.rsplit("/", 1)[0], []).append(np.lib.format.read_array(origem))
+    
+    colunas = {}
+    for coluna in esquema["colunas"]:
+        tipo = esquema["tipos"][coluna]
+        vazia = np.array([], dtype=str if tipo == "texto" else np.float64)
+        valores = np.concatenate(partes.get(coluna, [vazia]))
+        if tipo == "lista":
+            tamanhos = np.concatenate(partes.get(f"{coluna}.tamanhos", [np.array([], dtype=np.int64)]))
+            valores = np.split(valores, np.cumsum(tamanhos)[:-1]) if len(tamanhos) else []
+        colunas[coluna] = valores
+    return colunas
@@ -3,13 +3,28 @@ Modulo para exportar resultados em formato CSV
 Salva dados de benchmarks e comparacoes
 """
 import csv
+import json
 import os
 from datetime import datetime
 
+from agregador import METRICAS, resumir_acumulador
+
+# Medidas do resumo de cada metrica nas colunas de exportar_estatisticas
+MEDIDAS = ["minimo", "maximo", "media", "desvio", "p50", "p90", "p99"]
+
+# Colunas de exportar_resultados (e da saida CSV de python -m engine)
+COLUNAS_RESULTADOS = ["algoritmo", "backend", "tamanho", "distribuicao", "semente", "ensaio", "status", "repeticoes",
+                      "chamadas", "tempo", "tempo_iqr", "tempo_estimado", "modelo", "expoente", "cpu", "cpu_pico",
+                      "frequencia_media_mhz", "energia", "fonte_energia", "co2", "memoria_pico_bytes", "alocacoes",
+                      "rss_delta_bytes", "comparacoes", "escritas", "profundidade_maxima", "tempo_io", "bytes_lidos",
+                      "bytes_escritos", "tempos", "energias"]
+
 
 def exportar_resultados(resultados, nome_arquivo=None):
     """
-    Exporta lista de resultados para arquivo CSV
+    Exporta lista de resultados para arquivo CSV, com as
+    COLUNAS_RESULTADOS e as outras chaves que os resultados tiverem
+    (veja exportador.py para outros formatos e listas grandes)
     
     Parametros:
         resultados: Lista de dicionarios com dados dos testes
@@ -28,24 +43,50 @@ def exportar_resultados(resultados, nome_arquivo=None):
     if not nome_arquivo.endswith(".csv"):
         nome_arquivo = nome_arquivo + ".csv"
     
+    colunas = colunas_resultados(resultados)
     with open(nome_arquivo, 'w', newline='', encoding='utf-8') as arquivo:
-        colunas = ["algoritmo", "tempo", "cpu", "energia", "co2"]
         escritor = csv.DictWriter(arquivo, fieldnames=colunas)
         
         escritor.writeheader()
         
         for resultado in resultados:
-            linha = {}
-            for coluna in colunas:
-                if coluna in resultado:
-                    linha[coluna] = resultado[coluna]
-                else:
-                    linha[coluna] = ""
-            escritor.writerow(linha)
+            escritor.writerow(linha_resultado(resultado, colunas))
     
     return nome_arquivo
 
 
+def colunas_resultados(resultados, base=COLUNAS_RESULTADOS):
+    """
+    Colunas de uma exportacao: as de base, na ordem delas, e depois as
+    outras chaves dos resultados, na ordem em que aparecem
+    """
+    colunas = list(base)
+    for resultado in resultados:
+        for chave in resultado:
+            if chave not in colunas:
+                colunas.append(chave)
+    return colunas
+
+
+def linha_resultado(resultado, colunas=COLUNAS_RESULTADOS):
+    """
+    Converte um resultado em uma linha com as colunas
+    (colunas que o resultado nao tem ficam vazias)
+    """
+    linha = {}
+    for coluna in colunas:
+        if resultado.get(coluna) is None:
+            linha[coluna] = ""
+        elif isinstance(resultado[coluna], list):
+            # Cada repeticao, separada por espaco
+            linha[coluna] = " ".join(str(valor) for valor in resultado[coluna])
+        elif isinstance(resultado[coluna], dict):
+            linha[coluna] = json.dumps(resultado[coluna], default=str)
+        else:
+            linha[coluna] = resultado[coluna]
+    return linha
+
+
 def exportar_comparacao_linguagens(dados, algoritmo, tamanho, nome_arquivo=None):
     """
     Exporta comparacao entre linguagens para CSV
@@ -84,15 +125,18 @@ def exportar_comparacao_linguagens(dados, algoritmo, tamanho, nome_arquivo=None)
     return nome_arquivo
 
 
-def exportar_estatisticas(estatisticas, nome_arquivo=None):
+def exportar_estatisticas(agregador, nome_arquivo=None):
     """
     Exporta estatisticas agregadas para CSV
+    Uma linha por algoritmo, tamanho e backend. Para tempo, energia e
+    CO2 grava o resumo do agregador (minimo, maximo, media, desvio e
+    os quantis p50, p90 e p99)
     
     Parametros:
-        estatisticas: Dicionario com estatisticas por algoritmo
+        agregador: Agregador de estatisticas (veja agregador.py)
         nome_arquivo: Nome do arquivo (opcional)
     """
-    if not estatisticas:
+    if not agregador:
         return None
     
     if nome_arquivo is None:
@@ -103,23 +147,27 @@ def exportar_estatisticas(estatisticas, nome_arquivo=None):
         nome_arquivo = nome_arquivo + ".csv"
     
     with open(nome_arquivo, 'w', newline='', encoding='utf-8') as arquivo:
-        colunas = ["algoritmo", "tempo_medio", "energia_media", "co2_medio", "execucoes"]
+        colunas = ["algoritmo", "tamanho", "backend", "execucoes"]
+        for metrica in METRICAS:
+            for medida in MEDIDAS:
+                colunas.append(f"{metrica}_{medida}")
         escritor = csv.DictWriter(arquivo, fieldnames=colunas)
         
         escritor.writeheader()
         
-        for algoritmo, valores in estatisticas.items():
-            tempo_medio = sum(valores["tempo"]) / len(valores["tempo"])
-            energia_media = sum(valores["energia"]) / len(valores["energia"])
-            co2_medio = sum(valores["co2"]) / len(valores["co2"])
-            
+        for (algoritmo, tamanho, backend), acumuladores in agregador.items():
             linha = {
                 "algoritmo": algoritmo,
-                "tempo_medio": tempo_medio,
-                "energia_media": energia_media,
-                "co2_medio": co2_medio,
-                "execucoes": len(valores["tempo"])
+                "tamanho": "" if tamanho is None else tamanho,
+                "backend": backend,
+                "execucoes": acumuladores["tempo"]["n"]
             }
+            
+            for metrica in METRICAS:
+                resumo = resumir_acumulador(acumuladores[metrica])
+                for medida in MEDIDAS:
+                    linha[f"{metrica}_{medida}"] = resumo[medida]
+            
             escritor.writerow(linha)
     
     return nome_arquivo
@@ -2,41 +2,141 @@
 Modulo para gerar listas de teste
 Cria listas aleatorias de diferentes tamanhos
 """
-import random
-from rich.table import Table
-from rich import print
+import secrets
+import numpy as np
 
 
-def gerar_listas(tamanhos=None):
+DISTRIBUICOES = ["aleatoria", "ordenada", "invertida", "repetidos", "quase_ordenada"]
+
+
+def gerar_semente():
+    """
+    Sorteia uma semente nova para a geracao de listas
+    """
+    return secrets.randbits(32)
+
+
+def gerar_lista(tamanho, distribuicao="aleatoria", semente=0):
+    """
+    Gera uma unica lista de teste de uma vez, em um vetor int64
+    
+    O gerador de cada lista depende apenas de (semente, tamanho), entao
+    a mesma lista pode ser recriada sozinha, sem gerar as outras
+    
+    Parametros:
+        tamanho: Quantidade de elementos
+        distribuicao: Formato dos dados (uma das DISTRIBUICOES)
+        semente: Semente do gerador aleatorio
+    
+    Retorna:
+        Vetor NumPy int64 (8 bytes por elemento)
+    """
+    if distribuicao not in DISTRIBUICOES:
+        raise ValueError(f"Distribuicao desconhecida: {distribuicao}")
+    
+    gerador = np.random.default_rng([semente, tamanho])
+    
+    if distribuicao == "repetidos":
+        vetor = gerador.integers(0, 10, size=tamanho, dtype=np.int64)
+    else:
+        vetor = gerador.integers(0, 1000000, size=tamanho, dtype=np.int64, endpoint=True)
+    
+    if distribuicao == "ordenada" or distribuicao == "quase_ordenada":
+        vetor.sort()
+    elif distribuicao == "invertida":
+        vetor = np.sort(vetor)[::-1].copy()
+    
+    if distribuicao == "quase_ordenada" and tamanho > 1:
+        trocas = max(1, tamanho // 100)
+        indices = gerador.choice(tamanho, size=min(2 * trocas, tamanho), replace=False)
+        metade = len(indices) // 2
+        a = indices[:metade]
+        b = indices[metade:2 * metade]
+        vetor[a], vetor[b] = vetor[b], vetor[a]
+    
+    return vetor
+
+
+def gerar_listas(tamanhos=None, distribuicao="aleatoria", semente=None):
     """
     Gera listas aleatorias para testes
     
     Parametros:
         tamanhos: Lista com tamanhos desejados
+        distribuicao: Formato dos dados (uma das DISTRIBUICOES)
+            aleatoria - valores uniformes entre 0 e 1.000.000
+            ordenada - ja em ordem crescente
+            invertida - em ordem decrescente
+            repetidos - apenas 10 valores distintos
+            quase_ordenada - ordenada com ~1% de trocas aleatorias
+        semente: Semente do gerador (use gerar_semente() e guarde o valor
+            para poder recriar as mesmas listas depois)
     
     Retorna:
-        Dicionario onde a chave e o tamanho e o valor e a lista
+        Dicionario onde a chave e o tamanho e o valor e um vetor int64
+        (converta com .tolist() quando um algoritmo Python precisar)
     """
     if tamanhos is None:
         tamanhos = [10, 1000, 10000, 100000]
     
+    if semente is None:
+        semente = gerar_semente()
+    
     listas = {}
     
     for tamanho in tamanhos:
-        lista = []
-        for i in range(tamanho):
-            numero = random.randint(0, 1000000)
-            lista.append(numero)
-        listas[tamanho] = lista
+        listas[tamanho] = gerar_lista(tamanho, distribuicao, semente)
     
     return listas
 
 
-def mostrar_info_listas(listas):
+def gerar_arquivo(caminho, tamanho, distribuicao="aleatoria", semente=0, itens_por_bloco=1 << 20):
+    """
+    Gera um arquivo binario int64 de numeros aleatorios, um bloco por vez,
+    sem nunca ter a lista inteira na memoria (para a ordenacao externa)
+    
+    Parametros:
+        caminho: Arquivo que sera criado
+        tamanho: Quantidade de numeros
+        distribuicao: "aleatoria" ou "repetidos" (as outras precisam da
+            lista inteira para serem geradas)
+        semente: Semente do gerador aleatorio
+        itens_por_bloco: Numeros gerados e gravados de cada vez
+    
+    Retorna:
+        Quantidade de bytes gravados
+    """
+    if distribuicao not in ["aleatoria", "repetidos"]:
+        raise ValueError(f"Distribuicao nao suportada em arquivo: {distribuicao}")
+    
+    gerador = np.random.default_rng([semente, tamanho])
+    maximo = 9 if distribuicao == "repetidos" else 1000000
+    gravados = 0
+    
+    with open(caminho, "wb") as arquivo:
+        while gravados < tamanho:
+            quantidade = min(itens_por_bloco, tamanho - gravados)
+            bloco = gerador.integers(0, maximo, size=quantidade, dtype=np.int64, endpoint=True)
+            bloco.tofile(arquivo)
+            gravados = gravados + quantidade
+    
+    return gravados * 8
+
+
+def mostrar_info_listas(listas, semente=None):
     """
     Mostra informacoes sobre as listas geradas
     """
-    tabela = Table(title="Listas geradas")
+    # Importado aqui para que o modo sem interface (python -m engine)
+    # possa gerar listas sem carregar o Rich
+    from rich.table import Table
+    from rich import print
+    
+    titulo = "Listas geradas"
+    if semente is not None:
+        titulo = f"Listas geradas (semente {semente})"
+    
+    tabela = Table(title=titulo)
     tabela.add_column("Tamanho")
     tabela.add_column("Exemplo (primeiros elementos)")
     
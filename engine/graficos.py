@@ -10,7 +10,12 @@ import numpy as np
 def grafico_completo(resultados):
     """
     Gera grafico comparativo com resultados Python
+    As barras de energia mostram quantas vezes a energia da ordenacao
+    pronta do backend (list.sort ou numpy.sort) na mesma lista cada
+    algoritmo gastou, quando ela foi medida
     """
+    from catalogo import razao_referencia
+    
     if not resultados:
         print("Sem dados para gerar grafico.")
         return
@@ -21,10 +26,15 @@ def grafico_completo(resultados):
     co2 = []
     
     for r in resultados:
-        algoritmos.append(r["algoritmo"])
+        # Valores extrapolados (opcao 16) ficam marcados no nome e hachurados
+        if r.get("status") == "extrapolado":
+            algoritmos.append(f"{r['algoritmo']}\n{r['tamanho']:,} (extrapolado)")
+        else:
+            algoritmos.append(r["algoritmo"])
         tempos.append(r["tempo"])
-        energia.append(r["energia"])
-        co2.append(r["co2"])
+        # Energia e CO2 sem ajuste na varredura ficam sem barra
+        energia.append(r["energia"] if r["energia"] is not None else np.nan)
+        co2.append(r["co2"] if r["co2"] is not None else np.nan)
     
     fig, axes = plt.subplots(1, 3, figsize=(15, 5))
     
@@ -38,25 +48,94 @@ def grafico_completo(resultados):
     axes[1].set_ylabel("Wh")
     axes[1].tick_params(axis="x", rotation=20)
     
+    for barra, r in zip(axes[1].patches, resultados):
+        razao = razao_referencia(r, resultados)
+        if razao is not None:
+            axes[1].text(barra.get_x() + barra.get_width() / 2., barra.get_height(), f"{razao:.1f}x",
+                         ha="center", va="bottom", fontsize=7, rotation=90)
+    if any(razao_referencia(r, resultados) is not None for r in resultados):
+        axes[1].set_title("Consumo de Energia\n(rotulos: vezes a energia do built-in)", fontweight="bold")
+    
     axes[2].bar(algoritmos, co2, color="#e74c3c", edgecolor="black")
     axes[2].set_title("Emissao de CO2", fontweight="bold")
     axes[2].set_ylabel("Gramas")
     axes[2].tick_params(axis="x", rotation=20)
     
+    for ax in axes:
+        for barra, r in zip(ax.patches, resultados):
+            if r.get("status") == "extrapolado":
+                barra.set_hatch("//")
+                barra.set_alpha(0.6)
+    
     plt.suptitle("Analise Comparativa de Algoritmos de Ordenacao", fontsize=14, fontweight="bold")
     plt.tight_layout()
     plt.show()
 
 
-def grafico_comparativo_linguagens(resultados_python, algoritmo, tamanho):
+def grafico_varredura(resultados, ajustes):
+    """
+    Gera grafico log-log do tempo e da energia pelo tamanho da lista
+    para cada algoritmo da varredura (opcao 16)
+    
+    Os pontos medidos sao cheios e ligados por linha continua; os
+    extrapolados sao vazados, ligados por linha tracejada
+    
+    Parametros:
+        resultados: Resultados medidos e extrapolados da varredura
+        ajustes: Ajuste do tempo de cada algoritmo (veja complexidade)
+    """
+    if not resultados:
+        print("Sem dados para gerar grafico.")
+        return
+    
+    fig, axes = plt.subplots(1, 2, figsize=(15, 6))
+    cores = plt.cm.tab20(np.linspace(0, 1, max(1, len(ajustes))))
+    
+    for cor, (nome, ajuste) in zip(cores, ajustes.items()):
+        medidos = [r for r in resultados if r["algoritmo"] == nome and r["status"] == "ok"]
+        extrapolados = [r for r in resultados if r["algoritmo"] == nome and r["status"] == "extrapolado"]
+        rotulo = f"{nome} (k={ajuste['expoente']:.2f}, {ajuste['modelo']})"
+        
+        for ax, campo in zip(axes, ["tempo", "energia"]):
+            ax.plot([r["tamanho"] for r in medidos], [r[campo] for r in medidos],
+                    "o-", color=cor, label=rotulo)
+            if extrapolados:
+                # A linha tracejada parte do ultimo ponto medido
+                pontos = medidos[-1:] + extrapolados
+                ax.plot([r["tamanho"] for r in pontos], [r[campo] for r in pontos],
+                        "--", color=cor)
+                ax.plot([r["tamanho"] for r in extrapolados], [r[campo] for r in extrapolados],
+                        "o", color=cor, markerfacecolor="none")
+    
+    for ax, titulo, unidade in zip(axes, ["Tempo de Execucao", "Consumo de Energia"], ["Segundos", "Wh"]):
+        ax.set_xscale("log")
+        ax.set_yscale("log")
+        ax.set_title(titulo, fontweight="bold")
+        ax.set_xlabel("Tamanho da lista")
+        ax.set_ylabel(unidade)
+        ax.grid(alpha=0.3, linestyle="--", which="both")
+    
+    axes[0].legend(fontsize=7)
+    
+    plt.suptitle("Varredura de Tamanhos (tracejado e pontos vazados: extrapolado)", fontsize=14, fontweight="bold")
+    plt.tight_layout()
+    plt.show()
+
+
+def grafico_comparativo_linguagens(resultados_python, algoritmo, tamanho, nativo=None):
     """
     Gera grafico comparativo entre Python e outras linguagens
+    Com nativo (resultado da versao em C medida nesta maquina) a barra
+    de C vem da medicao, e nao da tabela de benchmarks
+    Se list.sort foi medido na mesma lista (esta entre os resultados),
+    as barras de energia mostram tambem a razao em relacao a ele
     """
     try:
-        from comparador_linguagens import obter_todos_benchmarks
+        from comparador_linguagens import obter_todos_benchmarks, combinar_nativo
     except ImportError:
         print("Modulo comparador_linguagens.py nao encontrado!")
         return
+    from catalogo import procurar_referencia
     
     alg_normalizado = algoritmo.lower().replace(" sort", "").replace("sort", "").strip()
     
@@ -71,7 +150,7 @@ def grafico_comparativo_linguagens(resultados_python, algoritmo, tamanho):
         print(f"Nenhum resultado Python encontrado para {algoritmo}")
         return
     
-    outras_linguagens = obter_todos_benchmarks(alg_normalizado, tamanho)
+    outras_linguagens = combinar_nativo(obter_todos_benchmarks(alg_normalizado, tamanho), nativo)
     
     if not outras_linguagens:
         print(f"Sem dados de benchmark para {algoritmo} com {tamanho} elementos")
@@ -82,11 +161,19 @@ def grafico_comparativo_linguagens(resultados_python, algoritmo, tamanho):
     energias = [resultado_python["energia"]]
     co2s = [resultado_python["co2"]]
     
+    # Benchmarks de tamanhos nao medidos ficam marcados no nome e hachurados
+    rotulos = ["Python"]
+    estimados = [False]
     for lang, dados in outras_linguagens.items():
         linguagens.append(lang.upper())
         tempos.append(dados["tempo"])
         energias.append(dados["energia"])
         co2s.append(dados["co2"])
+        if dados["origem"] == "medido":
+            rotulos.append(lang.upper())
+        else:
+            rotulos.append(f"{lang.upper()}\n({dados['origem']})")
+        estimados.append(dados["origem"] in ["interpolado", "extrapolado"])
     
     cores = {
         "Python": "#52A736",
@@ -104,7 +191,7 @@ def grafico_comparativo_linguagens(resultados_python, algoritmo, tamanho):
     
     fig, axes = plt.subplots(1, 3, figsize=(16, 5))
     
-    bars1 = axes[0].bar(linguagens, tempos, color=cores_lista, edgecolor="black", linewidth=1.5)
+    bars1 = axes[0].bar(rotulos, tempos, color=cores_lista, edgecolor="black", linewidth=1.5)
     axes[0].set_title("Tempo de Execucao", fontweight="bold", fontsize=12)
     axes[0].set_ylabel("Segundos", fontweight="bold")
     axes[0].tick_params(axis="x", rotation=15)
@@ -116,19 +203,23 @@ def grafico_comparativo_linguagens(resultados_python, algoritmo, tamanho):
                      f'{height:.6f}s',
                      ha='center', va='bottom', fontsize=9, fontweight='bold')
     
-    bars2 = axes[1].bar(linguagens, energias, color=cores_lista, edgecolor="black", linewidth=1.5)
+    bars2 = axes[1].bar(rotulos, energias, color=cores_lista, edgecolor="black", linewidth=1.5)
     axes[1].set_title("Consumo de Energia", fontweight="bold", fontsize=12)
     axes[1].set_ylabel("Wh", fontweight="bold")
     axes[1].tick_params(axis="x", rotation=15)
     axes[1].grid(axis='y', alpha=0.3, linestyle='--')
     
+    referencia = procurar_referencia(resultado_python, resultados_python)
     for bar in bars2:
         height = bar.get_height()
+        rotulo = f'{height:.6f}'
+        if referencia is not None and referencia["energia"] > 0:
+            rotulo = rotulo + f'\n{height / referencia["energia"]:.1f}x built-in'
         axes[1].text(bar.get_x() + bar.get_width()/2., height,
-                     f'{height:.6f}',
+                     rotulo,
                      ha='center', va='bottom', fontsize=9, fontweight='bold')
     
-    bars3 = axes[2].bar(linguagens, co2s, color=cores_lista, edgecolor="black", linewidth=1.5)
+    bars3 = axes[2].bar(rotulos, co2s, color=cores_lista, edgecolor="black", linewidth=1.5)
     axes[2].set_title("Emissao de CO2", fontweight="bold", fontsize=12)
     axes[2].set_ylabel("Gramas", fontweight="bold")
     axes[2].tick_params(axis="x", rotation=15)
@@ -140,6 +231,12 @@ def grafico_comparativo_linguagens(resultados_python, algoritmo, tamanho):
                      f'{height:.4f}g',
                      ha='center', va='bottom', fontsize=9, fontweight='bold')
     
+    for ax in axes:
+        for barra, estimado in zip(ax.patches, estimados):
+            if estimado:
+                barra.set_hatch("//")
+                barra.set_alpha(0.6)
+    
     plt.suptitle(f"Comparacao Multi-Linguagem: {algoritmo.upper()} ({tamanho:,} elementos)", 
                  fontsize=14, fontweight="bold")
     
@@ -159,15 +256,22 @@ def grafico_comparativo_linguagens(resultados_python, algoritmo, tamanho):
     print("="*60)
 
 
-def grafico_comparativo_todos_algoritmos(resultados_python, tamanho):
+def grafico_comparativo_todos_algoritmos(resultados_python, tamanho, nativos=None):
     """
     Gera grafico comparativo de todos os algoritmos entre Python e outras linguagens
+    nativos: {algoritmo normalizado: resultado da versao em C medida nesta
+    maquina}, que substituem os benchmarks de C
     """
     try:
-        from comparador_linguagens import obter_todos_benchmarks, listar_todos_algoritmos
+        from comparador_linguagens import obter_todos_benchmarks, combinar_nativo
     except ImportError:
         print("Modulo comparador_linguagens.py nao encontrado!")
         return
+    from catalogo import razao_referencia
+    from base_benchmarks import listar_todos_algoritmos
+    
+    if nativos is None:
+        nativos = {}
     
     algoritmos_disponiveis = listar_todos_algoritmos()
     
@@ -187,29 +291,25 @@ def grafico_comparativo_todos_algoritmos(resultados_python, tamanho):
     
     linguagens = ["Python", "C", "Java", "Go"]
     dados_tempo = {}
+    estimados = {}
     
     for lang in linguagens:
         dados_tempo[lang] = []
+        estimados[lang] = []
     
     for alg in algoritmos_comuns:
         dados_tempo["Python"].append(algoritmos_python[alg]["tempo"])
+        estimados["Python"].append(False)
         
-        outras = obter_todos_benchmarks(alg, tamanho)
+        outras = combinar_nativo(obter_todos_benchmarks(alg, tamanho), nativos.get(alg))
         
-        if "c" in outras:
-            dados_tempo["C"].append(outras["c"]["tempo"])
-        else:
-            dados_tempo["C"].append(0)
-        
-        if "java" in outras:
-            dados_tempo["Java"].append(outras["java"]["tempo"])
-        else:
-            dados_tempo["Java"].append(0)
-        
-        if "go" in outras:
-            dados_tempo["Go"].append(outras["go"]["tempo"])
-        else:
-            dados_tempo["Go"].append(0)
+        for lang in linguagens[1:]:
+            if lang.lower() in outras:
+                dados_tempo[lang].append(outras[lang.lower()]["tempo"])
+                estimados[lang].append(outras[lang.lower()]["origem"] in ["interpolado", "extrapolado"])
+            else:
+                dados_tempo[lang].append(0)
+                estimados[lang].append(False)
     
     x = np.arange(len(algoritmos_comuns))
     width = 0.2
@@ -229,6 +329,12 @@ def grafico_comparativo_todos_algoritmos(resultados_python, tamanho):
         bars = ax.bar(x + offset, dados_tempo[lang], width, 
                       label=lang, color=cores[lang], edgecolor="black", linewidth=1.2)
         
+        # Benchmarks de tamanhos nao medidos ficam hachurados
+        for bar, estimado in zip(bars, estimados[lang]):
+            if estimado:
+                bar.set_hatch("//")
+                bar.set_alpha(0.6)
+        
         for bar in bars:
             height = bar.get_height()
             if height > 0:
@@ -238,13 +344,22 @@ def grafico_comparativo_todos_algoritmos(resultados_python, tamanho):
     
     ax.set_xlabel('Algoritmos', fontweight='bold', fontsize=12)
     ax.set_ylabel('Tempo (segundos)', fontweight='bold', fontsize=12)
-    ax.set_title(f'Comparacao de Performance: Todos os Algoritmos ({tamanho:,} elementos)', 
-                 fontweight='bold', fontsize=14)
+    titulo = f'Comparacao de Performance: Todos os Algoritmos ({tamanho:,} elementos)'
+    if any(any(valores) for valores in estimados.values()):
+        titulo = titulo + '\n(hachurado: benchmark interpolado entre os tamanhos medidos)'
+    if nativos:
+        titulo = titulo + '\n(C: compilado e medido nesta maquina)'
+    ax.set_title(titulo, fontweight='bold', fontsize=14)
     ax.set_xticks(x)
     
+    # Energia do Python em relacao ao list.sort na mesma lista (se medido)
     labels = []
     for alg in algoritmos_comuns:
-        labels.append(alg.capitalize())
+        razao = razao_referencia(algoritmos_python[alg], resultados_python)
+        if razao is None:
+            labels.append(alg.capitalize())
+        else:
+            labels.append(f"{alg.capitalize()}\n(Python: {razao:.1f}x energia do built-in)")
     ax.set_xticklabels(labels)
     
     ax.legend(loc='upper left', fontsize=10)
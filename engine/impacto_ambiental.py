@@ -4,27 +4,49 @@ Calcula consumo de energia e emissao de CO2
 """
 
 
-def calcular_impacto(tempo_segundos, uso_cpu_percent, potencia_cpu=65.0):
+def calcular_impacto(tempo_segundos, uso_cpu_percent, potencia_cpu=65.0, energia_medida_Wh=None, serie_cpu=None):
     """
     Calcula impacto ambiental baseado no tempo e uso de CPU
     
+    Se a energia foi medida pelo hardware (contadores RAPL), ela e usada
+    no lugar do modelo. Se houver uma serie de amostras de CPU (veja
+    amostrador_cpu), o modelo soma a energia de cada intervalo em vez
+    de usar o uso medio
+    
     Formulas:
         Energia (Wh) = (Potencia_CPU * Tempo * Uso_CPU%) / 3600
+        Com a serie: Energia (Wh) = Potencia_CPU * soma(Uso_CPU%_i * dt_i) / 3600
         CO2 (g) = Energia * 426 gCO2/kWh
     
     Parametros:
         tempo_segundos: Tempo de execucao em segundos
         uso_cpu_percent: Uso da CPU em porcentagem (0-100)
         potencia_cpu: Potencia da CPU em watts (padrao: 65W)
+        energia_medida_Wh: Energia medida em Wh (opcional)
+        serie_cpu: Lista de amostras com dt e cpu_processo (opcional)
     
     Retorna:
-        Dicionario com energia_Wh e emissao_CO2_g
+        Dicionario com energia_Wh, emissao_CO2_g e fonte_energia
+        ("medida" ou "modelo")
     
     """
-    energia = (potencia_cpu * tempo_segundos * (uso_cpu_percent / 100)) / 3600
+    if energia_medida_Wh is not None:
+        energia = energia_medida_Wh
+        fonte = "medida"
+    elif serie_cpu and len(serie_cpu) > 1:
+        segundos_cpu = 0.0
+        for amostra in serie_cpu:
+            segundos_cpu = segundos_cpu + (amostra["cpu_processo"] / 100) * amostra["dt"]
+        energia = potencia_cpu * segundos_cpu / 3600
+        fonte = "modelo"
+    else:
+        energia = (potencia_cpu * tempo_segundos * (uso_cpu_percent / 100)) / 3600
+        fonte = "modelo"
+    
     co2 = energia * 426
     
     return {
         "energia_Wh": energia,
-        "emissao_CO2_g": co2
+        "emissao_CO2_g": co2,
+        "fonte_energia": fonte
     }
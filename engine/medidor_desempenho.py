@@ -2,37 +2,676 @@
 Modulo para medir desempenho de funcoes
 Mede tempo de execucao e uso de CPU
 """
+import functools
+import gc
+import multiprocessing
 import psutil
+import sys
 import time
+import tracemalloc
 
+from amostrador_cpu import iniciar_amostragem, parar_amostragem
+from complexidade import ajustar_potencia
+from contador_operacoes import contar_operacoes
+from medidor_energia import listar_dominios, ler_energia, energia_consumida
 
-def medir_desempenho(funcao, *args, **kwargs):
+# Intervalo (em segundos) entre as verificacoes do processo isolado
+INTERVALO_VERIFICACAO = 0.05
+
+# Duracao minima da maior medida usada para estimar o tempo total
+TEMPO_CALIBRACAO = 0.2
+
+# Total maximo de elementos copiados para um lote de chamadas
+# (veja calibrar_chamadas): cerca de 8 MB em um vetor int64
+MAXIMO_ITENS_LOTE = 1_000_000
+
+
+def medir_desempenho(funcao, *args, limite_tempo=None, limite_memoria_mb=None, medir_memoria=False,
+                     intervalo_amostragem=None, alta_resolucao=False, **kwargs):
     """
     Mede o desempenho de uma funcao
     
+    Se limite_tempo ou limite_memoria_mb for informado, a funcao roda em
+    um processo isolado que e encerrado quando passa do limite (veja
+    medir_isolado). Sem limites, roda no proprio processo
+    
+    Quando o sistema informa (Linux e Windows), tambem mede os bytes
+    lidos e escritos em disco pelo processo durante a execucao
+    
+    O uso de CPU soma o processo atual e os processos filhos que
+    terminaram durante a medicao (por exemplo, os processos do
+    Merge Sort paralelo). Com varios processos o valor pode passar
+    de 100% (ate 100% por nucleo)
+    
+    Se os contadores RAPL do Linux puderem ser lidos, a energia do
+    processador durante a execucao e medida (veja medidor_energia)
+    
+    Com medir_memoria=True tambem registra o pico de memoria alocada
+    pelo Python (tracemalloc), o saldo de blocos alocados
+    (sys.getallocatedblocks) e a variacao da memoria residente (RSS).
+    O tracemalloc deixa a execucao bem mais lenta, entao o tempo dessa
+    medicao nao deve ser comparado com os outros (veja medir_repeticoes)
+    
+    Com intervalo_amostragem, uma thread registra a CPU do processo, de
+    cada nucleo e a frequencia a cada intervalo (veja amostrador_cpu) e
+    a serie vai no resultado. Com alta_resolucao=True a CPU do processo
+    vem de time.process_time, o que da valores corretos mesmo em
+    execucoes de menos de um milissegundo
+    
     Parametros:
         funcao: A funcao que sera medida
         *args: Argumentos da funcao
+        limite_tempo: Tempo maximo em segundos (opcional)
+        limite_memoria_mb: Memoria adicional maxima em MB (opcional)
+        medir_memoria: Se deve registrar o uso de memoria (padrao: False)
+        intervalo_amostragem: Segundos entre as amostras de CPU (padrao: sem amostragem)
+        alta_resolucao: Se deve medir a CPU com process_time (padrao: False)
         **kwargs: Argumentos nomeados da funcao
     
     Retorna:
-        Dicionario com tempo_execucao, uso_cpu_percent e resultado
+        Dicionario com status ("ok", "timeout", "memoria" ou "erro"),
+        tempo_execucao, uso_cpu_percent, cpu_segundos, cpu_filhos_segundos,
+        io_bytes_lidos, io_bytes_escritos, energia_medida_Wh,
+        memoria_pico_bytes, alocacoes, rss_delta_bytes, serie_cpu (None
+        se indisponivel ou nao medido), tempo_estimado e resultado
     """
+    if limite_tempo is not None or limite_memoria_mb is not None:
+        opcoes = {
+            "medir_memoria": medir_memoria,
+            "intervalo_amostragem": intervalo_amostragem,
+            "alta_resolucao": alta_resolucao,
+        }
+        return medir_isolado(funcao, args, kwargs, limite_tempo, limite_memoria_mb, opcoes=opcoes)
+    
     processo = psutil.Process()
-    processo.cpu_percent()
+    dominios = listar_dominios()
+    
+    iniciou_rastreio = False
+    if medir_memoria:
+        rss_antes = processo.memory_info().rss
+        blocos_antes = sys.getallocatedblocks()
+        if not tracemalloc.is_tracing():
+            tracemalloc.start()
+            iniciou_rastreio = True
+        tracemalloc.reset_peak()
+        memoria_base = tracemalloc.get_traced_memory()[0]
+    
+    amostragem = None
+    if intervalo_amostragem is not None:
+        amostragem = iniciar_amostragem(intervalo_amostragem, alta_resolucao)
+    
+    io_antes = ler_io(processo)
+    cpu_antes = processo.cpu_times()
+    energia_antes = ler_energia(dominios)
+    processo_antes = time.process_time()
     
     tempo_inicio = time.perf_counter()
     resultado = funcao(*args, **kwargs)
     tempo_fim = time.perf_counter()
     
-    uso_cpu = processo.cpu_percent()
+    processo_depois = time.process_time()
+    energia_depois = ler_energia(dominios)
+    cpu_depois = processo.cpu_times()
+    io_depois = ler_io(processo)
+    
+    serie_cpu = None
+    cpu_amostrador = 0.0
+    if amostragem is not None:
+        serie_cpu = parar_amostragem(amostragem)
+        cpu_amostrador = amostragem["cpu_amostrador"]
+    
+    memoria_pico = None
+    alocacoes = None
+    rss_delta = None
+    if medir_memoria:
+        memoria_pico = tracemalloc.get_traced_memory()[1] - memoria_base
+        alocacoes = sys.getallocatedblocks() - blocos_antes
+        if iniciou_rastreio:
+            tracemalloc.stop()
+        rss_delta = processo.memory_info().rss - rss_antes
+    
     tempo_total = tempo_fim - tempo_inicio
     
-    if uso_cpu > 100.0:
-        uso_cpu = 100.0
+    if alta_resolucao:
+        # process_time inclui a thread de amostragem, que e descontada
+        cpu_proprio = max(0.0, processo_depois - processo_antes - cpu_amostrador)
+    else:
+        cpu_proprio = (cpu_depois.user - cpu_antes.user) + (cpu_depois.system - cpu_antes.system)
+    cpu_filhos = (cpu_depois.children_user - cpu_antes.children_user) + (cpu_depois.children_system - cpu_antes.children_system)
+    cpu_total = cpu_proprio + cpu_filhos
+    
+    uso_cpu = 0.0
+    if tempo_total > 0:
+        uso_cpu = cpu_total / tempo_total * 100
+    
+    limite = 100.0
+    if cpu_filhos > 0:
+        limite = 100.0 * (psutil.cpu_count() or 1)
+    
+    if uso_cpu > limite:
+        uso_cpu = limite
+    
+    io_lidos = None
+    io_escritos = None
+    if io_antes is not None and io_depois is not None:
+        io_lidos = io_depois.read_bytes - io_antes.read_bytes
+        io_escritos = io_depois.write_bytes - io_antes.write_bytes
     
     return {
+        "status": "ok",
         "tempo_execucao": tempo_total,
         "uso_cpu_percent": uso_cpu,
+        "cpu_segundos": cpu_total,
+        "cpu_filhos_segundos": cpu_filhos,
+        "io_bytes_lidos": io_lidos,
+        "io_bytes_escritos": io_escritos,
+        "energia_medida_Wh": energia_consumida(energia_antes, energia_depois),
+        "memoria_pico_bytes": memoria_pico,
+        "alocacoes": alocacoes,
+        "rss_delta_bytes": rss_delta,
+        "serie_cpu": serie_cpu,
+        "tempo_estimado": tempo_total,
         "resultado": resultado
     }
+
+
+def medir_repeticoes(funcao, preparar, repeticoes=5, aquecimento=1, limite_tempo=None, limite_memoria_mb=None,
+                     medir_memoria=False, congelar_gc=False, ao_iniciar=None, duracao_minima=None, contar=False,
+                     **opcoes):
+    """
+    Mede uma funcao varias vezes, cada vez com uma copia nova da entrada
+    
+    As execucoes de aquecimento rodam antes e sao descartadas (carregam
+    caches e estabilizam a frequencia da CPU). Antes de cada execucao o
+    coletor de lixo e chamado, para que uma coleta pendente nao caia
+    dentro da medicao. Com congelar_gc=True os objetos que ja existem
+    tambem sao congelados (gc.freeze) durante a execucao, entao as
+    coletas que acontecerem nela so percorrem os objetos novos
+    
+    Se alguma execucao for interrompida pelos limites, as repeticoes
+    param ali e essa medicao e devolvida (com o status dela)
+    
+    Com medir_memoria=True, depois das repeticoes roda mais uma execucao
+    so para medir a memoria, para que o tracemalloc nao atrase as
+    medicoes de tempo. Os campos de memoria dela vao para o resultado
+    
+    Com duracao_minima, uma chamada de teste roda antes das repeticoes.
+    Se ela durar menos que isso (listas pequenas, de microssegundos),
+    cada repeticao passa a medir um lote de chamadas que dure pelo
+    menos duracao_minima (veja calibrar_chamadas), e tempo, CPU, energia
+    e I/O sao divididos pelo numero de chamadas. A serie de CPU tambem
+    fica na escala de uma chamada (t e dt divididos)
+    
+    Com contar=True roda tambem uma execucao (de uma chamada) com as
+    operacoes contadas (veja contador_operacoes). Ela fica separada
+    pelo mesmo motivo da de memoria: a contagem deixa a execucao varias
+    vezes mais lenta, e as execucoes medidas nao pagam nada por ela
+    
+    Parametros:
+        funcao: A funcao que sera medida
+        preparar: Funcao sem argumentos que devolve uma copia nova da entrada
+        repeticoes: Numero de execucoes medidas (padrao: 5)
+        aquecimento: Numero de execucoes descartadas antes (padrao: 1)
+        limite_tempo: Tempo maximo em segundos por execucao (opcional)
+        limite_memoria_mb: Memoria adicional maxima em MB por execucao (opcional)
+        medir_memoria: Se deve fazer a execucao extra de memoria (padrao: False)
+        congelar_gc: Se deve congelar os objetos antes de cada execucao
+        ao_iniciar: Funcao chamada com o numero de cada execucao antes
+            de ela comecar (opcional)
+        duracao_minima: Segundos minimos de cada medicao (opcional)
+        contar: Se deve fazer a execucao extra de contagem (padrao: False)
+        **opcoes: Outras opcoes de medir_desempenho para as execucoes
+            medidas (intervalo_amostragem, alta_resolucao)
+    
+    Retorna:
+        O dicionario da ultima medicao (como em medir_desempenho),
+        acrescido de "medicoes": a lista com todas as medicoes (so a
+        ultima guarda o resultado, para as listas ordenadas das outras
+        nao ficarem ocupando memoria). Cada medicao tem tambem
+        "chamadas": quantas chamadas foram medidas juntas. Com contar,
+        "operacoes" traz as contagens (None se a execucao nao terminar)
+    """
+    limites = {}
+    if limite_tempo is not None:
+        limites["limite_tempo"] = limite_tempo
+    if limite_memoria_mb is not None:
+        limites["limite_memoria_mb"] = limite_memoria_mb
+    
+    medicoes = []
+    resultado = None
+    execucoes = aquecimento + max(1, repeticoes)
+    
+    chamadas = 1
+    if duracao_minima is not None:
+        teste = executar_repeticao(funcao, preparar, 0, congelar_gc, ao_iniciar, **limites, **opcoes)
+        if teste["status"] != "ok":
+            teste["medicoes"] = medicoes
+            return teste
+        if teste["tempo_execucao"] < duracao_minima:
+            del teste
+            chamadas = calibrar_chamadas(funcao, preparar, duracao_minima)
+    
+    for i in range(execucoes):
+        medicao = executar_repeticao(funcao, preparar, i, congelar_gc, ao_iniciar, chamadas, **limites, **opcoes)
+        
+        if medicao["status"] != "ok":
+            medicao["medicoes"] = medicoes
+            return medicao
+        
+        resultado = medicao.pop("resultado")
+        if i >= aquecimento:
+            medicoes.append(medicao)
+    
+    ultima = dict(medicoes[-1])
+    ultima["medicoes"] = medicoes
+    ultima["resultado"] = resultado
+    
+    if medir_memoria:
+        del resultado
+        medicao = executar_repeticao(funcao, preparar, execucoes, congelar_gc, ao_iniciar, medir_memoria=True, **limites)
+        
+        # Se a execucao mais lenta passar do limite, fica sem os dados de memoria
+        if medicao["status"] == "ok":
+            for campo in ["memoria_pico_bytes", "alocacoes", "rss_delta_bytes"]:
+                ultima[campo] = medicao[campo]
+    
+    if contar:
+        contagem = functools.partial(contar_operacoes, funcao)
+        medicao = executar_repeticao(contagem, preparar, execucoes + 1, congelar_gc, ao_iniciar, **limites)
+        
+        ultima["operacoes"] = None
+        if medicao["status"] == "ok":
+            ultima["operacoes"] = medicao["resultado"]
+    
+    return ultima
+
+
+def executar_repeticao(funcao, preparar, numero, congelar_gc=False, ao_iniciar=None, chamadas=1, **opcoes):
+    """
+    Funcao auxiliar de medir_repeticoes
+    Prepara uma copia nova da entrada (uma para cada chamada do lote),
+    coleta (e congela) o lixo e mede
+    """
+    entradas = []
+    for _ in range(chamadas):
+        entradas.append(preparar())
+    if ao_iniciar is not None:
+        ao_iniciar(numero)
+    
+    gc.collect()
+    if congelar_gc:
+        gc.freeze()
+    
+    try:
+        if chamadas == 1:
+            medicao = medir_desempenho(funcao, entradas.pop(), **opcoes)
+        else:
+            medicao = medir_desempenho(executar_lote, funcao, entradas, **opcoes)
+    finally:
+        if congelar_gc:
+            gc.unfreeze()
+    
+    if medicao["status"] == "ok" and chamadas > 1:
+        dividir_por_chamada(medicao, chamadas)
+    medicao["chamadas"] = chamadas
+    
+    return medicao
+
+
+def executar_lote(funcao, entradas):
+    """
+    Chama a funcao com cada entrada do lote e devolve o ultimo resultado
+    """
+    resultado = None
+    for entrada in entradas:
+        resultado = funcao(entrada)
+    return resultado
+
+
+def calibrar_chamadas(funcao, preparar, duracao_minima):
+    """
+    Escolhe quantas chamadas um lote precisa para durar duracao_minima
+    
+    Como o timeit.Timer.autorange: mede lotes de 1, 2, 5, 10, 20, 50...
+    chamadas ate um deles passar da duracao. O lote para de crescer
+    quando as copias da entrada somariam MAXIMO_ITENS_LOTE elementos
+    
+    Retorna:
+        Numero de chamadas por lote
+    """
+    tamanho = max(1, len(preparar()))
+    maximo = max(1, MAXIMO_ITENS_LOTE // tamanho)
+    
+    base = 1
+    while True:
+        for multiplo in [1, 2, 5]:
+            chamadas = min(base * multiplo, maximo)
+            
+            entradas = []
+            for _ in range(chamadas):
+                entradas.append(preparar())
+            gc.collect()
+            
+            inicio = time.perf_counter()
+            executar_lote(funcao, entradas)
+            duracao = time.perf_counter() - inicio
+            
+            if duracao >= duracao_minima or chamadas == maximo:
+                return chamadas
+        base = base * 10
+
+
+def dividir_por_chamada(medicao, chamadas):
+    """
+    Funcao auxiliar de executar_repeticao
+    Converte a medicao de um lote para os valores de uma chamada
+    (o uso de CPU em % nao muda)
+    """
+    for campo in ["tempo_execucao", "cpu_segundos", "cpu_filhos_segundos", "io_bytes_lidos",
+                  "io_bytes_escritos", "energia_medida_Wh", "tempo_estimado"]:
+        if medicao[campo] is not None:
+            medicao[campo] = medicao[campo] / chamadas
+    
+    if medicao["serie_cpu"] is not None:
+        for amostra in medicao["serie_cpu"]:
+            amostra["t"] = amostra["t"] / chamadas
+            amostra["dt"] = amostra["dt"] / chamadas
+
+
+def medir_isolado(funcao, args, kwargs, limite_tempo=None, limite_memoria_mb=None, estimar=True, opcoes=None):
+    """
+    Mede uma funcao em um processo separado, com limite de tempo e memoria
+    
+    O processo e vigiado (veja vigiar_processo). Se passar do tempo ou da
+    memoria adicional permitida, ele (e os processos que ele criou) e
+    encerrado. O resultado entao fica marcado como "timeout" ou
+    "memoria", com a CPU gasta ate ali e um tempo estimado para a
+    execucao completa (veja estimar_tempo_total)
+    
+    Parametros:
+        funcao: A funcao que sera medida
+        args: Tupla com os argumentos da funcao
+        kwargs: Dicionario com os argumentos nomeados
+        limite_tempo: Tempo maximo em segundos (None = sem limite)
+        limite_memoria_mb: Memoria adicional maxima em MB (None = sem limite)
+        estimar: Se deve estimar o tempo total quando for interrompida
+        opcoes: Dicionario com as opcoes de medicao de medir_desempenho
+            (medir_memoria, intervalo_amostragem, alta_resolucao)
+    
+    Retorna:
+        Dicionario no mesmo formato de medir_desempenho
+    """
+    receptor, emissor = multiprocessing.Pipe(duplex=False)
+    trabalhador = multiprocessing.Process(target=executar_no_trabalhador, args=(emissor, funcao, args, kwargs, opcoes or {}))
+    
+    trabalhador.start()
+    emissor.close()
+    
+    status, resposta, parcial = vigiar_processo(trabalhador, receptor, limite_tempo, limite_memoria_mb)
+    
+    if status != "ok":
+        encerrar_arvore(psutil.Process(trabalhador.pid))
+    trabalhador.join()
+    receptor.close()
+    
+    if status == "ok":
+        return resposta
+    
+    tempo_estimado = None
+    if estimar and status in ["timeout", "memoria"]:
+        tempo_estimado = estimar_tempo_total(funcao, args, kwargs, limite_tempo)
+    
+    return medicao_interrompida(status, parcial, tempo_estimado, resposta)
+
+
+def vigiar_processo(trabalhador, conexao, limite_tempo=None, limite_memoria_mb=None, tratar=None):
+    """
+    Acompanha um processo de medicao ate ele responder ou passar dos limites
+    
+    O processo e verificado a cada INTERVALO_VERIFICACAO segundos. Ele
+    avisa o inicio de cada execucao com a mensagem ("inicio", ...), que
+    zera o relogio e as bases de CPU, memoria e energia. Qualquer outra
+    mensagem e a resposta final, a menos que a funcao tratar (opcional)
+    a receba e devolva True. O processo nao e encerrado aqui
+    
+    Parametros:
+        trabalhador: Processo (multiprocessing.Process) sendo vigiado
+        conexao: Ponta do pipe por onde ele responde
+        limite_tempo: Tempo maximo em segundos por execucao (None = sem limite)
+        limite_memoria_mb: Memoria adicional maxima em MB (None = sem limite)
+        tratar: Funcao chamada com as mensagens intermediarias (opcional)
+    
+    Retorna:
+        Tupla (status, resposta, parcial): status e "ok", "erro",
+        "timeout" ou "memoria"; resposta e o conteudo da mensagem final;
+        parcial tem o que foi gasto na execucao em andamento (decorrido,
+        cpu_segundos, energia_medida_Wh e rss_delta_bytes)
+    """
+    filho = psutil.Process(trabalhador.pid)
+    dominios = listar_dominios()
+    momento_criacao = time.perf_counter()
+    energia_inicio = None
+    momento_inicio = None
+    cpu_inicio = 0.0
+    memoria_inicio = 0
+    status = None
+    resposta = None
+    
+    while status is None:
+        if conexao.poll(INTERVALO_VERIFICACAO):
+            try:
+                mensagem = conexao.recv()
+            except EOFError:
+                status = "erro"
+                resposta = "O processo de medicao terminou sem responder"
+                break
+            
+            if mensagem[0] == "inicio":
+                momento_inicio = time.perf_counter()
+                energia_inicio = ler_energia(dominios)
+                cpu_inicio = cpu_da_arvore(filho)
+                memoria_inicio = memoria_do_processo(filho)
+                continue
+            
+            if tratar is not None and tratar(mensagem):
+                continue
+            
+            status, resposta = mensagem
+            break
+        
+        if not trabalhador.is_alive():
+            status = "erro"
+            resposta = "O processo de medicao terminou sem responder"
+            break
+        
+        referencia = momento_inicio if momento_inicio is not None else momento_criacao
+        decorrido = time.perf_counter() - referencia
+        
+        if limite_tempo is not None and decorrido > limite_tempo:
+            status = "timeout"
+        elif limite_memoria_mb is not None and momento_inicio is not None:
+            if memoria_do_processo(filho) - memoria_inicio > limite_memoria_mb * 1024 * 1024:
+                status = "memoria"
+    
+    parcial = {
+        "decorrido": 0.0,
+        "cpu_segundos": 0.0,
+        "energia_medida_Wh": None,
+        "rss_delta_bytes": None,
+    }
+    
+    if status != "ok" and momento_inicio is not None:
+        parcial["decorrido"] = time.perf_counter() - momento_inicio
+        parcial["cpu_segundos"] = max(0.0, cpu_da_arvore(filho) - cpu_inicio)
+        parcial["energia_medida_Wh"] = energia_consumida(energia_inicio, ler_energia(dominios))
+        parcial["rss_delta_bytes"] = memoria_do_processo(filho) - memoria_inicio
+    
+    return status, resposta, parcial
+
+
+def medicao_interrompida(status, parcial, tempo_estimado=None, erro=None):
+    """
+    Monta o resultado (no formato de medir_desempenho) de uma execucao
+    que nao terminou, com os valores parciais de vigiar_processo
+    """
+    decorrido = parcial["decorrido"]
+    
+    uso_cpu = 0.0
+    if decorrido > 0:
+        uso_cpu = min(parcial["cpu_segundos"] / decorrido * 100, 100.0 * (psutil.cpu_count() or 1))
+    
+    if tempo_estimado is not None and tempo_estimado < decorrido:
+        tempo_estimado = decorrido
+    
+    return {
+        "status": status,
+        "tempo_execucao": decorrido,
+        "uso_cpu_percent": uso_cpu,
+        "cpu_segundos": parcial["cpu_segundos"],
+        "cpu_filhos_segundos": 0.0,
+        "io_bytes_lidos": None,
+        "io_bytes_escritos": None,
+        "energia_medida_Wh": parcial["energia_medida_Wh"],
+        "memoria_pico_bytes": None,
+        "alocacoes": None,
+        "rss_delta_bytes": parcial["rss_delta_bytes"],
+        "serie_cpu": None,
+        "tempo_estimado": tempo_estimado,
+        "erro": erro if status == "erro" else None,
+        "resultado": None
+    }
+
+
+def executar_no_trabalhador(conexao, funcao, args, kwargs, opcoes):
+    """
+    Executada no processo isolado: avisa o inicio, mede a funcao e
+    devolve a medicao (ou o erro) pelo pipe
+    """
+    try:
+        conexao.send(("inicio", None))
+        medicao = medir_desempenho(funcao, *args, **opcoes, **kwargs)
+        conexao.send(("ok", medicao))
+    except BaseException as erro:
+        conexao.send(("erro", f"{type(erro).__name__}: {erro}"))
+    finally:
+        conexao.close()
+
+
+def estimar_tempo_total(funcao, args, kwargs, limite_tempo=None):
+    """
+    Estima quanto tempo a funcao levaria com a entrada completa
+    
+    Mede a funcao com o inicio da lista, dobrando o tamanho a cada
+    medida ate ela levar TEMPO_CALIBRACAO segundos (ou chegar a metade
+    da lista). Ajusta o expoente k de t = c * n^k as medidas e
+    extrapola a partir da maior delas para o tamanho real
+    
+    Retorna:
+        Tempo estimado em segundos, ou None se nao for possivel estimar
+    """
+    if not args or not hasattr(args[0], "__len__"):
+        return None
+    
+    tamanho = len(args[0])
+    parcial = min(256, tamanho // 4)
+    if parcial < 16:
+        return None
+    
+    limite_calibracao = None
+    if limite_tempo is not None:
+        limite_calibracao = limite_tempo / 2
+    
+    medidas = []
+    while parcial <= tamanho // 2:
+        args_parciais = (args[0][:parcial],) + tuple(args[1:])
+        medicao = medir_isolado(funcao, args_parciais, kwargs, limite_calibracao, None, estimar=False)
+        if medicao["status"] != "ok" or medicao["tempo_execucao"] <= 0:
+            break
+        
+        medidas.append((parcial, medicao["tempo_execucao"]))
+        if medicao["tempo_execucao"] >= TEMPO_CALIBRACAO:
+            break
+        parcial = parcial * 2
+    
+    # Medidas muito curtas sao dominadas por ruido
+    medidas = [(n, t) for n, t in medidas if t >= 0.001]
+    if len(medidas) < 2:
+        return None
+    
+    # Reta de minimos quadrados em escala log-log: a inclinacao e k
+    ajuste = ajustar_potencia([n for n, t in medidas], [t for n, t in medidas])
+    expoente = min(max(ajuste[0], 1.0), 3.0)
+    maior, tempo_maior = medidas[-1]
+    
+    return tempo_maior * (tamanho / maior) ** expoente
+
+
+def cpu_da_arvore(processo):
+    """
+    Soma o tempo de CPU de um processo e de todos os processos que ele criou
+    """
+    total = 0.0
+    
+    try:
+        processos = [processo] + processo.children(recursive=True)
+    except psutil.NoSuchProcess:
+        return 0.0
+    
+    for p in processos:
+        try:
+            tempos = p.cpu_times()
+            total = total + tempos.user + tempos.system + tempos.children_user + tempos.children_system
+        except psutil.NoSuchProcess:
+            pass
+    
+    return total
+
+
+def memoria_do_processo(processo):
+    """
+    Memoria residente (RSS) de um processo e dos processos que ele criou
+    """
+    total = 0
+    
+    try:
+        processos = [processo] + processo.children(recursive=True)
+    except psutil.NoSuchProcess:
+        return 0
+    
+    for p in processos:
+        try:
+            total = total + p.memory_info().rss
+        except psutil.NoSuchProcess:
+            pass
+    
+    return total
+
+
+def encerrar_arvore(processo):
+    """
+    Encerra um processo e todos os processos que ele criou
+    """
+    try:
+        processos = processo.children(recursive=True) + [processo]
+    except psutil.NoSuchProcess:
+        return
+    
+    for p in processos:
+        try:
+            p.kill()
+        except psutil.NoSuchProcess:
+            pass
+
+
+def ler_io(processo):
+    """
+    Le os contadores de I/O de disco do processo, ou None se o sistema
+    nao oferecer (por exemplo, no macOS)
+    """
+    if not hasattr(processo, "io_counters"):
+        return None
+    
+    try:
+        return processo.io_counters()
+    except (psutil.AccessDenied, NotImplementedError):
+        return None
@@ -0,0 +1,124 @@
+"""
+Modulo para ler a energia consumida pelo processador
+Usa os contadores RAPL do Linux (/sys/class/powercap/intel-rapl*)
+"""
+import os
+
+# Pasta do powercap no sysfs. Pode ser trocada pela variavel de ambiente
+# POWERCAP_RAIZ (por exemplo, para testar com uma arvore falsa)
+RAIZ_POWERCAP = os.environ.get("POWERCAP_RAIZ", "/sys/class/powercap")
+
+
+def listar_dominios(raiz=None):
+    """
+    Lista os dominios RAPL de nivel mais alto (um por processador)
+    
+    Os subdominios (intel-rapl:0:0, nucleos, memoria...) ja estao
+    incluidos no pacote e o dominio "psys" cobre o sistema todo, entao
+    nenhum deles e somado para nao contar a mesma energia duas vezes
+    
+    Parametros:
+        raiz: Pasta do powercap (padrao: RAIZ_POWERCAP)
+    
+    Retorna:
+        Lista com o caminho de cada dominio que pode ser lido
+        (vazia se nao houver RAPL ou sem permissao de leitura)
+    """
+    if raiz is None:
+        raiz = RAIZ_POWERCAP
+    
+    try:
+        nomes = sorted(os.listdir(raiz))
+    except OSError:
+        return []
+    
+    dominios = []
+    for nome in nomes:
+        if not nome.startswith("intel-rapl:") or nome.count(":") != 1:
+            continue
+        
+        caminho = os.path.join(raiz, nome)
+        
+        if ler_texto(os.path.join(caminho, "name")) == "psys":
+            continue
+        
+        if ler_contador(caminho, "energy_uj") is None:
+            continue
+        
+        dominios.append(caminho)
+    
+    return dominios
+
+
+def ler_energia(dominios):
+    """
+    Le o contador de energia (em microjoules) de cada dominio
+    
+    Retorna:
+        Dicionario {caminho: microjoules}, ou None se algum nao puder ser lido
+    """
+    leitura = {}
+    
+    for dominio in dominios:
+        valor = ler_contador(dominio, "energy_uj")
+        if valor is None:
+            return None
+        leitura[dominio] = valor
+    
+    return leitura
+
+
+def energia_consumida(antes, depois):
+    """
+    Calcula a energia consumida entre duas leituras de ler_energia
+    
+    O contador volta a zero quando chega em max_energy_range_uj. Se a
+    leitura de depois for menor que a de antes, o contador deu a volta
+    (so uma volta e considerada: com o maximo tipico de 262 kJ, cada
+    volta leva dezenas de minutos com o processador em carga)
+    
+    Retorna:
+        Energia em Wh, ou None se alguma leitura estiver faltando
+    """
+    if not antes or not depois:
+        return None
+    
+    total_uj = 0
+    for dominio, valor_antes in antes.items():
+        if dominio not in depois:
+            return None
+        
+        diferenca = depois[dominio] - valor_antes
+        if diferenca < 0:
+            maximo = ler_contador(dominio, "max_energy_range_uj")
+            if maximo is None:
+                return None
+            diferenca = diferenca + maximo
+        
+        total_uj = total_uj + diferenca
+    
+    # 1 Wh = 3600 J = 3.6e9 uJ
+    return total_uj / 3.6e9
+
+
+def ler_contador(dominio, arquivo):
+    """
+    Le um arquivo numerico de um dominio RAPL (None se nao der)
+    """
+    texto = ler_texto(os.path.join(dominio, arquivo))
+    
+    try:
+        return int(texto)
+    except (TypeError, ValueError):
+        return None
+
+
+def ler_texto(caminho):
+    """
+    Le um arquivo pequeno do sysfs (None se nao existir ou sem permissao)
+    """
+    try:
+        with open(caminho) as arquivo:
+            return arquivo.read().strip()
+    except OSError:
+        return None
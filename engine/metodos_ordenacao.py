@@ -3,6 +3,7 @@ Modulo de algoritmos de ordenacao
 Implementa varios metodos para ordenar listas de numeros
 """
 import random
+from bisect import bisect_right
 
 
 def bubble_sort(lista):
@@ -41,6 +42,26 @@ def insertion_sort(lista):
     return lista_copia
 
 
+def insertion_sort_binaria(lista):
+    """
+    Insertion Sort binario - Acha a posicao com busca binaria (bisect)
+    e move o elemento com list.insert, que desloca o bloco de uma vez
+    Faz O(n log n) comparacoes, mas o deslocamento continua O(n²)
+    (feito em C, sem passar pelo interpretador a cada elemento)
+    """
+    lista_copia = lista[:]
+    
+    for i in range(1, len(lista_copia)):
+        elemento_atual = lista_copia[i]
+        posicao = bisect_right(lista_copia, elemento_atual, 0, i)
+        
+        if posicao < i:
+            del lista_copia[i]
+            lista_copia.insert(posicao, elemento_atual)
+    
+    return lista_copia
+
+
 def merge_sort(lista):
     """
     Merge Sort - Divide a lista em partes menores e depois junta ordenando
@@ -84,6 +105,111 @@ def juntar_listas(esquerda, direita):
     return resultado
 
 
+def merge_sort_buffer(lista):
+    """
+    Merge Sort com buffer unico - Trabalha com intervalos de indices
+    Usa um unico buffer auxiliar alocado uma vez, sem criar sublistas
+    Complexidade: O(n log n)
+    """
+    lista_copia = lista[:]
+    auxiliar = lista_copia[:]
+    
+    ordenar_intervalo(auxiliar, lista_copia, 0, len(lista_copia))
+    
+    return lista_copia
+
+
+def ordenar_intervalo(origem, destino, inicio, fim):
+    """
+    Funcao auxiliar do Merge Sort com buffer
+    Ordena origem[inicio:fim] e grava o resultado em destino[inicio:fim]
+    As duas listas devem comecar com o mesmo conteudo nesse intervalo;
+    a cada nivel os papeis se invertem, entao nada precisa ser copiado
+    """
+    if fim - inicio <= 1:
+        return
+    
+    meio = (inicio + fim) // 2
+    ordenar_intervalo(destino, origem, inicio, meio)
+    ordenar_intervalo(destino, origem, meio, fim)
+    
+    juntar_intervalos(origem, destino, inicio, meio, fim)
+
+
+def juntar_intervalos(origem, destino, inicio, meio, fim):
+    """
+    Funcao auxiliar do Merge Sort com buffer
+    Junta origem[inicio:meio] e origem[meio:fim] (ja ordenados)
+    em destino[inicio:fim]
+    """
+    i = inicio
+    j = meio
+    k = inicio
+    
+    while i < meio and j < fim:
+        if origem[i] <= origem[j]:
+            destino[k] = origem[i]
+            i = i + 1
+        else:
+            destino[k] = origem[j]
+            j = j + 1
+        k = k + 1
+    
+    while i < meio:
+        destino[k] = origem[i]
+        i = i + 1
+        k = k + 1
+    
+    while j < fim:
+        destino[k] = origem[j]
+        j = j + 1
+        k = k + 1
+
+
+def merge_sort_iterativo(lista, tamanho_minimo=32):
+    """
+    Merge Sort iterativo (bottom-up) com buffer unico
+    Ordena blocos pequenos com insertion sort e depois junta blocos
+    de tamanho crescente, alternando entre a lista e o buffer
+    Complexidade: O(n log n)
+    """
+    origem = lista[:]
+    tamanho = len(origem)
+    destino = origem[:]
+    
+    for inicio in range(0, tamanho, tamanho_minimo):
+        fim = min(inicio + tamanho_minimo, tamanho)
+        insertion_sort_intervalo(origem, inicio, fim)
+    
+    largura = tamanho_minimo
+    while largura < tamanho:
+        for inicio in range(0, tamanho, 2 * largura):
+            meio = min(inicio + largura, tamanho)
+            fim = min(inicio + 2 * largura, tamanho)
+            juntar_intervalos(origem, destino, inicio, meio, fim)
+        
+        origem, destino = destino, origem
+        largura = largura * 2
+    
+    return origem
+
+
+def insertion_sort_intervalo(lista, inicio, fim):
+    """
+    Insertion Sort no lugar, restrito a lista[inicio:fim]
+    Usado para os blocos pequenos do Merge Sort iterativo
+    """
+    for i in range(inicio + 1, fim):
+        elemento_atual = lista[i]
+        posicao = i - 1
+        
+        while posicao >= inicio and lista[posicao] > elemento_atual:
+            lista[posicao + 1] = lista[posicao]
+            posicao = posicao - 1
+        
+        lista[posicao + 1] = elemento_atual
+
+
 def quick_sort(lista):
     """
     Quick Sort - Escolhe um pivo e separa elementos menores e maiores
@@ -105,6 +231,236 @@ def quick_sort(lista):
     return quick_sort(menores) + [pivo] + quick_sort(maiores)
 
 
+def quick_sort_introsort(lista):
+    """
+    Quick Sort no lugar (estilo Introsort)
+    Pivo pela mediana de tres (ou ninther em intervalos grandes),
+    particao em tres partes para lidar com valores repetidos e
+    recursao apenas no lado menor. Se a profundidade passar do limite,
+    o intervalo e ordenado com Heap Sort
+    Complexidade: O(n log n) no pior caso
+    """
+    lista_copia = lista[:]
+    tamanho = len(lista_copia)
+    
+    profundidade_maxima = 2 * tamanho.bit_length()
+    ordenar_introsort(lista_copia, 0, tamanho - 1, profundidade_maxima)
+    
+    return lista_copia
+
+
+def ordenar_introsort(lista, inicio, fim, profundidade):
+    """
+    Funcao auxiliar do Quick Sort introsort
+    Ordena lista[inicio..fim] (fim incluso)
+    """
+    while fim - inicio > 16:
+        if profundidade == 0:
+            heap_sort_intervalo(lista, inicio, fim)
+            return
+        profundidade = profundidade - 1
+        
+        pivo = escolher_pivo(lista, inicio, fim)
+        menor, maior = particionar_tres_partes(lista, inicio, fim, pivo)
+        
+        # Recursao no lado menor e laco no lado maior: pilha O(log n)
+        if menor - inicio < fim - maior:
+            ordenar_introsort(lista, inicio, menor - 1, profundidade)
+            inicio = maior + 1
+        else:
+            ordenar_introsort(lista, maior + 1, fim, profundidade)
+            fim = menor - 1
+    
+    insertion_sort_intervalo(lista, inicio, fim + 1)
+
+
+def mediana_de_tres(lista, a, b, c):
+    """
+    Retorna o valor mediano entre lista[a], lista[b] e lista[c]
+    """
+    x = lista[a]
+    y = lista[b]
+    z = lista[c]
+    
+    if x < y:
+        if y < z:
+            return y
+        if x < z:
+            return z
+        return x
+    
+    if x < z:
+        return x
+    if y < z:
+        return z
+    return y
+
+
+def escolher_pivo(lista, inicio, fim):
+    """
+    Escolhe o pivo pela mediana de tres
+    Para intervalos grandes usa o ninther (mediana de tres medianas)
+    """
+    meio = (inicio + fim) // 2
+    
+    if fim - inicio < 128:
+        return mediana_de_tres(lista, inicio, meio, fim)
+    
+    passo = (fim - inicio) // 8
+    primeira = mediana_de_tres(lista, inicio, inicio + passo, inicio + 2 * passo)
+    segunda = mediana_de_tres(lista, meio - passo, meio, meio + passo)
+    terceira = mediana_de_tres(lista, fim - 2 * passo, fim - passo, fim)
+    
+    if primeira < segunda:
+        if segunda < terceira:
+            return segunda
+        if primeira < terceira:
+            return terceira
+        return primeira
+    
+    if primeira < terceira:
+        return primeira
+    if segunda < terceira:
+        return terceira
+    return segunda
+
+
+def particionar_tres_partes(lista, inicio, fim, pivo):
+    """
+    Particao de Dijkstra (bandeira holandesa)
+    Reorganiza lista[inicio..fim] em menores, iguais e maiores que o pivo
+    Retorna os indices do primeiro e do ultimo elemento igual ao pivo
+    """
+    menor = inicio
+    atual = inicio
+    maior = fim
+    
+    while atual <= maior:
+        valor = lista[atual]
+        if valor < pivo:
+            lista[menor], lista[atual] = valor, lista[menor]
+            menor = menor + 1
+            atual = atual + 1
+        elif valor > pivo:
+            lista[atual], lista[maior] = lista[maior], valor
+            maior = maior - 1
+        else:
+            atual = atual + 1
+    
+    return menor, maior
+
+
+def heap_sort_intervalo(lista, inicio, fim):
+    """
+    Heap Sort no lugar, restrito a lista[inicio..fim] (fim incluso)
+    Usado pelo Quick Sort introsort quando a recursao fica profunda demais
+    """
+    tamanho = fim - inicio + 1
+    
+    for raiz in range(tamanho // 2 - 1, -1, -1):
+        descer_heap(lista, inicio, raiz, tamanho)
+    
+    for ultimo in range(tamanho - 1, 0, -1):
+        lista[inicio], lista[inicio + ultimo] = lista[inicio + ultimo], lista[inicio]
+        descer_heap(lista, inicio, 0, ultimo)
+
+
+def descer_heap(lista, inicio, raiz, tamanho):
+    """
+    Funcao auxiliar do Heap Sort
+    Desce o elemento da raiz ate restaurar a propriedade de heap maximo
+    """
+    while True:
+        filho = 2 * raiz + 1
+        if filho >= tamanho:
+            return
+        
+        if filho + 1 < tamanho and lista[inicio + filho + 1] > lista[inicio + filho]:
+            filho = filho + 1
+        
+        if lista[inicio + raiz] >= lista[inicio + filho]:
+            return
+        
+        lista[inicio + raiz], lista[inicio + filho] = lista[inicio + filho], lista[inicio + raiz]
+        raiz = filho
+
+
+# Acima desse numero de valores distintos possiveis o Counting Sort
+# usaria memoria demais e o Radix Sort e usado no lugar, mesmo que o
+# intervalo seja pequeno comparado ao tamanho da lista
+LIMITE_CONTAGEM = 1 << 24
+
+
+def radix_counting_sort(lista):
+    """
+    Radix/Counting Sort - Ordena inteiros sem comparar elementos
+    Detecta o menor e o maior valor da lista. Se o intervalo de valores
+    for de ate o dobro do tamanho da lista (e de ate LIMITE_CONTAGEM),
+    uma unica contagem basta (Counting Sort); senao, percorrer os
+    contadores custaria mais que ordenar e usa o Radix Sort LSD
+    Complexidade: O(n + k) na contagem, com k o tamanho do intervalo,
+    e O(d * (n + b)) no Radix Sort, com d passadas e base b
+    """
+    if len(lista) <= 1:
+        return list(lista)
+    
+    minimo = min(lista)
+    amplitude = max(lista) - minimo + 1
+    
+    if amplitude <= 2 * len(lista) and amplitude <= LIMITE_CONTAGEM:
+        return counting_sort(lista, minimo, amplitude)
+    return radix_sort(lista, minimo, amplitude)
+
+
+def counting_sort(lista, minimo, amplitude):
+    """
+    Funcao auxiliar do Radix/Counting Sort
+    Conta quantas vezes cada valor aparece, com um contador por valor
+    possivel, e reconstroi a lista a partir das contagens
+    """
+    contagens = [0] * amplitude
+    for valor in lista:
+        contagens[valor - minimo] += 1
+    
+    resultado = []
+    for deslocado in range(amplitude):
+        quantidade = contagens[deslocado]
+        if quantidade > 0:
+            resultado.extend([deslocado + minimo] * quantidade)
+    
+    return resultado
+
+
+def radix_sort(lista, minimo, amplitude):
+    """
+    Funcao auxiliar do Radix/Counting Sort
+    Radix Sort LSD: distribui os numeros em baldes digito por digito,
+    do menos significativo para o mais significativo. A base (de 2^8 a
+    2^16) e o numero de passadas vem do intervalo de valores
+    """
+    tamanho = len(lista)
+    bits_totais = (amplitude - 1).bit_length()
+    bits_digito = min(16, max(8, tamanho.bit_length()))
+    passadas = -(-bits_totais // bits_digito)
+    bits_digito = -(-bits_totais // passadas)
+    
+    base = 1 << bits_digito
+    mascara = base - 1
+    
+    atual = [valor - minimo for valor in lista]
+    
+    for passada in range(passadas):
+        deslocamento = passada * bits_digito
+        baldes = [[] for _ in range(base)]
+        
+        for valor in atual:
+            baldes[(valor >> deslocamento) & mascara].append(valor)
+        
+        atual = [valor for balde in baldes for valor in balde]
+    
+    return [valor + minimo for valor in atual]
+
+
 def verificar_ordenada(lista):
     """
     Verifica se uma lista esta em ordem crescente
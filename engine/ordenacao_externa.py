@@ -0,0 +1,205 @@
+"""
+Modulo de ordenacao externa
+Ordena arquivos binarios de numeros maiores que a memoria disponivel
+"""
+import heapq
+import os
+import tempfile
+import time
+
+import numpy as np
+
+# Cada numero ocupa 8 bytes no arquivo (int64)
+TAMANHO_ITEM = 8
+
+# Durante a juncao os numeros viram int do Python: cerca de 32 bytes
+# pelo objeto, 8 pelo ponteiro na lista e 8 pela copia no bloco NumPy
+CUSTO_ITEM_PYTHON = 48
+
+MEMORIA_PADRAO = 64 * 1024 * 1024
+
+
+def escrever_arquivo_binario(lista, caminho):
+    """
+    Grava uma lista (ou vetor) de numeros em um arquivo binario int64
+    
+    Retorna:
+        Quantidade de bytes gravados
+    """
+    vetor = np.asarray(lista, dtype=np.int64)
+    vetor.tofile(caminho)
+    return vetor.nbytes
+
+
+def ler_arquivo_binario(caminho):
+    """
+    Le um arquivo binario int64 inteiro para um vetor NumPy
+    """
+    return np.fromfile(caminho, dtype=np.int64)
+
+
+def verificar_arquivo_ordenado(caminho, itens_por_bloco=1 << 20):
+    """
+    Verifica se um arquivo binario int64 esta em ordem crescente,
+    lendo um bloco por vez
+    """
+    anterior = None
+    
+    with open(caminho, "rb") as arquivo:
+        while True:
+            bloco = np.fromfile(arquivo, dtype=np.int64, count=itens_por_bloco)
+            if len(bloco) == 0:
+                return True
+            
+            if anterior is not None and bloco[0] < anterior:
+                return False
+            if np.any(bloco[:-1] > bloco[1:]):
+                return False
+            
+            anterior = bloco[-1]
+
+
+def ordenar_arquivo(caminho_entrada, caminho_saida, memoria_bytes=MEMORIA_PADRAO, diretorio_temp=None):
+    """
+    Merge Sort externo
+    
+    1. Le o arquivo em trechos que cabem no limite de memoria, ordena
+       cada trecho e grava em um arquivo temporario mapeado em memoria
+    2. Junta todos os trechos com um heap (k-way merge), lendo cada um
+       em blocos e gravando a saida em blocos
+    
+    O pico de memoria fica limitado por memoria_bytes (aproximadamente:
+    na juncao cada numero custa CUSTO_ITEM_PYTHON bytes)
+    
+    Parametros:
+        caminho_entrada: Arquivo binario int64 a ordenar
+        caminho_saida: Arquivo onde o resultado ordenado sera gravado
+        memoria_bytes: Limite de memoria para os dados (padrao: 64 MB)
+        diretorio_temp: Onde criar os trechos temporarios (opcional)
+    
+    Retorna:
+        Dicionario com itens, trechos, bytes_lidos, bytes_escritos,
+        tempo_io e memoria_bytes
+    """
+    estatisticas = {
+        "itens": 0,
+        "trechos": 0,
+        "bytes_lidos": 0,
+        "bytes_escritos": 0,
+        "tempo_io": 0.0,
+        "memoria_bytes": memoria_bytes,
+    }
+    
+    itens_por_trecho = max(1, memoria_bytes // TAMANHO_ITEM)
+    
+    with tempfile.TemporaryDirectory(dir=diretorio_temp) as pasta:
+        caminhos_trechos = gerar_trechos(caminho_entrada, pasta, itens_por_trecho, estatisticas)
+        juntar_trechos(caminhos_trechos, caminho_saida, memoria_bytes, estatisticas)
+    
+    return estatisticas
+
+
+def gerar_trechos(caminho_entrada, pasta, itens_por_trecho, estatisticas):
+    """
+    Funcao auxiliar do Merge Sort externo
+    Le a entrada em trechos, ordena cada um e grava em arquivos
+    temporarios mapeados em memoria
+    
+    Retorna:
+        Lista com (caminho, quantidade de itens) de cada trecho
+    """
+    trechos = []
+    restantes = os.path.getsize(caminho_entrada) // TAMANHO_ITEM
+    
+    with open(caminho_entrada, "rb") as entrada:
+        while restantes > 0:
+            # Le exatamente o que falta: pedir mais que isso faz o NumPy
+            # alocar o bloco inteiro mesmo no fim do arquivo
+            inicio_io = time.perf_counter()
+            bloco = np.fromfile(entrada, dtype=np.int64, count=min(itens_por_trecho, restantes))
+            estatisticas["tempo_io"] += time.perf_counter() - inicio_io
+            
+            if len(bloco) == 0:
+                break
+            
+            restantes -= len(bloco)
+            
+            estatisticas["bytes_lidos"] += bloco.nbytes
+            estatisticas["itens"] += len(bloco)
+            
+            bloco.sort()
+            
+            caminho = os.path.join(pasta, f"trecho_{len(trechos)}.bin")
+            
+            inicio_io = time.perf_counter()
+            mapa = np.memmap(caminho, dtype=np.int64, mode="w+", shape=(len(bloco),))
+            mapa[:] = bloco
+            mapa.flush()
+            del mapa
+            estatisticas["tempo_io"] += time.perf_counter() - inicio_io
+            
+            estatisticas["bytes_escritos"] += bloco.nbytes
+            trechos.append((caminho, len(bloco)))
+            del bloco
+    
+    estatisticas["trechos"] = len(trechos)
+    return trechos
+
+
+def juntar_trechos(trechos, caminho_saida, memoria_bytes, estatisticas):
+    """
+    Funcao auxiliar do Merge Sort externo
+    Junta os trechos ordenados com heapq.merge, usando um buffer de
+    leitura por trecho e um buffer de escrita, todos do mesmo tamanho
+    """
+    itens_por_buffer = max(1, memoria_bytes // ((len(trechos) + 1) * CUSTO_ITEM_PYTHON))
+    
+    leitores = []
+    for caminho, quantidade in trechos:
+        leitores.append(ler_trecho(caminho, quantidade, itens_por_buffer, estatisticas))
+    
+    with open(caminho_saida, "wb") as saida:
+        buffer = []
+        
+        for valor in heapq.merge(*leitores):
+            buffer.append(valor)
+            
+            if len(buffer) >= itens_por_buffer:
+                gravar_buffer(saida, buffer, estatisticas)
+                buffer = []
+        
+        if buffer:
+            gravar_buffer(saida, buffer, estatisticas)
+
+
+def ler_trecho(caminho, quantidade, itens_por_buffer, estatisticas):
+    """
+    Gerador que le um trecho mapeado em memoria, um bloco por vez
+    """
+    if quantidade == 0:
+        return
+    
+    mapa = np.memmap(caminho, dtype=np.int64, mode="r", shape=(quantidade,))
+    
+    for inicio in range(0, quantidade, itens_por_buffer):
+        inicio_io = time.perf_counter()
+        bloco = np.array(mapa[inicio:inicio + itens_por_buffer])
+        estatisticas["tempo_io"] += time.perf_counter() - inicio_io
+        estatisticas["bytes_lidos"] += bloco.nbytes
+        
+        yield from bloco.tolist()
+    
+    del mapa
+
+
+def gravar_buffer(saida, buffer, estatisticas):
+    """
+    Grava o buffer de saida no arquivo como int64
+    """
+    vetor = np.array(buffer, dtype=np.int64)
+    
+    inicio_io = time.perf_counter()
+    vetor.tofile(saida)
+    estatisticas["tempo_io"] += time.perf_counter() - inicio_io
+    
+    estatisticas["bytes_escritos"] += vetor.nbytes
@@ -0,0 +1,125 @@
+/*
+ * Algoritmos de ordenacao em C, compilados nesta maquina e chamados
+ * pelo Python com ctypes (veja ordenacao_nativa.py)
+ *
+ * Sao os mesmos algoritmos de benchmark/benchmark_c.c, com numeros int64
+ * (como os vetores do NumPy) e duas mudancas que nao alteram o trabalho
+ * feito: o Merge Sort usa um buffer so, alocado uma vez, e o Quick Sort
+ * chama a recursao so no lado menor, para que listas ja ordenadas nao
+ * estourem a pilha do processo
+ */
+#include <stdint.h>
+#include <stdlib.h>
+
+void bubble_sort(int64_t arr[], int64_t n) {
+    for (int64_t i = 0; i < n - 1; i++) {
+        for (int64_t j = 0; j < n - i - 1; j++) {
+            if (arr[j] > arr[j + 1]) {
+                int64_t temp = arr[j];
+                arr[j] = arr[j + 1];
+                arr[j + 1] = temp;
+            }
+        }
+    }
+}
+
+void insertion_sort(int64_t arr[], int64_t n) {
+    for (int64_t i = 1; i < n; i++) {
+        int64_t chave = arr[i];
+        int64_t j = i - 1;
+        while (j >= 0 && arr[j] > chave) {
+            arr[j + 1] = arr[j];
+            j--;
+        }
+        arr[j + 1] = chave;
+    }
+}
+
+static void merge(int64_t arr[], int64_t aux[], int64_t l, int64_t m, int64_t r) {
+    for (int64_t k = l; k <= r; k++)
+        aux[k] = arr[k];
+
+    int64_t i = l, j = m + 1, k = l;
+    while (i <= m && j <= r) {
+        if (aux[i] <= aux[j]) {
+            arr[k] = aux[i];
+            i++;
+        } else {
+            arr[k] = aux[j];
+            j++;
+        }
+        k++;
+    }
+
+    while (i <= m) {
+        arr[k] = aux[i];
+        i++;
+        k++;
+    }
+
+    while (j <= r) {
+        arr[k] = aux[j];
+        j++;
+        k++;
+    }
+}
+
+static void merge_sort_rec(int64_t arr[], int64_t aux[], int64_t l, int64_t r) {
+    if (l < r) {
+        int64_t m = l + (r - l) / 2;
+        merge_sort_rec(arr, aux, l, m);
+        merge_sort_rec(arr, aux, m + 1, r);
+        merge(arr, aux, l, m, r);
+    }
+}
+
+/* Retorna 0, ou -1 se nao houver memoria para o buffer */
+int merge_sort(int64_t arr[], int64_t n) {
+    if (n < 2)
+        return 0;
+
+    int64_t *aux = malloc(n * sizeof(int64_t));
+    if (aux == NULL)
+        return -1;
+
+    merge_sort_rec(arr, aux, 0, n - 1);
+    free(aux);
+    return 0;
+}
+
+static int64_t partition(int64_t arr[], int64_t low, int64_t high) {
+    int64_t pivot = arr[high];
+    int64_t i = low - 1;
+
+    for (int64_t j = low; j < high; j++) {
+        if (arr[j] <= pivot) {
+            i++;
+            int64_t temp = arr[i];
+            arr[i] = arr[j];
+            arr[j] = temp;
+        }
+    }
+
+    int64_t temp = arr[i + 1];
+    arr[i + 1] = arr[high];
+    arr[high] = temp;
+
+    return i + 1;
+}
+
+static void quick_sort_rec(int64_t arr[], int64_t low, int64_t high) {
+    while (low < high) {
+        int64_t pi = partition(arr, low, high);
+        if (pi - low < high - pi) {
+            quick_sort_rec(arr, low, pi - 1);
+            low = pi + 1;
+        } else {
+            quick_sort_rec(arr, pi + 1, high);
+            high = pi - 1;
+        }
+    }
+}
+
+void quick_sort(int64_t arr[], int64_t n) {
+    quick_sort_rec(arr, 0, n - 1);
+}
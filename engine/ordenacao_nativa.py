@@ -0,0 +1,184 @@
+"""
+Modulo da linha de base nativa
+Compila os algoritmos de ordenacao_nativa.c com o compilador C desta
+maquina e os chama com ctypes, para comparar o Python com C medido no
+mesmo hardware, na mesma lista e com o mesmo medidor
+"""
+import ctypes
+import hashlib
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+
+import numpy as np
+
+CAMINHO_FONTE = Path(__file__).parent / "ordenacao_nativa.c"
+
+# Onde a biblioteca compilada fica guardada entre execucoes
+PASTA_COMPILADOS = Path(tempfile.gettempdir()) / "projeto_apc"
+
+# Tempo maximo para compilar (segundos)
+TEMPO_COMPILACAO = 60
+
+# Biblioteca carregada neste processo (ou o motivo de nao ter carregado)
+NATIVO = {}
+
+
+def extensao_biblioteca():
+    """
+    Extensao das bibliotecas compartilhadas neste sistema
+    """
+    if sys.platform == "win32":
+        return ".dll"
+    if sys.platform == "darwin":
+        return ".dylib"
+    return ".so"
+
+
+def encontrar_compilador():
+    """
+    Procura o compilador C (a variavel CC, ou cc, gcc e clang no PATH)
+    
+    Retorna:
+        Caminho do compilador, ou None se nao houver
+    """
+    candidatos = [os.environ.get("CC"), "cc", "gcc", "clang"]
+    for candidato in candidatos:
+        if candidato and shutil.which(candidato):
+            return shutil.which(candidato)
+    return None
+
+
+def compilar_biblioteca():
+    """
+    Compila ordenacao_nativa.c em uma biblioteca compartilhada
+    
+    O nome do arquivo leva um resumo do codigo e do compilador, entao
+    a biblioteca so e recompilada quando um dos dois muda
+    
+    Retorna:
+        Caminho da biblioteca
+    
+    Erros:
+        RuntimeError se nao houver compilador ou a compilacao falhar
+    """
+    compilador = encontrar_compilador()
+    if compilador is None:
+        raise RuntimeError("nenhum compilador C encontrado (cc, gcc ou clang)")
+    
+    fonte = CAMINHO_FONTE.read_bytes()
+    resumo = hashlib.sha256(fonte + compilador.encode()).hexdigest()[:16]
+    destino = PASTA_COMPILADOS / f"ordenacao_nativa_{resumo}{extensao_biblioteca()}"
+    if destino.exists():
+        return destino
+    
+    PASTA_COMPILADOS.mkdir(parents=True, exist_ok=True)
+    
+    # Compila com outro nome e renomeia, para que dois processos
+    # compilando ao mesmo tempo nunca carreguem um arquivo pela metade
+    temporario = destino.with_name(f"{destino.stem}_{os.getpid()}{destino.suffix}")
+    comando = [compilador, "-O2", "-shared", "-fPIC", "-o", str(temporario), str(CAMINHO_FONTE)]
+    try:
+        processo = subprocess.run(comando, capture_output=True, text=True, timeout=TEMPO_COMPILACAO)
+    except (OSError, subprocess.TimeoutExpired) as erro:
+        raise RuntimeError(f"falha ao executar {compilador}: {erro}")
+    
+    if processo.returncode != 0:
+        raise RuntimeError(f"{compilador} falhou: {processo.stderr.strip()}")
+    
+    os.replace(temporario, destino)
+    return destino
+
+
+def carregar_biblioteca():
+    """
+    Compila (se preciso) e carrega a biblioteca, so na primeira chamada
+    
+    Retorna:
+        A biblioteca (ctypes.CDLL), ou None se nao foi possivel (o motivo
+        fica em NATIVO["erro"])
+    """
+    if NATIVO:
+        return NATIVO["biblioteca"]
+    
+    try:
+        biblioteca = ctypes.CDLL(str(compilar_biblioteca()))
+    except (RuntimeError, OSError) as erro:
+        NATIVO["biblioteca"] = None
+        NATIVO["erro"] = str(erro)
+        return None
+    
+    ponteiro = ctypes.POINTER(ctypes.c_int64)
+    for nome in ["bubble_sort", "insertion_sort", "quick_sort"]:
+        getattr(biblioteca, nome).argtypes = [ponteiro, ctypes.c_int64]
+        getattr(biblioteca, nome).restype = None
+    biblioteca.merge_sort.argtypes = [ponteiro, ctypes.c_int64]
+    biblioteca.merge_sort.restype = ctypes.c_int
+    
+    NATIVO["biblioteca"] = biblioteca
+    NATIVO["erro"] = None
+    return biblioteca
+
+
+def nativo_disponivel():
+    """
+    Retorna True se a biblioteca em C pode ser usada nesta maquina
+    """
+    return carregar_biblioteca() is not None
+
+
+def ordenar_nativo(nome, lista):
+    """
+    Ordena com a funcao da biblioteca em C
+    
+    Vetores int64 contiguos sao ordenados no lugar; listas Python (ou
+    vetores de outro tipo) sao copiados para um vetor int64 antes
+    
+    Retorna:
+        O vetor int64 ordenado
+    """
+    biblioteca = carregar_biblioteca()
+    if biblioteca is None:
+        raise RuntimeError(f"Biblioteca em C indisponivel: {NATIVO['erro']}")
+    
+    vetor = np.ascontiguousarray(lista, dtype=np.int64)
+    status = getattr(biblioteca, nome)(vetor.ctypes.data_as(ctypes.POINTER(ctypes.c_int64)), len(vetor))
+    if status is not None and status != 0:
+        raise MemoryError(f"{nome} em C nao conseguiu alocar memoria")
+    
+    return vetor
+
+
+def merge_sort_c(lista):
+    """
+    Merge Sort em C (ordenacao_nativa.c)
+    Complexidade: O(n log n)
+    """
+    return ordenar_nativo("merge_sort", lista)
+
+
+def quick_sort_c(lista):
+    """
+    Quick Sort em C, com o ultimo elemento como pivo (ordenacao_nativa.c)
+    Complexidade: O(n log n) em media
+    """
+    return ordenar_nativo("quick_sort", lista)
+
+
+def bubble_sort_c(lista):
+    """
+    Bubble Sort em C (ordenacao_nativa.c)
+    Complexidade: O(n²)
+    """
+    return ordenar_nativo("bubble_sort", lista)
+
+
+def insertion_sort_c(lista):
+    """
+    Insertion Sort em C (ordenacao_nativa.c)
+    Complexidade: O(n²)
+    """
+    return ordenar_nativo("insertion_sort", lista)
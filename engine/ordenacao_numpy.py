@@ -0,0 +1,302 @@
+"""
+Modulo de algoritmos de ordenacao vetorizados com NumPy
+Versoes dos metodos de metodos_ordenacao que trabalham com
+vetores int64 em vez de listas Python
+"""
+import numpy as np
+
+
+def bubble_sort_numpy(lista):
+    """
+    Bubble Sort vetorizado (transposicao par-impar)
+    A cada fase compara todos os pares (0,1), (2,3)... ou (1,2), (3,4)...
+    de uma vez e troca os que estao fora de ordem
+    Complexidade: O(n²) comparacoes, em n fases vetorizadas
+    """
+    vetor = np.array(lista, dtype=np.int64)
+    tamanho = len(vetor)
+    fases_sem_troca = 0
+    
+    for fase in range(tamanho):
+        inicio = fase % 2
+        esquerda = vetor[inicio:tamanho - 1:2]
+        direita = vetor[inicio + 1:tamanho:2]
+        
+        if not np.any(esquerda > direita):
+            fases_sem_troca = fases_sem_troca + 1
+            if fases_sem_troca >= 2:
+                break
+            continue
+        
+        fases_sem_troca = 0
+        menores = np.minimum(esquerda, direita)
+        maiores = np.maximum(esquerda, direita)
+        esquerda[:] = menores
+        direita[:] = maiores
+    
+    return vetor
+
+
+def insertion_sort_numpy(lista):
+    """
+    Insertion Sort vetorizado
+    Acha a posicao com np.searchsorted e desloca o bloco inteiro
+    com uma unica atribuicao de fatia
+    Complexidade: O(n²) movimentacoes, O(n log n) comparacoes
+    """
+    vetor = np.array(lista, dtype=np.int64)
+    
+    for i in range(1, len(vetor)):
+        elemento_atual = vetor[i]
+        posicao = int(np.searchsorted(vetor[:i], elemento_atual, side="right"))
+        
+        if posicao < i:
+            vetor[posicao + 1:i + 1] = vetor[posicao:i]
+            vetor[posicao] = elemento_atual
+    
+    return vetor
+
+
+def merge_sort_numpy(lista):
+    """
+    Merge Sort vetorizado (bottom-up)
+    Em cada passada junta todos os pares de blocos de uma vez,
+    calculando a posicao final de cada elemento com np.searchsorted
+    Complexidade: O(n log² n) em log n passadas vetorizadas
+    """
+    vetor = np.array(lista, dtype=np.int64)
+    tamanho = len(vetor)
+    
+    if tamanho <= 1:
+        return vetor
+    
+    minimo = int(vetor.min())
+    amplitude = int(vetor.max()) - minimo + 1
+    
+    largura = 1
+    while largura < tamanho:
+        pares = -(-tamanho // (2 * largura))
+        
+        # As chaves combinadas (par, valor) precisam caber em int64
+        if pares * amplitude < 2 ** 62:
+            vetor = juntar_passada(vetor - minimo, largura, amplitude) + minimo
+        else:
+            vetor = juntar_passada_laco(vetor, largura)
+        
+        largura = largura * 2
+    
+    return vetor
+
+
+def juntar_passada(valores, largura, amplitude):
+    """
+    Funcao auxiliar do Merge Sort vetorizado
+    Junta todos os pares de blocos de tamanho largura de uma so vez
+    Os valores devem estar deslocados para comecar em zero
+    """
+    tamanho = len(valores)
+    indices = np.arange(tamanho, dtype=np.int64)
+    
+    bloco = indices // largura
+    par = bloco // 2
+    eh_esquerda = (bloco % 2) == 0
+    eh_direita = ~eh_esquerda
+    inicio_par = par * (2 * largura)
+    
+    # Ordenadas por (par, valor): cada lado vira um unico vetor ordenado
+    chaves = par * amplitude + valores
+    chaves_esquerda = chaves[eh_esquerda]
+    chaves_direita = chaves[eh_direita]
+    
+    # Todos os pares anteriores sao completos: ha par * largura
+    # elementos de cada lado antes do par atual
+    par_esquerda = par[eh_esquerda]
+    par_direita = par[eh_direita]
+    menores_na_direita = np.searchsorted(chaves_direita, chaves_esquerda, side="left") - par_esquerda * largura
+    menores_na_esquerda = np.searchsorted(chaves_esquerda, chaves_direita, side="right") - par_direita * largura
+    
+    destino_esquerda = indices[eh_esquerda] + menores_na_direita
+    destino_direita = indices[eh_direita] - largura + menores_na_esquerda
+    
+    saida = np.empty_like(valores)
+    saida[destino_esquerda] = valores[eh_esquerda]
+    saida[destino_direita] = valores[eh_direita]
+    
+    return saida
+
+
+def juntar_passada_laco(vetor, largura):
+    """
+    Funcao auxiliar do Merge Sort vetorizado
+    Junta os pares de blocos um por vez (usada quando a amplitude
+    dos valores nao permite combinar as chaves em int64)
+    """
+    tamanho = len(vetor)
+    saida = np.empty_like(vetor)
+    
+    for inicio in range(0, tamanho, 2 * largura):
+        meio = min(inicio + largura, tamanho)
+        fim = min(inicio + 2 * largura, tamanho)
+        
+        esquerda = vetor[inicio:meio]
+        direita = vetor[meio:fim]
+        
+        destino_esquerda = np.arange(len(esquerda)) + np.searchsorted(direita, esquerda, side="left")
+        destino_direita = np.arange(len(direita)) + np.searchsorted(esquerda, direita, side="right")
+        
+        saida[inicio + destino_esquerda] = esquerda
+        saida[inicio + destino_direita] = direita
+    
+    return saida
+
+
+def quick_sort_numpy(lista):
+    """
+    Quick Sort vetorizado com mascaras booleanas
+    Particiona todos os segmentos ao mesmo tempo: em cada nivel escolhe
+    um pivo por segmento (mediana de tres elementos sorteados no
+    segmento) e separa menores, iguais e maiores usando mascaras e somas
+    acumuladas. Blocos de iguais e blocos de um elemento ja estao no
+    lugar e saem do processamento
+    Com pivos sorteados nenhuma entrada (ordenada, "organ pipe", dente
+    de serra...) leva ao caso O(n^2); o sorteio tem semente fixa, entao
+    a mesma lista faz sempre o mesmo trabalho
+    Complexidade: O(n log n) esperado, em O(log n) niveis vetorizados
+    """
+    vetor = np.array(lista, dtype=np.int64)
+    tamanho = len(vetor)
+    gerador = np.random.default_rng(0)
+    
+    inicio_segmento = np.zeros(tamanho, dtype=bool)
+    if tamanho > 0:
+        inicio_segmento[0] = True
+    
+    # Posicoes (no vetor inteiro) dos elementos que ainda nao estao no lugar
+    posicoes = np.arange(tamanho, dtype=np.int64)
+    if tamanho <= 1:
+        posicoes = posicoes[:0]
+    
+    while len(posicoes) > 0:
+        ativos = vetor[posicoes]
+        quantidade = len(ativos)
+        
+        segmento = np.cumsum(inicio_segmento[posicoes]) - 1
+        inicios = np.flatnonzero(inicio_segmento[posicoes])
+        fins = np.append(inicios[1:], quantidade)
+        
+        sorteados = inicios + (gerador.random((3, len(inicios))) * (fins - inicios)).astype(np.int64)
+        primeiro, segundo, terceiro = ativos[sorteados]
+        pivos = np.maximum(np.minimum(primeiro, segundo), np.minimum(np.maximum(primeiro, segundo), terceiro))
+        pivo_do_elemento = pivos[segmento]
+        
+        menores = ativos < pivo_do_elemento
+        maiores = ativos > pivo_do_elemento
+        iguais = ~(menores | maiores)
+        
+        qtd_menores = np.add.reduceat(menores.astype(np.int64), inicios)
+        qtd_iguais = np.add.reduceat(iguais.astype(np.int64), inicios)
+        qtd_maiores = (fins - inicios) - qtd_menores - qtd_iguais
+        
+        destino = np.empty(quantidade, dtype=np.int64)
+        classe = np.empty(quantidade, dtype=np.int8)
+        deslocamentos = [inicios, inicios + qtd_menores, inicios + qtd_menores + qtd_iguais]
+        
+        for numero, (mascara, deslocamento) in enumerate(zip([menores, iguais, maiores], deslocamentos)):
+            acumulado = np.cumsum(mascara)
+            antes_do_segmento = (acumulado - mascara)[inicios]
+            posicao = deslocamento[segmento] + acumulado - 1 - antes_do_segmento[segmento]
+            destino[mascara] = posicao[mascara]
+            classe[mascara] = numero
+        
+        reordenados = np.empty_like(ativos)
+        reordenados[destino] = ativos
+        vetor[posicoes] = reordenados
+        
+        # Os blocos de iguais e de maiores passam a ser novos segmentos
+        inicio_segmento[posicoes[(inicios + qtd_menores)[qtd_menores > 0]]] = True
+        inicio_segmento[posicoes[(inicios + qtd_menores + qtd_iguais)[qtd_maiores > 0]]] = True
+        
+        classe_nova = np.empty_like(classe)
+        classe_nova[destino] = classe
+        continua = ((classe_nova == 0) & (qtd_menores > 1)[segmento]) | ((classe_nova == 2) & (qtd_maiores > 1)[segmento])
+        posicoes = posicoes[continua]
+    
+    return vetor
+
+
+# Acima desse numero de valores distintos possiveis o Counting Sort
+# usaria memoria demais e o Radix Sort e usado no lugar, mesmo que o
+# intervalo seja pequeno comparado ao tamanho da lista
+LIMITE_CONTAGEM = 1 << 26
+
+
+def radix_counting_sort_numpy(lista):
+    """
+    Radix/Counting Sort vetorizado
+    Detecta o intervalo de valores como radix_counting_sort: se for de
+    ate o dobro do tamanho da lista (e de ate LIMITE_CONTAGEM), conta
+    as ocorrencias com np.bincount; senao, usa o Radix Sort LSD
+    Complexidade: O(n + k) na contagem, com k o tamanho do intervalo,
+    e O(d * n) no Radix Sort, com d passadas
+    """
+    vetor = np.array(lista, dtype=np.int64)
+    
+    if len(vetor) <= 1:
+        return vetor
+    
+    minimo = int(vetor.min())
+    amplitude = int(vetor.max()) - minimo + 1
+    
+    if amplitude <= 2 * len(vetor) and amplitude <= LIMITE_CONTAGEM:
+        return counting_sort_numpy(vetor, minimo, amplitude)
+    return radix_sort_numpy(vetor, minimo, amplitude)
+
+
+def counting_sort_numpy(vetor, minimo, amplitude):
+    """
+    Funcao auxiliar do Radix/Counting Sort vetorizado
+    Conta as ocorrencias com np.bincount e reconstroi com np.repeat
+    """
+    contagens = np.bincount(vetor - minimo, minlength=amplitude)
+    valores = np.arange(minimo, minimo + amplitude, dtype=np.int64)
+    
+    return np.repeat(valores, contagens)
+
+
+def radix_sort_numpy(vetor, minimo, amplitude):
+    """
+    Funcao auxiliar do Radix/Counting Sort vetorizado
+    Radix Sort LSD com digitos de 16 bits. Cada passada reordena o vetor
+    de forma estavel pelo digito atual (argsort estavel, que o NumPy faz
+    por contagem para chaves uint16)
+    """
+    deslocados = (vetor - minimo).astype(np.uint64)
+    passadas = -(-(amplitude - 1).bit_length() // 16)
+    
+    for passada in range(passadas):
+        digitos = ((deslocados >> np.uint64(16 * passada)) & np.uint64(0xFFFF)).astype(np.uint16)
+        deslocados = deslocados[np.argsort(digitos, kind="stable")]
+    
+    return (deslocados + np.uint64(minimo % (1 << 64))).astype(np.int64)
+
+
+def bogosort_numpy(lista):
+    """
+    Bogosort vetorizado - Embaralha ate ficar ordenado
+    Complexidade: O((n+1)!)
+    Use apenas com listas pequenas (ate 10 elementos)
+    """
+    vetor = np.array(lista, dtype=np.int64)
+    gerador = np.random.default_rng()
+    
+    while not verificar_ordenado_numpy(vetor):
+        gerador.shuffle(vetor)
+    
+    return vetor
+
+
+def verificar_ordenado_numpy(vetor):
+    """
+    Verifica se um vetor esta em ordem crescente
+    """
+    return bool(np.all(vetor[:-1] <= vetor[1:]))
@@ -0,0 +1,82 @@
+"""
+Modulo de ordenacao paralela
+Divide a lista entre varios processos usando memoria compartilhada
+"""
+import heapq
+import os
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+
+import numpy as np
+
+from metodos_ordenacao import merge_sort_buffer
+
+# Trechos menores que isso nao compensam o custo de criar um processo
+TAMANHO_MINIMO_TRECHO = 2048
+
+
+def merge_sort_paralelo(lista, processos=None):
+    """
+    Merge Sort paralelo com memoria compartilhada
+    Copia a lista para um bloco de memoria compartilhada, cada processo
+    ordena o seu trecho no proprio bloco (sem enviar listas por pickle)
+    e no final os trechos ordenados sao juntados com um heap (k-way merge)
+    Complexidade: O(n log n), com o trabalho dividido entre os processos
+    
+    Parametros:
+        lista: Lista a ordenar
+        processos: Numero de processos (padrao: numero de nucleos)
+    """
+    tamanho = len(lista)
+    
+    if processos is None:
+        processos = os.cpu_count() or 1
+    
+    processos = max(1, min(processos, tamanho // TAMANHO_MINIMO_TRECHO))
+    
+    if processos == 1:
+        return merge_sort_buffer(list(lista))
+    
+    memoria = shared_memory.SharedMemory(create=True, size=tamanho * 8)
+    
+    try:
+        vetor = np.ndarray((tamanho,), dtype=np.int64, buffer=memoria.buf)
+        vetor[:] = lista
+        
+        limites = []
+        for i in range(processos + 1):
+            limites.append(tamanho * i // processos)
+        
+        with ProcessPoolExecutor(max_workers=processos) as executor:
+            futuros = []
+            for i in range(processos):
+                futuros.append(executor.submit(ordenar_trecho, memoria.name, tamanho, limites[i], limites[i + 1]))
+            
+            for futuro in futuros:
+                futuro.result()
+        
+        trechos = []
+        for i in range(processos):
+            trechos.append(vetor[limites[i]:limites[i + 1]].tolist())
+        
+        del vetor
+    finally:
+        memoria.close()
+        memoria.unlink()
+    
+    return list(heapq.merge(*trechos))
+
+
+def ordenar_trecho(nome_memoria, tamanho, inicio, fim):
+    """
+    Executada em cada processo do Merge Sort paralelo
+    Abre o bloco de memoria compartilhada e ordena vetor[inicio:fim] nele
+    """
+    memoria = shared_memory.SharedMemory(name=nome_memoria, track=False)
+    
+    try:
+        vetor = np.ndarray((tamanho,), dtype=np.int64, buffer=memoria.buf)
+        vetor[inicio:fim] = merge_sort_buffer(vetor[inicio:fim].tolist())
+        del vetor
+    finally:
+        memoria.close()
@@ -0,0 +1,43 @@
+"""
+Modulo das ordenacoes de referencia
+As ordenacoes prontas do Python (list.sort e sorted, ambas Timsort)
+e do NumPy (numpy.sort), que servem de linha de base para os
+algoritmos escritos a mao
+"""
+import numpy as np
+
+
+def ordenar_list_sort(lista):
+    """
+    list.sort do Python (Timsort), ordenando a propria lista
+    Complexidade: O(n log n), O(n) em listas ja ordenadas
+    """
+    lista.sort()
+    return lista
+
+
+def ordenar_sorted(lista):
+    """
+    sorted do Python (Timsort), que cria uma lista nova
+    Complexidade: O(n log n), O(n) em listas ja ordenadas
+    """
+    return sorted(lista)
+
+
+def numpy_sort_quicksort(lista):
+    """
+    numpy.sort com kind="quicksort" (o padrao: introsort, com
+    instrucoes vetoriais quando o processador tem)
+    Complexidade: O(n log n)
+    """
+    return np.sort(lista, kind="quicksort")
+
+
+def numpy_sort_mergesort(lista):
+    """
+    numpy.sort com kind="mergesort" (Timsort para int64). O
+    kind="stable" roda o mesmo codigo para int64 (o Radix Sort do NumPy
+    so entra com inteiros de ate 16 bits), entao nao e registrado
+    Complexidade: O(n log n)
+    """
+    return np.sort(lista, kind="mergesort")
@@ -0,0 +1,287 @@
+"""
+Modulo do pool de medicao
+Mantem processos de medicao ja iniciados, cada um fixo em um nucleo,
+com as listas de entrada carregadas e reaproveitados entre as medicoes
+"""
+import itertools
+import multiprocessing
+import os
+
+import numpy as np
+import psutil
+
+from medidor_desempenho import medir_repeticoes, vigiar_processo, medicao_interrompida, encerrar_arvore
+from medidor_desempenho import estimar_tempo_total
+
+# Quantas listas cada processo guarda (as mais antigas saem primeiro)
+MAXIMO_BUFFERS = 8
+
+# Quantos elementos do resultado voltam para o programa principal
+LIMITE_RESULTADO = 1000
+
+
+def nucleos_disponiveis():
+    """
+    Lista os nucleos que este processo pode usar
+    """
+    if hasattr(os, "sched_getaffinity"):
+        return sorted(os.sched_getaffinity(0))
+    return list(range(os.cpu_count() or 1))
+
+
+def fixar_nucleos(nucleos):
+    """
+    Fixa o processo atual nos nucleos informados (so no Linux)
+    
+    Retorna:
+        True se conseguiu fixar
+    """
+    if not hasattr(os, "sched_setaffinity"):
+        return False
+    
+    try:
+        os.sched_setaffinity(0, nucleos)
+    except OSError:
+        return False
+    return True
+
+
+def criar_pool(trabalhadores=1, nucleos=None, reservados=1):
+    """
+    Cria o pool de medicao
+    
+    Cada processo e fixado em um nucleo proprio. Por padrao sao usados
+    os ultimos nucleos, deixando os primeiros (reservados) para o
+    programa principal e o sistema. Se nao houver nucleos livres para
+    todos, alguns processos dividem o mesmo nucleo (com um nucleo so,
+    todos usam o mesmo)
+    
+    Parametros:
+        trabalhadores: Numero de processos (padrao: 1)
+        nucleos: Lista de nucleos a usar (opcional)
+        reservados: Quantos nucleos ficam fora do pool quando os
+            nucleos nao sao informados (padrao: 1)
+    
+    Retorna:
+        Dicionario com o estado do pool
+    """
+    if nucleos is None:
+        disponiveis = nucleos_disponiveis()
+        livres = disponiveis[reservados:] or disponiveis[-1:]
+        nucleos = livres[-trabalhadores:]
+    
+    pool = {
+        "trabalhadores": [],
+        "proximo": 0,
+        # Contador das chaves das listas sem chave (next() nele e seguro
+        # entre threads, veja agendador.py)
+        "temporarias": itertools.count(),
+    }
+    
+    for i in range(trabalhadores):
+        pool["trabalhadores"].append(iniciar_trabalhador(nucleos[i % len(nucleos)]))
+    
+    return pool
+
+
+def iniciar_trabalhador(nucleo):
+    """
+    Inicia um processo do pool, fixo no nucleo informado
+    """
+    conexao, conexao_filho = multiprocessing.Pipe()
+    processo = multiprocessing.Process(target=laco_trabalhador, args=(conexao_filho, nucleo), daemon=True)
+    processo.start()
+    conexao_filho.close()
+    
+    return {
+        "processo": processo,
+        "conexao": conexao,
+        "nucleo": nucleo,
+    }
+
+
+def reiniciar_trabalhador(pool, indice):
+    """
+    Encerra um processo do pool (e os que ele criou) e poe outro no lugar
+    """
+    antigo = pool["trabalhadores"][indice]
+    
+    try:
+        encerrar_arvore(psutil.Process(antigo["processo"].pid))
+    except psutil.NoSuchProcess:
+        pass
+    antigo["processo"].join()
+    antigo["conexao"].close()
+    
+    pool["trabalhadores"][indice] = iniciar_trabalhador(antigo["nucleo"])
+
+
+def fechar_pool(pool):
+    """
+    Encerra todos os processos do pool
+    """
+    for trabalhador in pool["trabalhadores"]:
+        try:
+            trabalhador["conexao"].send(("sair",))
+        except (BrokenPipeError, OSError):
+            pass
+        trabalhador["processo"].join(timeout=1)
+        if trabalhador["processo"].is_alive():
+            trabalhador["processo"].kill()
+            trabalhador["processo"].join()
+        trabalhador["conexao"].close()
+    
+    pool["trabalhadores"] = []
+
+
+def medir_no_pool(pool, funcao, lista, formato="lista", chave=None, repeticoes=5, aquecimento=1,
+                  limite_tempo=None, limite_memoria_mb=None, fixar_nucleo=True, trabalhador=None, **opcoes):
+    """
+    Mede uma funcao em um processo do pool
+    
+    A lista so e enviada se o processo ainda nao a tiver (pela chave).
+    Cada execucao usa uma copia nova dela, com o lixo coletado e os
+    objetos congelados antes (veja medir_repeticoes). O processo e
+    vigiado como em medir_isolado: se passar dos limites em alguma
+    execucao, e encerrado e substituido por outro
+    
+    Parametros:
+        pool: Pool criado com criar_pool
+        funcao: A funcao que sera medida
+        lista: Lista de entrada (lista Python ou vetor NumPy)
+        formato: "lista" (copias em lista Python) ou "vetor" (vetor NumPy)
+        chave: Identifica a lista entre medicoes (None = enviar sempre)
+        repeticoes: Numero de execucoes medidas
+        aquecimento: Numero de execucoes descartadas antes
+        limite_tempo: Tempo maximo em segundos por execucao (opcional)
+        limite_memoria_mb: Memoria adicional maxima em MB por execucao (opcional)
+        fixar_nucleo: Se False, libera todos os nucleos durante a medicao
+            (para algoritmos que criam varios processos)
+        trabalhador: Indice do processo que mede (padrao: o proximo, em
+            rodizio). Medicoes simultaneas precisam de processos diferentes
+        **opcoes: Opcoes de medir_repeticoes (medir_memoria,
+            duracao_minima, intervalo_amostragem, alta_resolucao)
+    
+    Retorna:
+        Dicionario no mesmo formato de medir_repeticoes (o resultado
+        volta com no maximo LIMITE_RESULTADO elementos)
+    """
+    indice = trabalhador
+    if indice is None:
+        indice = pool["proximo"]
+        pool["proximo"] = (indice + 1) % len(pool["trabalhadores"])
+    trabalhador = pool["trabalhadores"][indice]
+    
+    # Sem chave a lista vai junto com o pedido, com uma chave que nao se repete
+    if chave is None:
+        chave = ("temporaria", next(pool["temporarias"]))
+        trabalhador["conexao"].send(("carregar", chave, np.asarray(lista, dtype=np.int64)))
+    
+    parametros = {
+        "repeticoes": repeticoes,
+        "aquecimento": aquecimento,
+        "fixar_nucleo": fixar_nucleo,
+        "opcoes": opcoes,
+    }
+    pedido = ("medir", chave, funcao, formato, parametros)
+
+    def enviar_lista(mensagem):
+        """O processo nao tem a lista: envia e repete o pedido"""
+        if mensagem[0] != "sem_buffer":
+            return False
+        trabalhador["conexao"].send(("carregar", chave, np.asarray(lista, dtype=np.int64)))
+        trabalhador["conexao"].send(pedido)
+        return True
+    
+    trabalhador["conexao"].send(pedido)
+    status, resposta, parcial = vigiar_processo(trabalhador["processo"], trabalhador["conexao"],
+                                                limite_tempo, limite_memoria_mb, tratar=enviar_lista)
+    
+    if status == "ok":
+        return resposta
+    
+    # O processo foi interrompido no meio (ou morreu): poe outro no lugar
+    if status != "erro" or not trabalhador["processo"].is_alive():
+        reiniciar_trabalhador(pool, indice)
+    
+    tempo_estimado = None
+    if status in ["timeout", "memoria"]:
+        entrada = np.asarray(lista, dtype=np.int64)
+        if formato == "lista":
+            entrada = entrada.tolist()
+        tempo_estimado = estimar_tempo_total(funcao, (entrada,), {}, limite_tempo)
+    
+    medicao = medicao_interrompida(status, parcial, tempo_estimado, resposta)
+    medicao["medicoes"] = []
+    medicao["chamadas"] = 1
+    return medicao
+
+
+def laco_trabalhador(conexao, nucleo):
+    """
+    Executada em cada processo do pool: fixa o nucleo e atende os
+    pedidos de carregar listas e medir ate receber "sair"
+    """
+    fixar_nucleos({nucleo})
+    todos_nucleos = set(range(os.cpu_count() or 1))
+    buffers = {}
+    
+    while True:
+        try:
+            mensagem = conexao.recv()
+        except EOFError:
+            break
+        
+        if mensagem[0] == "sair":
+            break
+        
+        if mensagem[0] == "carregar":
+            _, chave, dados = mensagem
+            if chave not in buffers and len(buffers) >= MAXIMO_BUFFERS:
+                buffers.pop(next(iter(buffers)))
+            buffers[chave] = dados
+            continue
+        
+        _, chave, funcao, formato, parametros = mensagem
+        if chave not in buffers:
+            conexao.send(("sem_buffer",))
+            continue
+        
+        if not parametros["fixar_nucleo"]:
+            fixar_nucleos(todos_nucleos)
+        
+        try:
+            conexao.send(medir_trabalhador(conexao, buffers[chave], funcao, formato, parametros))
+        finally:
+            if not parametros["fixar_nucleo"]:
+                fixar_nucleos({nucleo})
+
+
+def medir_trabalhador(conexao, dados, funcao, formato, parametros):
+    """
+    Funcao auxiliar de laco_trabalhador: faz as repeticoes avisando o
+    inicio de cada uma e devolve a mensagem de resposta
+    """
+    if formato == "vetor":
+        preparar = dados.copy
+    else:
+        preparar = dados.tolist
+
+    def avisar(numero):
+        conexao.send(("inicio", numero))
+    
+    try:
+        medicao = medir_repeticoes(
+            funcao,
+            preparar,
+            parametros["repeticoes"],
+            parametros["aquecimento"],
+            congelar_gc=True,
+            ao_iniciar=avisar,
+            **parametros["opcoes"],
+        )
+    except BaseException as erro:
+        return ("erro", f"{type(erro).__name__}: {erro}")
+    
+    medicao["resultado"] = medicao["resultado"][:LIMITE_RESULTADO]
+    return ("ok", medicao)
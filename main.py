@@ -2,19 +2,36 @@
 Programa principal do Projeto 
 Analisa o impacto ambiental de algoritmos de ordenacao
 """
+import os
 import sys
+import tempfile
+from datetime import datetime
 from pathlib import Path
 
 sys.path.append(str(Path(__file__).parent / "engine"))
 
-from engine.gerador_listas import gerar_listas, mostrar_info_listas
+from engine.gerador_listas import gerar_listas, gerar_lista, gerar_semente, gerar_arquivo, mostrar_info_listas, DISTRIBUICOES
 from engine.medidor_desempenho import medir_desempenho
+from engine.pool_medicao import criar_pool, fechar_pool
+from engine.execucao import medir_algoritmo
+from engine.agendador import executar_matriz
+from engine.estatisticas import resumir
+from engine.agregador import agregar, juntar_agregadores, resumir_acumulador
+from engine.complexidade import ajustar_complexidade, extrapolar
 from engine.impacto_ambiental import calcular_impacto
 from engine.graficos import grafico_completo, grafico_comparativo_linguagens, grafico_comparativo_todos_algoritmos
-from engine.comparador_linguagens import mostrar_comparacao
+from engine.graficos import grafico_varredura
+from engine.comparador_linguagens import mostrar_comparacao, normalizar_algoritmo
 from engine.medidor_llm_local import menu_llm_local, medir_llm_local, comparar_algoritmo_vs_llm
-from engine.metodos_ordenacao import merge_sort, quick_sort, bubble_sort, insertion_sort, bogosort
-from engine.exportador_csv import exportar_resultados, exportar_comparacao_linguagens, exportar_estatisticas
+from engine.catalogo import BACKENDS, VARIANTES, REFERENCIAS, versao_nativa
+from engine.catalogo import procurar_algoritmo, procurar_referencia, razao_referencia
+from engine.ordenacao_nativa import nativo_disponivel, NATIVO
+from engine.ordenacao_externa import ordenar_arquivo, verificar_arquivo_ordenado
+from engine.exportador_csv import exportar_comparacao_linguagens, exportar_estatisticas
+from engine.exportador import EXTENSOES, escolher_formato, exportar
+from engine.banco_resultados import abrir_banco, iniciar_execucao, gravar_resultados, consultar_resultados
+from engine.banco_resultados import contar_resultados, listar_execucoes, descrever_maquina
+from engine.banco_resultados import gravar_agregado, ler_agregado, iterar_resultados, colunas_gravadas
 
 from rich.console import Console
 from rich.table import Table
@@ -24,14 +41,45 @@ from rich import box
 
 console = Console()
 
-ALGORITMOS = [
-    ("Merge Sort", merge_sort),
-    ("Quick Sort", quick_sort),
-    ("Bubble Sort", bubble_sort),
-    ("Insertion Sort", insertion_sort),
-    ("Bogosort", bogosort),
-]
+CONFIGURACAO = {
+    "backend": "python",
+    "limite_tempo": 60,
+    "limite_memoria_mb": 0,
+    "repeticoes": 5,
+    "aquecimento": 1,
+    "duracao_minima_ms": 100,
+    "medir_memoria": "sim",
+    "contar_operacoes": "nao",
+    "intervalo_amostragem_ms": 10,
+    "alta_resolucao": "sim",
+    "pool": "sim",
+    "trabalhadores": 1,
+    "nucleos_reservados": 1,
+}
 
+# Pool de medicao, criado na primeira medicao (veja pool_de_medicao)
+POOL = {}
+
+# Banco de resultados, aberto no primeiro uso (veja banco_de_resultados)
+BANCO = {}
+
+# Como cada situacao aparece nas tabelas
+STATUS = {
+    "timeout": "tempo esgotado",
+    "memoria": "memoria esgotada",
+    "erro": "erro",
+    "extrapolado": "extrapolado",
+}
+
+# Tamanhos da varredura (opcao 16), cada um cerca de 3,16 vezes o anterior
+TAMANHOS_VARREDURA = [100, 316, 1000, 3162, 10000, 31623, 100000]
+
+# Tamanhos que a varredura nunca executa, so extrapola
+TAMANHOS_EXTRAPOLACAO = [1_000_000, 10_000_000]
+
+# A varredura de um algoritmo para antes do tamanho cuja previsao
+# passe desse tempo por chamada (segundos); os maiores sao extrapolados
+TEMPO_MAXIMO_VARREDURA = 2.0
 
 class PromptPT(Prompt):
     """Prompt com as mensagens usadas"""
@@ -54,142 +102,863 @@ def mostrar_menu():
     tabela.add_row("9", "Graficos Python")
     tabela.add_row("10", "Comparar com outras linguagens (C/Java/Go)")
     tabela.add_row("11", "Medir LLM local (Ollama)")
-    tabela.add_row("12", "Exportar resultados para CSV")
+    tabela.add_row("12", "Exportar resultados (CSV, JSON Lines, Parquet)")
+    tabela.add_row("13", "Outros algoritmos (variantes otimizadas)")
+    tabela.add_row("14", f"Configuracoes (backend: {CONFIGURACAO['backend']})")
+    tabela.add_row("15", "Ordenacao externa (arquivo maior que a memoria)")
+    tabela.add_row("16", "Varredura de tamanhos (complexidade empirica)")
+    tabela.add_row("17", "Historico de resultados (execucoes anteriores)")
     tabela.add_row("0", "Sair")
     console.print(tabela)
 
 
-def executar_algoritmo(nome, funcao, lista):
+def backends_ativos():
+    """Retorna os backends escolhidos nas configuracoes"""
+    if CONFIGURACAO["backend"] == "ambos":
+        return ["python", "numpy"]
+    return [CONFIGURACAO["backend"]]
+
+
+def limites_execucao():
+    """
+    Retorna os limites de tempo e memoria como argumentos para
+    medir_desempenho (0 nas configuracoes significa sem limite)
+    """
+    limites = {}
+    if CONFIGURACAO["limite_tempo"] > 0:
+        limites["limite_tempo"] = CONFIGURACAO["limite_tempo"]
+    if CONFIGURACAO["limite_memoria_mb"] > 0:
+        limites["limite_memoria_mb"] = CONFIGURACAO["limite_memoria_mb"]
+    return limites
+
+
+def opcoes_calibracao():
+    """
+    Retorna a duracao minima de cada medicao das configuracoes como
+    argumento para medir_repeticoes (0 = uma chamada por medicao)
+    """
+    if CONFIGURACAO["duracao_minima_ms"] > 0:
+        return {"duracao_minima": CONFIGURACAO["duracao_minima_ms"] / 1000}
+    return {}
+
+
+def opcoes_amostragem():
+    """
+    Retorna as opcoes de amostragem de CPU das configuracoes como
+    argumentos para medir_desempenho (intervalo 0 = sem amostragem)
+    """
+    opcoes = {"alta_resolucao": CONFIGURACAO["alta_resolucao"] == "sim"}
+    if CONFIGURACAO["intervalo_amostragem_ms"] > 0:
+        opcoes["intervalo_amostragem"] = CONFIGURACAO["intervalo_amostragem_ms"] / 1000
+    return opcoes
+
+
+def pool_de_medicao():
+    """
+    Retorna o pool de medicao, criando na primeira vez
+    """
+    if not POOL:
+        POOL.update(criar_pool(CONFIGURACAO["trabalhadores"], reservados=CONFIGURACAO["nucleos_reservados"]))
+    return POOL
+
+
+def encerrar_pool():
+    """
+    Encerra os processos do pool de medicao (se houver)
+    """
+    if POOL:
+        fechar_pool(POOL)
+        POOL.clear()
+
+
+def banco_de_resultados():
+    """
+    Retorna o banco de resultados, abrindo na primeira vez e registrando
+    esta execucao do programa (veja banco_resultados.py)
+    
+    O dicionario tem a conexao, o run_id desta execucao, as execucoes
+    consultadas pelas estatisticas, graficos, exportacao e comparacoes
+    (esta e as anteriores escolhidas na opcao 17) e o agregador de
+    estatisticas de cada uma delas (veja agregador.py)
+    """
+    if not BANCO:
+        conexao = abrir_banco()
+        run_id = iniciar_execucao(conexao)
+        BANCO.update({"conexao": conexao, "run_id": run_id, "execucoes": [run_id], "agregados": {run_id: {}}})
+    return BANCO
+
+
+def guardar_resultados(resultados):
+    """
+    Grava resultados no banco, nesta execucao, e inclui no agregador
+    de estatisticas dela
+    """
+    banco = banco_de_resultados()
+    gravar_resultados(banco["conexao"], banco["run_id"], resultados)
+    for resultado in resultados:
+        agregar(banco["agregados"][banco["run_id"]], resultado)
+
+
+def resultados_da_sessao(algoritmo=None, tamanho=None, **filtros):
+    """
+    Consulta no banco os resultados das execucoes da sessao (veja
+    consultar_resultados), na ordem em que foram medidos
+    """
+    banco = banco_de_resultados()
+    return consultar_resultados(banco["conexao"], banco["execucoes"], algoritmo, tamanho, **filtros)
+
+
+def estatisticas_da_sessao():
+    """
+    Junta os agregadores de estatisticas das execucoes da sessao
+    """
+    banco = banco_de_resultados()
+    return juntar_agregadores(*banco["agregados"].values())
+
+
+def fechar_banco():
+    """
+    Grava o agregador de estatisticas desta execucao e fecha o banco
+    de resultados (se estiver aberto)
+    """
+    if BANCO:
+        gravar_agregado(BANCO["conexao"], BANCO["run_id"], BANCO["agregados"][BANCO["run_id"]])
+        BANCO["conexao"].close()
+        BANCO.clear()
+
+
+def formatar_bytes(quantidade):
+    """Formata uma quantidade de bytes em KB ou MB (vazio se nao medida)"""
+    if quantidade is None:
+        return ""
+    if abs(quantidade) >= 1024 * 1024:
+        return f"{quantidade / 1024 / 1024:.1f} MB"
+    return f"{quantidade / 1024:.1f} KB"
+
+
+def executar_algoritmo(nome, funcao, lista, backend="python", semente=None, distribuicao="manual", mostrar=True):
     """
     Executa um algoritmo e mostra os resultados
+    A semente e a distribuicao vao junto no resultado para que a
+    lista possa ser recriada depois
+    O algoritmo roda as vezes de aquecimento e de repeticoes das
+    configuracoes (veja medir_algoritmo). Se passar dos limites das
+    configuracoes ele e interrompido e o resultado fica marcado com o status
+    Com o pool ligado as medicoes rodam no processo do pool, que ja
+    tem a lista carregada quando ela foi gerada pela semente
+    Com mostrar=False so os avisos de falha e interrupcao sao mostrados
     """
-    if nome == "Bogosort" and len(lista) > 10:
+    if nome.startswith("Bogosort") and len(lista) > 10:
         console.print(Panel("Bogosort so pode ser usado com listas ate 10 elementos.", style="red"))
         return None
     
-    resultado = medir_desempenho(funcao, lista[:])
-    impacto = calcular_impacto(resultado["tempo_execucao"], resultado["uso_cpu_percent"])
+    pool = pool_de_medicao() if CONFIGURACAO["pool"] == "sim" else None
     
-    console.print(f"[bold]Tempo:[/bold] {resultado['tempo_execucao']:.6f}s")
-    console.print(f"[bold]CPU:[/bold] {resultado['uso_cpu_percent']:.2f}%")
-    console.print(f"[bold]Energia:[/bold] {impacto['energia_Wh']:.6f} Wh")
-    console.print(f"[bold]CO2:[/bold] {impacto['emissao_CO2_g']:.4f} g")
+    r, resultado = medir_algoritmo(
+        nome,
+        funcao,
+        lista,
+        backend,
+        semente,
+        distribuicao,
+        pool,
+        CONFIGURACAO["repeticoes"],
+        CONFIGURACAO["aquecimento"],
+        medir_memoria=CONFIGURACAO["medir_memoria"] == "sim",
+        contar=CONFIGURACAO["contar_operacoes"] == "sim",
+        **opcoes_calibracao(),
+        **opcoes_amostragem(),
+        **limites_execucao(),
+    )
     
-    qtd = IntPrompt.ask("Quantos elementos deseja ver?", default=20)
-    lista_resultado = resultado["resultado"][:qtd]
-    console.print(Panel(str(lista_resultado), title="Resultado"))
+    if r is None:
+        console.print(Panel(f"{nome} falhou: {resultado['erro']}", style="red"))
+        return None
     
-    return {
-        "algoritmo": nome,
-        "tempo": resultado["tempo_execucao"],
-        "cpu": resultado["uso_cpu_percent"],
-        "energia": impacto["energia_Wh"],
-        "co2": impacto["emissao_CO2_g"],
-    }
+    if r["status"] != "ok":
+        console.print(Panel(f"{nome} foi interrompido ({STATUS[r['status']]}). "
+                            "Os valores abaixo sao parciais.", style="yellow"))
+    
+    if mostrar:
+        mostrar_medicao(r, resultado)
+    
+    return r
+
+
+def mostrar_medicao(r, resultado):
+    """
+    Funcao auxiliar de executar_algoritmo
+    Mostra os valores medidos de um algoritmo e, se ele terminou,
+    o inicio da lista ordenada
+    """
+    operacoes = resultado.get("operacoes")
+    resumo_tempo = resumir(r["tempos"])
+    
+    console.print(f"[bold]Tempo:[/bold] {resumo_tempo['mediana']:.6f}s")
+    if resultado["chamadas"] > 1:
+        console.print(f"[dim]Valores por chamada, medidos em lotes de {resultado['chamadas']} chamadas[/dim]")
+    if resumo_tempo["n"] > 1:
+        console.print(f"[dim]Mediana de {resumo_tempo['n']} repeticoes | min {resumo_tempo['minimo']:.6f}s | "
+                      f"IQR {resumo_tempo['iqr']:.6f}s | IC 95% [{resumo_tempo['ic_inferior']:.6f}, "
+                      f"{resumo_tempo['ic_superior']:.6f}]s[/dim]")
+    console.print(f"[bold]CPU:[/bold] {r['cpu']:.2f}%")
+    if r["amostras_cpu"] is not None:
+        frequencia = ""
+        if r["frequencia_media_mhz"] is not None:
+            frequencia = f" | frequencia media {r['frequencia_media_mhz']:.0f} MHz"
+        console.print(f"[dim]{r['amostras_cpu']} amostras de CPU | pico {r['cpu_pico']:.2f}%{frequencia}[/dim]")
+    if resultado["cpu_filhos_segundos"] > 0:
+        console.print(f"[dim]CPU somada de todos os processos: {resultado['cpu_segundos']:.3f}s "
+                      f"({resultado['cpu_filhos_segundos']:.3f}s nos processos filhos)[/dim]")
+    console.print(f"[bold]Energia:[/bold] {r['energia']:.6f} Wh ({r['fonte_energia']})")
+    console.print(f"[bold]CO2:[/bold] {r['co2']:.4f} g")
+    if operacoes is not None and operacoes["comparacoes"] is None:
+        console.print(f"[bold]Operacoes:[/bold] profundidade {operacoes['profundidade_maxima']}")
+        console.print("[dim]Comparacoes e escritas nao contadas: o algoritmo ordena fora do codigo Python "
+                      "visivel para a contagem (NumPy, C ou outros processos)[/dim]")
+    elif operacoes is not None:
+        console.print(f"[bold]Operacoes:[/bold] {operacoes['comparacoes']:,} comparacoes, "
+                      f"{operacoes['escritas']:,} escritas, profundidade {operacoes['profundidade_maxima']}")
+        # 1 Wh = 3.6e12 nJ
+        energia_nJ = r["energia"] * 3.6e12
+        if operacoes["comparacoes"] > 0:
+            console.print(f"[dim]{energia_nJ / operacoes['comparacoes']:.2f} nJ por comparacao[/dim]")
+        if operacoes["escritas"] > 0:
+            console.print(f"[dim]{energia_nJ / operacoes['escritas']:.2f} nJ por escrita[/dim]")
+    if resultado["memoria_pico_bytes"] is not None:
+        console.print(f"[bold]Memoria:[/bold] pico de {formatar_bytes(resultado['memoria_pico_bytes'])} alocados, "
+                      f"{resultado['alocacoes']} blocos a mais, RSS {formatar_bytes(resultado['rss_delta_bytes'])}")
+    
+    if resultado["status"] == "ok":
+        qtd = IntPrompt.ask("Quantos elementos deseja ver?", default=20)
+        lista_resultado = resultado["resultado"][:qtd]
+        console.print(Panel(str(lista_resultado), title="Resultado"))
+    elif resultado["tempo_estimado"] is not None:
+        console.print(f"[bold]Tempo estimado para terminar:[/bold] {resultado['tempo_estimado']:.1f}s")
 
 
-def comparar_todos(lista):
+def comparar_todos(lista, semente=None, distribuicao="manual"):
     """
     Executa todos os algoritmos e compara os resultados
     """
     resultados = []
+    celulas = []
     
-    for nome, funcao in ALGORITMOS:
-        if nome == "Bogosort" and len(lista) > 10:
-            console.print("[yellow]Pulando Bogosort (lista maior que 10).[/yellow]")
-            continue
-        
-        r = executar_algoritmo(nome, funcao, lista)
-        if r:
-            resultados.append(r)
+    for backend in backends_ativos():
+        for nome, funcao in BACKENDS[backend]:
+            if nome.startswith("Bogosort") and len(lista) > 10:
+                console.print(f"[yellow]Pulando {nome} (lista maior que 10).[/yellow]")
+                continue
+            
+            celulas.append({
+                "nome": nome,
+                "funcao": funcao,
+                "lista": lista,
+                "backend": backend,
+                "semente": semente,
+                "distribuicao": distribuicao,
+            })
+    
+    if CONFIGURACAO["pool"] == "sim" and CONFIGURACAO["trabalhadores"] > 1:
+        resultados = comparar_em_paralelo(celulas)
+    else:
+        for celula in celulas:
+            r = executar_algoritmo(celula["nome"], celula["funcao"], lista, celula["backend"], semente, distribuicao)
+            if r:
+                resultados.append(r)
     
     mostrar_tabela(resultados)
+    mostrar_economia(resultados)
     return resultados
 
 
+def comparar_em_paralelo(celulas):
+    """
+    Funcao auxiliar de comparar_todos
+    Mede os algoritmos ao mesmo tempo nos processos do pool, dos mais
+    demorados para os mais rapidos, mostrando cada um que termina
+    
+    Retorna:
+        Lista de resultados, na ordem dos algoritmos
+    """
+    console.print(f"[dim]Medindo {len(celulas)} algoritmos em {CONFIGURACAO['trabalhadores']} processos[/dim]")
+
+    def mostrar_progresso(celula, r, resultado, progresso):
+        contagem = f"[{progresso['concluidas']}/{progresso['total']}] {progresso['decorrido']:.1f}s"
+        if r is None:
+            console.print(f"[red]{contagem} {celula['nome']} falhou: {resultado['erro']}[/red]")
+        elif r["status"] != "ok":
+            console.print(f"[yellow]{contagem} {celula['nome']} foi interrompido ({STATUS[r['status']]})[/yellow]")
+        else:
+            console.print(f"{contagem} {celula['nome']}: {r['tempo']:.6f}s")
+    
+    concluidas = executar_matriz(
+        celulas,
+        pool_de_medicao(),
+        mostrar_progresso,
+        CONFIGURACAO["repeticoes"],
+        CONFIGURACAO["aquecimento"],
+        medir_memoria=CONFIGURACAO["medir_memoria"] == "sim",
+        contar=CONFIGURACAO["contar_operacoes"] == "sim",
+        **opcoes_calibracao(),
+        **opcoes_amostragem(),
+        **limites_execucao(),
+    )
+    
+    return [r for celula, r, resultado in concluidas if r is not None]
+
+
+def formatar_razao(razao, r):
+    """
+    Formata a razao de energia em relacao a ordenacao de referencia
+    (vazio se a referencia nao foi medida)
+    """
+    if razao is None:
+        return ""
+    if r.get("status") == "extrapolado":
+        return f"~{razao:.2f}x"
+    if r.get("status", "ok") != "ok":
+        return f"> {razao:.2f}x"
+    return f"{razao:.2f}x"
+
+
+def avisar_referencias():
+    """Explica a coluna vs. built-in das tabelas"""
+    nomes = " ou ".join(f"{nome} ({backend})" for backend, nome in REFERENCIAS.items())
+    console.print(f"[dim]vs. built-in: energia dividida pela de {nomes}, medida na mesma lista.[/dim]")
+
+
 def mostrar_tabela(resultados):
     """
     Mostra uma tabela com os resultados
+    A coluna vs. built-in compara a energia de cada algoritmo com a da
+    ordenacao pronta do backend (list.sort ou numpy.sort) na mesma lista
     """
     tabela = Table(title="Comparacao", box=box.SIMPLE)
     tabela.add_column("Algoritmo")
     tabela.add_column("Tempo")
+    tabela.add_column("IQR")
     tabela.add_column("CPU")
     tabela.add_column("Energia")
     tabela.add_column("CO2")
+    tabela.add_column("Memoria")
+    tabela.add_column("vs. built-in", justify="right")
     
+    interrompidos = 0
+    medidas = 0
     for r in resultados:
+        tempo = f"{r['tempo']:.6f}"
+        if r.get("status") == "extrapolado":
+            tempo = f"~{tempo} (extrapolado)"
+        elif r.get("status", "ok") != "ok":
+            interrompidos = interrompidos + 1
+            tempo = f"> {tempo} ({STATUS[r['status']]})"
+            if r.get("tempo_estimado") is not None:
+                tempo = tempo + f" ~{r['tempo_estimado']:.1f}s"
+        
+        iqr = ""
+        if r.get("repeticoes", 1) > 1:
+            iqr = f"{r['tempo_iqr']:.6f}"
+        
+        energia = f"{r['energia']:.6f}"
+        if r.get("fonte_energia") == "medida":
+            medidas = medidas + 1
+            energia = energia + "*"
+        
         tabela.add_row(
             r["algoritmo"],
-            f"{r['tempo']:.6f}",
+            tempo,
+            iqr,
             f"{r['cpu']:.2f}",
-            f"{r['energia']:.6f}",
+            energia,
             f"{r['co2']:.4f}",
+            formatar_bytes(r.get("memoria_pico_bytes")),
+            formatar_razao(razao_referencia(r, resultados), r),
         )
     
     console.print(tabela)
+    if any(razao_referencia(r, resultados) is not None for r in resultados):
+        avisar_referencias()
+    if any(r.get("memoria_pico_bytes") is not None for r in resultados):
+        console.print("[dim]Memoria: pico alocado pelo Python (tracemalloc), medido em uma execucao separada.[/dim]")
+    if medidas > 0:
+        console.print("[dim]* energia medida pelos contadores RAPL do processador; as demais sao do modelo "
+                      "(potencia x tempo x CPU).[/dim]")
+    if interrompidos > 0:
+        console.print("[dim]Algoritmos interrompidos mostram valores parciais e, com ~, o tempo estimado.[/dim]")
 
 
-def calcular_estatisticas(resultados):
+def executar_varredura(semente=None, distribuicao="aleatoria"):
     """
-    Calcula e mostra estatisticas dos resultados
+    Mede cada algoritmo nos TAMANHOS_VARREDURA, ajusta os modelos de
+    complexidade (n, n log n, n²) e extrapola tempo, energia e CO2 para
+    os tamanhos que nao foram executados
+    O Bogosort fica de fora. Cada algoritmo para de crescer quando o
+    proximo tamanho passaria de TEMPO_MAXIMO_VARREDURA (previsto pelos
+    dois ultimos) ou quando e interrompido pelos limites
+    
+    Retorna:
+        Tupla (resultados, ajustes): os resultados medidos e os
+        extrapolados (com status "extrapolado") e o ajuste do tempo
+        de cada algoritmo
     """
-    if not resultados:
-        console.print("[red]Nenhum dado.[/red]")
+    if semente is None:
+        semente = gerar_semente()
+    if distribuicao == "manual":
+        distribuicao = "aleatoria"
+    
+    console.print(f"[cyan]Varredura de {TAMANHOS_VARREDURA[0]:,} a {TAMANHOS_VARREDURA[-1]:,} elementos "
+                  f"({distribuicao}, semente {semente})...[/cyan]")
+    
+    resultados = []
+    ajustes = {}
+    
+    for backend in backends_ativos():
+        for nome, funcao in BACKENDS[backend]:
+            if nome.startswith("Bogosort"):
+                continue
+            
+            medidos = varrer_algoritmo(nome, funcao, backend, semente, distribuicao)
+            resultados = resultados + medidos
+            
+            validos = [r for r in medidos if r["status"] == "ok"]
+            if len(validos) < 2:
+                console.print(f"[yellow]{nome}: medidas insuficientes para ajustar os modelos.[/yellow]")
+                continue
+            
+            ajuste, extrapolados = extrapolar_algoritmo(validos)
+            if ajuste is None:
+                console.print(f"[yellow]{nome}: tempos insuficientes para ajustar os modelos.[/yellow]")
+                continue
+            ajustes[nome] = ajuste
+            resultados = resultados + extrapolados
+    
+    mostrar_varredura(resultados, ajustes)
+    return resultados, ajustes
+
+
+def varrer_algoritmo(nome, funcao, backend, semente, distribuicao):
+    """
+    Funcao auxiliar de executar_varredura
+    Mede um algoritmo nos tamanhos da varredura, do menor para o maior
+    """
+    medidos = []
+    
+    for tamanho in TAMANHOS_VARREDURA:
+        # Com tamanhos em progressao geometrica, t(proximo) ~ t(ultimo)² / t(penultimo)
+        if len(medidos) >= 2:
+            previsto = medidos[-1]["tempo"] ** 2 / max(medidos[-2]["tempo"], 1e-9)
+            if previsto > TEMPO_MAXIMO_VARREDURA:
+                break
+        
+        console.print(f"[dim]{nome}: {tamanho:,} elementos[/dim]")
+        lista = gerar_lista(tamanho, distribuicao, semente)
+        r = executar_algoritmo(nome, funcao, lista, backend, semente, distribuicao, mostrar=False)
+        if r is None:
+            break
+        
+        medidos.append(r)
+        if r["status"] != "ok":
+            break
+    
+    return medidos
+
+
+def extrapolar_algoritmo(medidos):
+    """
+    Funcao auxiliar de executar_varredura
+    Ajusta os modelos ao tempo, a energia e ao CO2 medidos de um
+    algoritmo e cria os resultados dos tamanhos que faltaram
+    A energia e o CO2 so sao ajustados com dois ou mais valores maiores
+    que zero (sem RAPL, execucoes curtas podem ter CPU e energia zero);
+    sem ajuste, ficam None nos resultados extrapolados
+    
+    Retorna:
+        Tupla (ajuste do tempo, lista de resultados extrapolados), ou
+        (None, []) se o tempo nao puder ser ajustado
+    """
+    tamanhos = [r["tamanho"] for r in medidos]
+    ajuste_tempo = ajustar_complexidade(tamanhos, [r["tempo"] for r in medidos])
+    ajuste_energia = ajustar_complexidade(tamanhos, [r["energia"] for r in medidos])
+    ajuste_co2 = ajustar_complexidade(tamanhos, [r["co2"] for r in medidos])
+    if ajuste_tempo is None:
+        return None, []
+    
+    for r in medidos:
+        r["modelo"] = ajuste_tempo["modelo"]
+        r["expoente"] = ajuste_tempo["expoente"]
+    
+    base = medidos[-1]
+    faltantes = [n for n in TAMANHOS_VARREDURA + TAMANHOS_EXTRAPOLACAO if n > base["tamanho"]]
+    
+    extrapolados = []
+    for tamanho in faltantes:
+        tempo = extrapolar(ajuste_tempo, tamanho)
+        extrapolados.append({
+            "algoritmo": base["algoritmo"],
+            "tempo": tempo,
+            "cpu": resumir([r["cpu"] for r in medidos])["mediana"],
+            "energia": extrapolar(ajuste_energia, tamanho) if ajuste_energia is not None else None,
+            "co2": extrapolar(ajuste_co2, tamanho) if ajuste_co2 is not None else None,
+            "repeticoes": 0,
+            "fonte_energia": base["fonte_energia"],
+            "backend": base["backend"],
+            "tamanho": tamanho,
+            "distribuicao": base["distribuicao"],
+            "semente": base["semente"],
+            "status": "extrapolado",
+            "tempo_estimado": tempo,
+            "modelo": ajuste_tempo["modelo"],
+            "expoente": ajuste_tempo["expoente"],
+        })
+    
+    return ajuste_tempo, extrapolados
+
+
+def mostrar_varredura(resultados, ajustes):
+    """
+    Mostra o ajuste de cada algoritmo e os valores medidos e
+    extrapolados de cada tamanho
+    """
+    tabela = Table(title="Complexidade Empirica", box=box.SIMPLE)
+    tabela.add_column("Algoritmo")
+    tabela.add_column("Expoente k")
+    tabela.add_column("R2 (c·n^k)")
+    tabela.add_column("Melhor modelo")
+    for modelo in ["n", "n log n", "n²"]:
+        tabela.add_column(f"R2 {modelo}")
+    
+    for nome, ajuste in ajustes.items():
+        linha = [nome, f"{ajuste['expoente']:.2f}", f"{ajuste['r2']:.4f}", ajuste["modelo"]]
+        for modelo in ["n", "n log n", "n²"]:
+            linha.append(f"{ajuste['modelos'][modelo]['r2']:.4f}")
+        tabela.add_row(*linha)
+    
+    console.print(tabela)
+    
+    tabela = Table(title="Varredura de Tamanhos", box=box.SIMPLE)
+    tabela.add_column("Algoritmo")
+    tabela.add_column("Tamanho", justify="right")
+    tabela.add_column("Tempo (s)", justify="right")
+    tabela.add_column("Energia (Wh)", justify="right")
+    tabela.add_column("CO2 (g)", justify="right")
+    tabela.add_column("vs. built-in", justify="right")
+    tabela.add_column("Origem")
+    
+    for i, r in enumerate(resultados):
+        ultimo = i + 1 == len(resultados) or resultados[i + 1]["algoritmo"] != r["algoritmo"]
+        razao = formatar_razao(razao_referencia(r, resultados), r)
+        
+        # Os valores vao de microssegundos a dias: 4 algarismos significativos
+        if r["status"] == "extrapolado":
+            energia = f"~{r['energia']:.4g}" if r["energia"] is not None else "nao ajustado"
+            co2 = f"~{r['co2']:.4g}" if r["co2"] is not None else "nao ajustado"
+            tabela.add_row(r["algoritmo"], f"{r['tamanho']:,}", f"~{r['tempo']:.4g}", energia, co2,
+                           razao, "extrapolado", style="italic yellow", end_section=ultimo)
+        else:
+            tempo = f"{r['tempo']:.4g}"
+            if r["status"] != "ok":
+                tempo = f"> {tempo} ({STATUS[r['status']]})"
+            tabela.add_row(r["algoritmo"], f"{r['tamanho']:,}", tempo, f"{r['energia']:.4g}",
+                           f"{r['co2']:.4g}", razao, "medido", end_section=ultimo)
+    
+    console.print(tabela)
+    console.print("[dim]Linhas com ~ foram extrapoladas pelo melhor modelo (maior R2), nao executadas. "
+                  "k e o expoente de tempo = c·n^k ajustado em escala log-log.[/dim]")
+    if any(r["status"] == "extrapolado" and r["energia"] is None for r in resultados):
+        console.print("[dim]nao ajustado: menos de duas medidas de energia maiores que zero.[/dim]")
+    if any(razao_referencia(r, resultados) is not None for r in resultados):
+        avisar_referencias()
+
+
+def executar_ordenacao_externa(semente=None):
+    """
+    Gera um arquivo binario de numeros, ordena com o Merge Sort externo
+    e mostra os resultados, incluindo o I/O
+    """
+    tamanho = IntPrompt.ask("Quantidade de numeros no arquivo", default=1000000)
+    memoria_mb = IntPrompt.ask("Limite de memoria (MB)", default=64)
+    
+    if semente is None:
+        semente = gerar_semente()
+    
+    with tempfile.TemporaryDirectory() as pasta:
+        entrada = os.path.join(pasta, "entrada.bin")
+        saida = os.path.join(pasta, "saida.bin")
+        
+        console.print(f"[cyan]Gerando arquivo com {tamanho:,} numeros (semente {semente})...[/cyan]")
+        gerar_arquivo(entrada, tamanho, "aleatoria", semente)
+        
+        resultado = medir_desempenho(ordenar_arquivo, entrada, saida, memoria_mb * 1024 * 1024)
+        ordenado = verificar_arquivo_ordenado(saida)
+    
+    if not ordenado:
+        console.print(Panel("O arquivo de saida nao ficou ordenado.", style="red"))
         return None
     
-    stats = {}
+    impacto = calcular_impacto(resultado["tempo_execucao"], resultado["uso_cpu_percent"],
+                               energia_medida_Wh=resultado["energia_medida_Wh"])
+    dados = resultado["resultado"]
+    
+    console.print(f"[bold]Tempo:[/bold] {resultado['tempo_execucao']:.6f}s")
+    console.print(f"[bold]CPU:[/bold] {resultado['uso_cpu_percent']:.2f}%")
+    console.print(f"[bold]Energia:[/bold] {impacto['energia_Wh']:.6f} Wh ({impacto['fonte_energia']})")
+    console.print(f"[bold]CO2:[/bold] {impacto['emissao_CO2_g']:.4f} g")
+    console.print(f"[bold]Trechos ordenados:[/bold] {dados['trechos']}")
+    console.print(f"[bold]I/O:[/bold] {dados['bytes_lidos'] / 1024 / 1024:.1f} MB lidos, "
+                  f"{dados['bytes_escritos'] / 1024 / 1024:.1f} MB escritos em {dados['tempo_io']:.6f}s")
+    if resultado["io_bytes_escritos"] is not None:
+        console.print(f"[dim]Disco segundo o sistema: {resultado['io_bytes_lidos'] / 1024 / 1024:.1f} MB lidos, "
+                      f"{resultado['io_bytes_escritos'] / 1024 / 1024:.1f} MB escritos[/dim]")
     
+    return {
+        "algoritmo": "Merge Sort (externo)",
+        "tempo": resultado["tempo_execucao"],
+        "cpu": resultado["uso_cpu_percent"],
+        "energia": impacto["energia_Wh"],
+        "co2": impacto["emissao_CO2_g"],
+        "fonte_energia": impacto["fonte_energia"],
+        "backend": "arquivo",
+        "tamanho": tamanho,
+        "distribuicao": "aleatoria",
+        "semente": semente,
+        "status": resultado["status"],
+        "tempo_estimado": resultado["tempo_estimado"],
+        "tempo_io": dados["tempo_io"],
+        "bytes_lidos": dados["bytes_lidos"],
+        "bytes_escritos": dados["bytes_escritos"],
+    }
+
+
+def mostrar_economia(resultados):
+    """
+    Mostra quanto tempo e energia cada variante economiza em relacao
+    ao algoritmo original
+    """
+    por_nome = {}
     for r in resultados:
-        if r["algoritmo"] not in stats:
-            stats[r["algoritmo"]] = {
-                "tempo": [],
-                "energia": [],
-                "co2": []
-            }
-        
-        stats[r["algoritmo"]]["tempo"].append(r["tempo"])
-        stats[r["algoritmo"]]["energia"].append(r["energia"])
-        stats[r["algoritmo"]]["co2"].append(r["co2"])
-    
-    tabela = Table(title="Estatisticas (Medias)", box=box.MINIMAL)
+        # Execucoes interrompidas nao tem tempo total para comparar
+        if r.get("status", "ok") == "ok":
+            por_nome[r["algoritmo"]] = r
+    
+    tabela = Table(title="Economia das variantes", box=box.SIMPLE)
+    tabela.add_column("Variante")
+    tabela.add_column("Original")
+    tabela.add_column("Tempo economizado")
+    tabela.add_column("Energia economizada")
+    
+    linhas = 0
+    for variante, original in VARIANTES.items():
+        if variante not in por_nome or original not in por_nome:
+            continue
+        
+        r_variante = por_nome[variante]
+        r_original = por_nome[original]
+        
+        tempo_economizado = r_original["tempo"] - r_variante["tempo"]
+        energia_economizada = r_original["energia"] - r_variante["energia"]
+        
+        percentual_tempo = 0.0
+        if r_original["tempo"] > 0:
+            percentual_tempo = tempo_economizado / r_original["tempo"] * 100
+        
+        percentual_energia = 0.0
+        if r_original["energia"] > 0:
+            percentual_energia = energia_economizada / r_original["energia"] * 100
+        
+        tabela.add_row(
+            variante,
+            original,
+            f"{tempo_economizado:.6f}s ({percentual_tempo:.1f}%)",
+            f"{energia_economizada:.6f} Wh ({percentual_energia:.1f}%)",
+        )
+        linhas = linhas + 1
+    
+    if linhas > 0:
+        console.print(tabela)
+
+
+def escolher_outro_algoritmo():
+    """
+    Mostra os algoritmos alem dos cinco do menu principal e retorna
+    o escolhido como (nome, funcao, backend), ou None se nao houver
+    """
+    extras = []
+    for backend in backends_ativos():
+        for nome, funcao in BACKENDS[backend][5:]:
+            extras.append((nome, funcao, backend))
+    
+    if not extras:
+        console.print("[yellow]Nenhum algoritmo extra para o backend escolhido.[/yellow]")
+        return None
+    
+    tabela = Table(title="Outros algoritmos", box=box.ROUNDED)
+    tabela.add_column("Opcao")
+    tabela.add_column("Algoritmo")
+    
+    for i in range(len(extras)):
+        tabela.add_row(str(i + 1), extras[i][0])
+    
+    console.print(tabela)
+    escolha = Prompt.ask("Algoritmo", choices=[str(i + 1) for i in range(len(extras))])
+    return extras[int(escolha) - 1]
+
+
+def menu_configuracoes():
+    """
+    Menu para alterar as configuracoes de execucao
+    """
+    console.print("\n[bold cyan]CONFIGURACOES[/bold cyan]")
+    console.print("[dim]python: listas Python | numpy: vetores int64 | ambos: executa os dois[/dim]\n")
+    
+    CONFIGURACAO["backend"] = Prompt.ask(
+        "Backend",
+        choices=["python", "numpy", "ambos"],
+        default=CONFIGURACAO["backend"],
+    )
+    
+    console.print("[dim]Algoritmos que passarem dos limites sao interrompidos (0 = sem limite)[/dim]")
+    CONFIGURACAO["limite_tempo"] = IntPrompt.ask(
+        "Limite de tempo por execucao (s)",
+        default=CONFIGURACAO["limite_tempo"],
+    )
+    CONFIGURACAO["limite_memoria_mb"] = IntPrompt.ask(
+        "Limite de memoria adicional por execucao (MB)",
+        default=CONFIGURACAO["limite_memoria_mb"],
+    )
+    
+    console.print("[dim]Cada algoritmo roda as execucoes de aquecimento (descartadas) e depois as repeticoes[/dim]")
+    CONFIGURACAO["aquecimento"] = max(0, IntPrompt.ask(
+        "Execucoes de aquecimento",
+        default=CONFIGURACAO["aquecimento"],
+    ))
+    CONFIGURACAO["repeticoes"] = max(1, IntPrompt.ask(
+        "Repeticoes medidas",
+        default=CONFIGURACAO["repeticoes"],
+    ))
+    
+    console.print("[dim]Medicoes mais curtas que isso repetem o algoritmo em lotes e dividem pelo numero de chamadas "
+                  "(0 = uma chamada por medicao)[/dim]")
+    CONFIGURACAO["duracao_minima_ms"] = max(0, IntPrompt.ask(
+        "Duracao minima de cada medicao (ms)",
+        default=CONFIGURACAO["duracao_minima_ms"],
+    ))
+    
+    console.print("[dim]A CPU e amostrada durante a execucao e a energia soma cada intervalo (0 = sem amostragem)[/dim]")
+    CONFIGURACAO["intervalo_amostragem_ms"] = max(0, IntPrompt.ask(
+        "Intervalo entre amostras de CPU (ms)",
+        default=CONFIGURACAO["intervalo_amostragem_ms"],
+    ))
+    CONFIGURACAO["alta_resolucao"] = Prompt.ask(
+        "CPU em alta resolucao (process_time)",
+        choices=["sim", "nao"],
+        default=CONFIGURACAO["alta_resolucao"],
+    )
+    
+    console.print("[dim]A memoria e medida em uma execucao extra, com tracemalloc[/dim]")
+    CONFIGURACAO["medir_memoria"] = Prompt.ask(
+        "Medir memoria",
+        choices=["sim", "nao"],
+        default=CONFIGURACAO["medir_memoria"],
+    )
+    
+    console.print("[dim]As comparacoes, escritas e a profundidade sao contadas em uma execucao extra, "
+                  "com sys.monitoring[/dim]")
+    CONFIGURACAO["contar_operacoes"] = Prompt.ask(
+        "Contar operacoes",
+        choices=["sim", "nao"],
+        default=CONFIGURACAO["contar_operacoes"],
+    )
+    
+    console.print("[dim]O pool mantem um processo de medicao fixo em um nucleo, com as listas ja carregadas[/dim]")
+    CONFIGURACAO["pool"] = Prompt.ask(
+        "Usar pool de medicao",
+        choices=["sim", "nao"],
+        default=CONFIGURACAO["pool"],
+    )
+    if CONFIGURACAO["pool"] == "nao":
+        encerrar_pool()
+        return
+    
+    console.print("[dim]Com mais de um processo, a opcao 7 mede varios algoritmos ao mesmo tempo "
+                  "(a energia medida pelo hardware passa a incluir a dos outros)[/dim]")
+    trabalhadores = max(1, IntPrompt.ask(
+        "Processos de medicao em paralelo",
+        default=CONFIGURACAO["trabalhadores"],
+    ))
+    console.print("[dim]Nucleos reservados ficam fora do pool, para o sistema e o programa principal[/dim]")
+    nucleos_reservados = max(0, IntPrompt.ask(
+        "Nucleos reservados",
+        default=CONFIGURACAO["nucleos_reservados"],
+    ))
+    
+    # O pool e recriado na proxima medicao com os novos valores
+    if trabalhadores != CONFIGURACAO["trabalhadores"] or nucleos_reservados != CONFIGURACAO["nucleos_reservados"]:
+        encerrar_pool()
+    CONFIGURACAO["trabalhadores"] = trabalhadores
+    CONFIGURACAO["nucleos_reservados"] = nucleos_reservados
+
+
+def calcular_estatisticas(agregador):
+    """
+    Mostra as estatisticas do agregador, por algoritmo, tamanho e backend
+    """
+    if not agregador:
+        console.print("[red]Nenhum dado.[/red]")
+        return None
+    
+    tabela = Table(title="Estatisticas", box=box.MINIMAL)
     tabela.add_column("Algoritmo")
+    tabela.add_column("Tamanho", justify="right")
+    tabela.add_column("N", justify="right")
     tabela.add_column("Tempo")
-    tabela.add_column("Energia")
-    tabela.add_column("CO2")
+    tabela.add_column("Desvio")
+    tabela.add_column("p50")
+    tabela.add_column("p90")
+    tabela.add_column("p99")
+    tabela.add_column("Energia p50")
     
-    for algoritmo, valores in stats.items():
-        tempo_medio = sum(valores['tempo']) / len(valores['tempo'])
-        energia_media = sum(valores['energia']) / len(valores['energia'])
-        co2_medio = sum(valores['co2']) / len(valores['co2'])
+    for (algoritmo, tamanho, backend), acumuladores in agregador.items():
+        tempo = resumir_acumulador(acumuladores["tempo"])
+        energia = resumir_acumulador(acumuladores["energia"])
         
         tabela.add_row(
-            algoritmo,
-            f"{tempo_medio:.6f}",
-            f"{energia_media:.6f}",
-            f"{co2_medio:.4f}",
+            algoritmo if backend == "python" else f"{algoritmo} [{backend}]",
+            "-" if tamanho is None else f"{tamanho:,}",
+            str(tempo["n"]),
+            f"{tempo['media']:.6f}",
+            f"{tempo['desvio']:.6f}",
+            f"{tempo['p50']:.6f}",
+            f"{tempo['p90']:.6f}",
+            f"{tempo['p99']:.6f}",
+            f"{energia['p50']:.6f}",
         )
     
     console.print(tabela)
-    return stats
+    console.print("[dim]Todas as repeticoes, agregadas a medida que sao medidas. Tempo: media. "
+                  "Percentis com erro de ate 1%. Minimo, maximo e o resumo da energia e do CO2 "
+                  "vao na exportacao para CSV.[/dim]")
+    return agregador
 
 
-def menu_exportar_csv(resultados_totais, stats):
+def menu_exportar(agregador):
     """
-    Menu para exportar dados em formato CSV
+    Menu para exportar os resultados da sessao (CSV, JSON Lines ou
+    colunar) e as estatisticas (CSV)
     """
-    if not resultados_totais:
+    banco = banco_de_resultados()
+    if contar_resultados(banco["conexao"], banco["execucoes"]) == 0:
         console.print("[red]Nenhum resultado para exportar. Execute alguns algoritmos primeiro.[/red]")
         return
     
-    console.print("\n[bold cyan]EXPORTAR DADOS PARA CSV[/bold cyan]")
+    console.print("\n[bold cyan]EXPORTAR DADOS[/bold cyan]")
     console.print("[dim]Escolha o tipo de exportacao:[/dim]\n")
     
     tabela = Table(box=box.ROUNDED)
     tabela.add_column("Opcao", style="bold")
     tabela.add_column("Descricao")
     tabela.add_row("1", "Exportar todos os resultados")
-    tabela.add_row("2", "Exportar estatisticas (medias)")
+    tabela.add_row("2", "Exportar estatisticas (distribuicoes)")
     tabela.add_row("0", "Voltar")
     console.print(tabela)
     
@@ -199,24 +968,108 @@ def menu_exportar_csv(resultados_totais, stats):
         return
     
     if opcao == "1":
-        arquivo = exportar_resultados(resultados_totais)
-        if arquivo:
-            console.print(f"[green]Resultados exportados para: {arquivo}[/green]")
+        arquivo = Prompt.ask("Arquivo (vazio para um novo; um existente recebe os resultados no fim)",
+                             default="").strip()
+        
+        # Um arquivo existente continua no formato dele (pela extensao)
+        acrescentar = bool(arquivo)
+        if acrescentar:
+            formato = escolher_formato(arquivo)
+        else:
+            formato = Prompt.ask("Formato (colunar: Parquet com o pyarrow instalado, senao npz)",
+                                 choices=["csv", "csv.gz", "jsonl", "jsonl.gz", "colunar"], default="csv")
+            formato = escolher_formato("", formato)
+            data_hora = datetime.now().strftime("%Y%m%d_%H%M%S")
+            arquivo = f"resultados_{data_hora}{EXTENSOES[formato]}"
+        
+        # Os resultados saem do banco um a um, direto para o arquivo
+        colunas = colunas_gravadas(banco["conexao"], banco["execucoes"])
+        try:
+            linhas, arquivo = exportar(iterar_resultados(banco["conexao"], banco["execucoes"]), arquivo, formato,
+                              colunas, acrescentar)
+        except (ValueError, OSError) as erro:
+            console.print(f"[red]Nao foi possivel exportar: {erro}[/red]")
+            return
+        console.print(f"[green]{linhas} resultados exportados para: {arquivo}[/green]")
     
     elif opcao == "2":
-        if stats:
-            arquivo = exportar_estatisticas(stats)
-            if arquivo:
-                console.print(f"[green]Estatisticas exportadas para: {arquivo}[/green]")
+        arquivo = exportar_estatisticas(agregador)
+        if arquivo:
+            console.print(f"[green]Estatisticas exportadas para: {arquivo}[/green]")
         else:
-            console.print("[yellow]Execute a opcao 8 (Estatisticas) antes de exportar.[/yellow]")
+            console.print("[yellow]Nenhuma medicao completa para resumir.[/yellow]")
+
+
+def medir_linha_de_base(resultado):
+    """
+    Mede a versao em C do algoritmo de um resultado nesta maquina,
+    na mesma lista (recriada pela semente) e com as mesmas configuracoes
+    de medicao, para comparar com o Python no mesmo hardware
+    
+    Retorna:
+        Resultado da versao em C, ou None se nao houver versao em C, a
+        lista tiver sido digitada (sem semente) ou nao houver compilador
+    """
+    nativa = versao_nativa(resultado["algoritmo"])
+    if nativa is None or resultado.get("semente") is None or not nativo_disponivel():
+        return None
+    
+    nome, funcao = nativa
+    lista = gerar_lista(resultado["tamanho"], resultado["distribuicao"], resultado["semente"])
+    console.print(f"[dim]Medindo {nome} com {resultado['tamanho']:,} elementos...[/dim]")
+    nativo = executar_algoritmo(nome, funcao, lista, "c", resultado["semente"], resultado["distribuicao"],
+                                mostrar=False)
+    if nativo is not None:
+        guardar_resultados([nativo])
+    return nativo
+
+
+def obter_referencia(resultado):
+    """
+    Retorna a ordenacao de referencia (list.sort ou numpy.sort) medida
+    na mesma lista de um resultado, procurando no banco. Se ela ainda
+    nao foi medida, mede agora, na lista recriada pela semente
+    
+    Retorna:
+        Resultado da referencia, ou None se a lista foi digitada
+    """
+    backend = resultado.get("backend", "python")
+    if backend not in REFERENCIAS:
+        return None
+    
+    candidatas = resultados_da_sessao(REFERENCIAS[backend], resultado["tamanho"], backend=backend)
+    referencia = procurar_referencia(resultado, candidatas)
+    if referencia is not None or resultado.get("semente") is None:
+        return referencia
+    
+    nome, funcao = procurar_algoritmo(REFERENCIAS[backend], backend)
+    lista = gerar_lista(resultado["tamanho"], resultado["distribuicao"], resultado["semente"])
+    console.print(f"[dim]Medindo {nome} com {resultado['tamanho']:,} elementos...[/dim]")
+    referencia = executar_algoritmo(nome, funcao, lista, backend, resultado["semente"], resultado["distribuicao"],
+                                    mostrar=False)
+    if referencia is not None:
+        guardar_resultados([referencia])
+    return referencia
 
 
-def menu_comparacao_linguagens(resultados_totais):
+def avisar_sem_linha_de_base(resultado):
+    """
+    Explica por que a comparacao usa a tabela de benchmarks de C
+    """
+    if NATIVO.get("erro"):
+        console.print(f"[dim]Sem C local ({NATIVO['erro']}): usando a tabela de benchmarks de C[/dim]")
+    elif resultado.get("semente") is None:
+        console.print("[dim]Lista digitada nao pode ser recriada: usando a tabela de benchmarks de C[/dim]")
+
+
+def menu_comparacao_linguagens():
     """
     Menu para comparacao com outras linguagens
+    Os resultados em Python vem do banco, e as medicoes feitas aqui
+    (C local e ordenacao de referencia) sao gravadas nele
     """
-    if not resultados_totais:
+    banco = banco_de_resultados()
+    if contar_resultados(banco["conexao"], banco["execucoes"]) == 0:
         console.print("[red]Execute algum algoritmo primeiro (opcoes 1-4 ou 7).[/red]")
         return
     
@@ -239,16 +1092,25 @@ def menu_comparacao_linguagens(resultados_totais):
         nome_alg = algoritmos_nomes[int(algoritmo) - 1]
         
         resultado_python = None
-        for r in resultados_totais:
-            if r["algoritmo"] == nome_alg:
-                resultado_python = r
-                break
+        encontrados = resultados_da_sessao(nome_alg)
+        if encontrados:
+            resultado_python = encontrados[0]
+        
+        variantes = []
+        for r in resultados_da_sessao():
+            if r["algoritmo"] != nome_alg and normalizar_algoritmo(r["algoritmo"]) == normalizar_algoritmo(nome_alg):
+                variantes.append(r)
         
         if not resultado_python:
             console.print(f"[red]Voce ainda nao executou {nome_alg}. Execute primeiro![/red]")
         else:
-            tamanho = IntPrompt.ask("Qual foi o tamanho da lista que voce usou?")
-            mostrar_comparacao(resultado_python, nome_alg, tamanho)
+            # O resultado ja guarda o tamanho da lista usada
+            tamanho = resultado_python["tamanho"]
+            nativo = medir_linha_de_base(resultado_python)
+            if nativo is None:
+                avisar_sem_linha_de_base(resultado_python)
+            referencia = obter_referencia(resultado_python)
+            mostrar_comparacao(resultado_python, nome_alg, tamanho, variantes, nativo, referencia)
     
     elif sub_opcao == "2":
         tamanho = IntPrompt.ask("Qual foi o tamanho da lista que voce usou?")
@@ -256,11 +1118,86 @@ def menu_comparacao_linguagens(resultados_totais):
         algoritmos_nomes = ["Merge Sort", "Quick Sort", "Bubble Sort", "Insertion Sort"]
         nome_alg = algoritmos_nomes[int(algoritmo) - 1]
         
-        grafico_comparativo_linguagens(resultados_totais, nome_alg, tamanho)
+        # O grafico usa o primeiro resultado do algoritmo
+        nativo = None
+        encontrados = resultados_da_sessao(nome_alg)
+        if encontrados:
+            r = encontrados[0]
+            if r["tamanho"] == tamanho:
+                nativo = medir_linha_de_base(r)
+                if nativo is None:
+                    avisar_sem_linha_de_base(r)
+            obter_referencia(r)
+        
+        grafico_comparativo_linguagens(resultados_da_sessao(), nome_alg, tamanho, nativo)
     
     elif sub_opcao == "3":
         tamanho = IntPrompt.ask("Qual foi o tamanho da lista que voce usou?")
-        grafico_comparativo_todos_algoritmos(resultados_totais, tamanho)
+        
+        # O grafico usa o ultimo resultado de cada algoritmo
+        ultimos = {}
+        for nome in ["Merge Sort", "Quick Sort", "Bubble Sort", "Insertion Sort"]:
+            encontrados = resultados_da_sessao(nome)
+            if encontrados:
+                ultimos[normalizar_algoritmo(nome)] = encontrados[-1]
+        
+        nativos = {}
+        for alg, r in ultimos.items():
+            nativo = medir_linha_de_base(r) if r["tamanho"] == tamanho else None
+            if nativo is not None:
+                nativos[alg] = nativo
+            obter_referencia(r)
+        if len(nativos) < len(ultimos):
+            console.print("[dim]Algoritmos sem C local (outro tamanho, lista digitada ou sem compilador) "
+                          "usam a tabela de benchmarks de C[/dim]")
+        
+        grafico_comparativo_todos_algoritmos(resultados_da_sessao(), tamanho, nativos)
+
+
+def menu_historico():
+    """
+    Mostra as execucoes gravadas no banco de resultados e deixa incluir
+    uma execucao anterior nas estatisticas, graficos, exportacao e
+    comparacoes desta sessao
+    """
+    banco = banco_de_resultados()
+    execucoes = listar_execucoes(banco["conexao"])
+    maquina, descricao = descrever_maquina()
+    
+    tabela = Table(title="Execucoes gravadas", box=box.ROUNDED)
+    tabela.add_column("Opcao")
+    tabela.add_column("Inicio")
+    tabela.add_column("Origem")
+    tabela.add_column("Maquina")
+    tabela.add_column("Resultados", justify="right")
+    tabela.add_column("Na sessao")
+    
+    for i, execucao in enumerate(execucoes):
+        nome_maquina = execucao["processador"]
+        if execucao["maquina"] == maquina:
+            nome_maquina = "esta maquina"
+        tabela.add_row(
+            str(i + 1),
+            execucao["iniciada_em"],
+            execucao["origem"],
+            nome_maquina,
+            str(execucao["resultados"]),
+            "sim" if execucao["run_id"] in banco["execucoes"] else "",
+        )
+    
+    console.print(tabela)
+    console.print("[dim]Resultados de outra maquina nao sao comparaveis diretamente com os desta.[/dim]")
+    
+    escolha = Prompt.ask("Incluir qual execucao na sessao? (0 = nenhuma)",
+                         choices=[str(i) for i in range(len(execucoes) + 1)], default="0")
+    if escolha == "0":
+        return
+    
+    run_id = execucoes[int(escolha) - 1]["run_id"]
+    if run_id not in banco["execucoes"]:
+        banco["execucoes"].append(run_id)
+        banco["agregados"][run_id] = ler_agregado(banco["conexao"], run_id)
+    console.print(f"[green]{execucoes[int(escolha) - 1]['resultados']} resultados incluidos na sessao.[/green]")
 
 
 def menu_llm(resultados_totais, listas):
@@ -279,7 +1216,7 @@ def menu_llm(resultados_totais, listas):
     
     console.print(f"\n[cyan]Ultimo algoritmo executado: {resultado_python['algoritmo']}[/cyan]")
     tamanho = Prompt.ask("Qual tamanho de lista foi usado?", choices=[str(x) for x in listas.keys()])
-    lista_usada = listas[int(tamanho)]
+    lista_usada = listas[int(tamanho)].tolist()
     
     modelos = menu_llm_local()
     
@@ -296,59 +1233,99 @@ def menu_llm(resultados_totais, listas):
         comparar_algoritmo_vs_llm(resultado_python, resultado_llm)
 
 
+def pedir_semente():
+    """
+    Pede a semente das listas ate receber um inteiro (vazio sorteia uma)
+    """
+    while True:
+        entrada = Prompt.ask("Semente (vazio para sortear)", default="")
+        if not entrada.strip():
+            return gerar_semente()
+        try:
+            return int(entrada)
+        except ValueError:
+            console.print("[yellow]Semente invalida: digite um numero inteiro ou deixe vazio para sortear.[/yellow]")
+
+
 def main():
     """
     Funcao principal do programa
     """
     listas = None
-    resultados_totais = []
-    stats = None
+    semente = None
+    distribuicao = "manual"
     
     while True:
         mostrar_menu()
         opcao = PromptPT.ask(
             "Opcao",
-            choices=["0", "1", "2", "3", "4", "5", "6", "7", "8", "9", "10", "11", "12"],
+            choices=["0", "1", "2", "3", "4", "5", "6", "7", "8", "9", "10", "11", "12", "13", "14", "15", "16",
+                     "17"],
         )
         
         if opcao == "0":
+            encerrar_pool()
+            fechar_banco()
             console.print("[bold green]Programa encerrado.[/bold green]")
             break
         
         if opcao == "6":
-            listas = gerar_listas()
-            mostrar_info_listas(listas)
+            distribuicao = Prompt.ask("Distribuicao", choices=DISTRIBUICOES, default="aleatoria")
+            semente = pedir_semente()
+            listas = gerar_listas(distribuicao=distribuicao, semente=semente)
+            mostrar_info_listas(listas, semente)
             continue
         
         if opcao == "7":
             if listas:
                 tamanho = Prompt.ask("Tamanho", choices=[str(x) for x in listas.keys()])
-                resultados_totais = resultados_totais + comparar_todos(listas[int(tamanho)])
+                guardar_resultados(comparar_todos(listas[int(tamanho)], semente, distribuicao))
             else:
                 console.print("[red]Gere listas primeiro (opcao 6).[/red]")
             continue
         
         if opcao == "8":
-            stats = calcular_estatisticas(resultados_totais)
+            calcular_estatisticas(estatisticas_da_sessao())
             continue
         
         if opcao == "9":
-            grafico_completo(resultados_totais)
+            grafico_completo(resultados_da_sessao())
             continue
         
         if opcao == "10":
-            menu_comparacao_linguagens(resultados_totais)
+            menu_comparacao_linguagens()
             continue
         
         if opcao == "11":
-            menu_llm(resultados_totais, listas)
+            menu_llm(resultados_da_sessao(), listas)
             continue
         
         if opcao == "12":
-            menu_exportar_csv(resultados_totais, stats)
+            menu_exportar(estatisticas_da_sessao())
+            continue
+        
+        if opcao == "14":
+            menu_configuracoes()
+            continue
+        
+        if opcao == "17":
+            menu_historico()
+            continue
+        
+        if opcao == "15":
+            r = executar_ordenacao_externa(semente)
+            if r:
+                guardar_resultados([r])
             continue
         
-        if opcao in ["1", "2", "3", "4", "5"]:
+        if opcao == "16":
+            varredura, ajustes = executar_varredura(semente, distribuicao)
+            guardar_resultados(varredura)
+            if ajustes and Prompt.ask("Mostrar grafico da varredura?", choices=["sim", "nao"], default="sim") == "sim":
+                grafico_varredura(varredura, ajustes)
+            continue
+        
+        if opcao in ["1", "2", "3", "4", "5", "13"]:
             if listas:
                 tamanho = Prompt.ask("Tamanho", choices=[str(x) for x in listas.keys()])
                 lista = listas[int(tamanho)]
@@ -358,10 +1335,20 @@ def main():
                 for x in entrada.split():
                     lista.append(int(x))
             
-            nome, funcao = ALGORITMOS[int(opcao) - 1]
-            r = executar_algoritmo(nome, funcao, lista)
-            if r:
-                resultados_totais.append(r)
+            if opcao == "13":
+                escolhido = escolher_outro_algoritmo()
+                if escolhido:
+                    nome, funcao, backend = escolhido
+                    r = executar_algoritmo(nome, funcao, lista, backend, semente, distribuicao)
+                    if r:
+                        guardar_resultados([r])
+                continue
+            
+            for backend in backends_ativos():
+                nome, funcao = BACKENDS[backend][int(opcao) - 1]
+                r = executar_algoritmo(nome, funcao, lista, backend, semente, distribuicao)
+                if r:
+                    guardar_resultados([r])
 
 
 if __name__ == "__main__":